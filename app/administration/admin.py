@@ -1,6 +1,7 @@
 from django.conf import settings
 from django.contrib import admin, messages
 from django.shortcuts import redirect
+from django.template.defaultfilters import filesizeformat
 from django.urls import path
 from django.utils.html import format_html
 
@@ -10,22 +11,37 @@ from .models import BackupDestination, BackupLog, SMTPConfiguration
 
 @admin.register(BackupDestination)
 class BackupDestinationAdmin(admin.ModelAdmin):
-    list_display = ("name", "destination_type", "get_display_endpoint", "remote_path", "updated_at")
-    list_filter = ("destination_type", "use_ssl", "verify_ssl")
+    list_display = ("name", "destination_type", "get_display_endpoint", "remote_path", "dump_format", "updated_at")
+    list_filter = ("destination_type", "dump_format", "use_ssl", "verify_ssl")
     search_fields = ("name", "endpoint", "remote_path")
     fieldsets = (
         (None, {"fields": ("name", "destination_type", "endpoint", "port", "remote_path")} ),
         ("Anmeldung", {"fields": ("username", "password")}),
         ("Sicherheit", {"fields": ("use_ssl", "verify_ssl")}),
+        ("Dump", {"fields": ("dump_format", "jobs", "incremental")}),
     )
 
 
 @admin.register(BackupLog)
 class BackupLogAdmin(admin.ModelAdmin):
-    list_display = ("created_at", "action", "status", "destination", "file_name", "short_message")
+    list_display = ("created_at", "action", "status", "destination", "file_name", "snapshot_summary", "transfer_summary", "short_message")
     list_filter = ("action", "status", "destination")
     search_fields = ("message", "file_name", "destination__name")
-    readonly_fields = ("created_at", "destination", "action", "status", "message", "file_name")
+    readonly_fields = (
+        "created_at",
+        "destination",
+        "action",
+        "status",
+        "message",
+        "file_name",
+        "bytes_total",
+        "bytes_transferred",
+        "bytes_uploaded",
+        "duration",
+        "snapshot_chunks",
+        "snapshot_size",
+        "manifest",
+    )
 
     def has_add_permission(self, request):  # pragma: no cover
         return False
@@ -33,6 +49,22 @@ class BackupLogAdmin(admin.ModelAdmin):
     def has_change_permission(self, request, obj=None):  # pragma: no cover
         return False
 
+    def snapshot_summary(self, obj):
+        if obj.snapshot_chunks is None:
+            return "-"
+        return f"{obj.snapshot_chunks} Blöcke, {filesizeformat(obj.snapshot_size)}"
+    snapshot_summary.short_description = "Snapshot"
+
+    def transfer_summary(self, obj):
+        if not obj.bytes_total:
+            return "-"
+        summary = f"{filesizeformat(obj.bytes_transferred)} / {filesizeformat(obj.bytes_total)}"
+        summary += f", {filesizeformat(obj.bytes_uploaded)} gesendet"
+        if obj.throughput:
+            summary += f" ({filesizeformat(obj.throughput)}/s)"
+        return summary
+    transfer_summary.short_description = "Übertragung"
+
     def short_message(self, obj):
         return format_html("{}", obj.message[:80] + ("…" if len(obj.message) > 80 else ""))
 
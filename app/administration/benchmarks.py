@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+import random
+import statistics
+import subprocess
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from aviary.models import Aviary
+from bird.models import Bird, BirdStatus, Circumstance, FallenBird
+from core.instrumentation import RequestMetrics
+from costs.models import CHOICE_CATEGORY, Costs
+from notizen.models import Notiz
+from notizen.rendering import render_markdown
+from reports.services import ReportGenerator
+from stations.models import WildbirdHelpStation
+from statistic.services import StatisticsBuilder
+
+BENCHMARK_PREFIX = "BENCH-"
+BENCHMARK_USERNAME = "benchmark"
+STATION_PREFIX = "Benchmark-Station"
+
+STATUSES = {
+    1: "In Behandlung",
+    2: "In Auswilderung",
+    3: "Ausgewildert",
+    4: "Übermittelt",
+    5: "Verstorben",
+}
+CLOSED_STATUS_WEIGHTS = {3: 45, 4: 15, 5: 40}
+SPECIES = [
+    ("Amsel", "Turdus merula"), ("Blaumeise", "Cyanistes caeruleus"), ("Kohlmeise", "Parus major"),
+    ("Haussperling", "Passer domesticus"), ("Mauersegler", "Apus apus"), ("Ringeltaube", "Columba palumbus"),
+    ("Stadttaube", "Columba livia forma domestica"), ("Rotkehlchen", "Erithacus rubecula"),
+    ("Buchfink", "Fringilla coelebs"), ("Grünfink", "Chloris chloris"), ("Star", "Sturnus vulgaris"),
+    ("Elster", "Pica pica"), ("Rabenkrähe", "Corvus corone"), ("Mäusebussard", "Buteo buteo"),
+    ("Turmfalke", "Falco tinnunculus"), ("Waldkauz", "Strix aluco"), ("Stockente", "Anas platyrhynchos"),
+    ("Mehlschwalbe", "Delichon urbicum"), ("Rauchschwalbe", "Hirundo rustica"), ("Buntspecht", "Dendrocopos major"),
+]
+CIRCUMSTANCES = ["Fensteranflug", "Katze", "Verkehr", "Aus dem Nest gefallen", "Entkräftet", "Unbekannt"]
+PLACES = ["Jena", "Weimar", "Erfurt", "Apolda", "Rudolstadt", "Gera", "Saalfeld", "Stadtroda", "Kahla", "Bad Berka"]
+CITIES = [
+    ("Berlin", "Berlin", 52.52, 13.40), ("Hamburg", "Hamburg", 53.55, 9.99), ("München", "Bayern", 48.14, 11.58),
+    ("Köln", "Nordrhein-Westfalen", 50.94, 6.96), ("Leipzig", "Sachsen", 51.34, 12.37),
+    ("Jena", "Thüringen", 50.93, 11.59), ("Hannover", "Niedersachsen", 52.37, 9.73),
+    ("Stuttgart", "Baden-Württemberg", 48.78, 9.18), ("Rostock", "Mecklenburg-Vorpommern", 54.09, 12.14),
+    ("Kassel", "Hessen", 51.31, 9.49),
+]
+# Most birds are found between spring and late summer.
+MONTH_WEIGHTS = [2, 2, 4, 8, 14, 16, 15, 12, 8, 5, 3, 2]
+
+
+@dataclass(slots=True)
+class SeedResult:
+    patients: int = 0
+    costs: int = 0
+    notes: int = 0
+    stations: int = 0
+    duration: float = 0.0
+
+    def as_message(self) -> str:
+        return (
+            f"{self.patients} Patienten, {self.costs} Kostenbuchungen, {self.notes} Notizen und "
+            f"{self.stations} Stationen in {self.duration:.1f} s angelegt."
+        )
+
+
+def clear_benchmark_data() -> None:
+    """Remove everything created by :func:`seed_benchmark_data`."""
+
+    patients = FallenBird.objects.filter(bird_identifier__startswith=BENCHMARK_PREFIX)
+    patient_type = ContentType.objects.get_for_model(FallenBird)
+    patient_ids = [str(pk) for pk in patients.values_list("pk", flat=True)]
+    Notiz.objects.filter(content_type=patient_type, object_id__in=patient_ids).delete()
+    Costs.objects.filter(id_bird__in=patients).delete()
+    patients.delete()
+    WildbirdHelpStation.objects.filter(name__startswith=STATION_PREFIX).delete()
+
+
+def _lookups():
+    user, created = User.objects.get_or_create(
+        username=BENCHMARK_USERNAME,
+        defaults={"is_staff": True, "is_superuser": True, "email": "benchmark@example.com"},
+    )
+    if created:
+        user.set_unusable_password()
+        user.save(update_fields=["password"])
+    statuses = {pk: BirdStatus.objects.get_or_create(id=pk, defaults={"description": name})[0] for pk, name in STATUSES.items()}
+    circumstances = [
+        Circumstance.objects.get_or_create(description=name, defaults={"name": name})[0] for name in CIRCUMSTANCES
+    ]
+    species = [Bird.objects.get_or_create(name=name, defaults={"species": latin})[0] for name, latin in SPECIES]
+    aviaries = [
+        Aviary.objects.get_or_create(name=f"{BENCHMARK_PREFIX}Voliere {number}", defaults={"capacity": 20})[0]
+        for number in range(1, 11)
+    ]
+    return user, statuses, circumstances, species, aviaries
+
+
+def _found_on(rng: random.Random, year: int, today: date) -> date:
+    month = rng.choices(range(1, 13), weights=MONTH_WEIGHTS)[0]
+    found = date(year, month, rng.randint(1, 28))
+    return min(found, today)
+
+
+def seed_benchmark_data(
+    patients: int = 100_000,
+    years: int = 20,
+    costs: int = 50_000,
+    notes: int = 20_000,
+    stations: int = 300,
+    batch_size: int = 2000,
+    seed: int = 1,
+    log: Optional[Callable[[str], None]] = None,
+) -> SeedResult:
+    """Create reproducible benchmark data with realistic volumes.
+
+    Patients are spread over ``years`` years with a seasonal distribution;
+    only those found in the last two months are still in care. All rows are
+    marked with :data:`BENCHMARK_PREFIX` so they can be removed again.
+    """
+
+    started = time.perf_counter()
+    rng = random.Random(seed)
+    today = timezone.localdate()
+    result = SeedResult()
+    user, statuses, circumstances, species, aviaries = _lookups()
+    closed_ids, closed_weights = zip(*CLOSED_STATUS_WEIGHTS.items())
+    first_year = today.year - years + 1
+    patient_refs = []
+
+    with transaction.atomic():
+        for offset in range(0, patients, batch_size):
+            batch = []
+            for number in range(offset, min(offset + batch_size, patients)):
+                found = _found_on(rng, rng.randint(first_year, today.year), today)
+                active = (today - found).days < 60 and rng.random() < 0.7
+                status = statuses[rng.choice((1, 2))] if active else statuses[rng.choices(closed_ids, closed_weights)[0]]
+                batch.append(
+                    FallenBird(
+                        bird_identifier=f"{BENCHMARK_PREFIX}{number:06d}",
+                        bird=rng.choice(species),
+                        age=rng.choice(["unbekannt", "Nestling", "Ästling", "Juvenil", "Adult"]),
+                        sex=rng.choice(["Weiblich", "Männlich", "Unbekannt"]),
+                        date_found=found,
+                        place=rng.choice(PLACES),
+                        find_circumstances=rng.choice(circumstances),
+                        diagnostic_finding=rng.choice(["", "Flügelverletzung", "Schädeltrauma", "Abgemagert"]),
+                        user=user,
+                        created_by=user,
+                        status=status,
+                        aviary=rng.choice(aviaries) if active else None,
+                        patient_file_close_date=None if active else found + timedelta(days=rng.randint(1, 90)),
+                    )
+                )
+            FallenBird.objects.bulk_create(batch, batch_size=batch_size)
+            patient_refs.extend((patient.pk, patient.bird_id, patient.date_found) for patient in batch)
+            result.patients += len(batch)
+            if log:
+                log(f"{result.patients}/{patients} Patienten")
+
+        categories = [key for key, _label in CHOICE_CATEGORY]
+        for offset in range(0, costs, batch_size):
+            batch = []
+            for _ in range(offset, min(offset + batch_size, costs)):
+                patient_id, bird_id, found = rng.choice(patient_refs)
+                amount = Decimal(rng.randint(50, 15000)) / 100
+                batch.append(
+                    Costs(
+                        id_bird_id=patient_id,
+                        bird_id=bird_id,
+                        description=f"{BENCHMARK_PREFIX}Kosten",
+                        amount=amount,
+                        costs=min(amount, Decimal("999.99")),
+                        cost_date=found + timedelta(days=rng.randint(0, 30)),
+                        category=rng.choice(categories),
+                        user=user,
+                        created_by=user,
+                    )
+                )
+            Costs.objects.bulk_create(batch, batch_size=batch_size)
+            result.costs += len(batch)
+
+        patient_type = ContentType.objects.get_for_model(FallenBird)
+        for offset in range(0, notes, batch_size):
+            batch = []
+            for number in range(offset, min(offset + batch_size, notes)):
+                patient_id, _bird_id, found = rng.choice(patient_refs)
+                content = f"## Visite {found:%d.%m.%Y}\n\n- Gewicht: {rng.randint(10, 900)} g\n- Futter: *Insekten*\n"
+                batch.append(
+                    Notiz(
+                        name=f"{BENCHMARK_PREFIX}Notiz {number}",
+                        inhalt=content,
+                        inhalt_html=render_markdown(content),
+                        content_type=patient_type,
+                        object_id=str(patient_id),
+                        erstellt_von=user,
+                    )
+                )
+            Notiz.objects.bulk_create(batch, batch_size=batch_size)
+            result.notes += len(batch)
+
+        batch = []
+        for number in range(stations):
+            city, state, latitude, longitude = rng.choice(CITIES)
+            batch.append(
+                WildbirdHelpStation(
+                    name=f"{STATION_PREFIX} {number:04d}",
+                    city=city,
+                    state=state,
+                    country="Deutschland",
+                    postal_code=f"{rng.randint(1000, 99999):05d}",
+                    latitude=Decimal(f"{latitude + rng.uniform(-0.5, 0.5):.6f}"),
+                    longitude=Decimal(f"{longitude + rng.uniform(-0.5, 0.5):.6f}"),
+                    approved_for_publication=True,
+                    specialization="Singvögel, Greifvögel",
+                )
+            )
+        WildbirdHelpStation.objects.bulk_create(batch, batch_size=batch_size)
+        result.stations = len(batch)
+
+    result.duration = time.perf_counter() - started
+    return result
+
+
+@dataclass(slots=True)
+class BenchmarkResult:
+    name: str
+    runs: int
+    min_ms: float
+    median_ms: float
+    mean_ms: float
+    max_ms: float
+    queries: int
+    db_ms: float
+    duplicate_queries: int
+    size_bytes: int
+    status: Optional[int] = None
+    timings_ms: list[float] = field(default_factory=list)
+
+
+class BenchmarkRunner:
+    """Run the benchmark scenarios and collect timings.
+
+    Every run starts with an empty cache, so the numbers describe the work
+    done on a cold request. Use a dedicated benchmark database and cache.
+    """
+
+    def __init__(self, repeat: int = 5, warm: bool = False):
+        self.repeat = repeat
+        self.warm = warm
+        self.user = User.objects.get_or_create(
+            username=BENCHMARK_USERNAME,
+            defaults={"is_staff": True, "is_superuser": True},
+        )[0]
+        hosts = [host for host in settings.ALLOWED_HOSTS if host and "*" not in host]
+        self.client = Client(SERVER_NAME=hosts[0].lstrip(".") if hosts else "testserver")
+        self.client.force_login(self.user)
+
+    def scenarios(self) -> dict[str, Callable[[], tuple[int, Optional[int]]]]:
+        today = timezone.localdate()
+        return {
+            "statistics_build": lambda: (len(str(StatisticsBuilder(None).build_context())), None),
+            "report_csv": lambda: (
+                len(ReportGenerator(today - timedelta(days=365), today).generate_csv()[0]),
+                None,
+            ),
+            "export_birds_all": self._get("export_birds_all"),
+            "bird_all": self._get("bird_all"),
+            "bird_inactive": self._get("bird_inactive"),
+            "station_feed": self._get("stations:data"),
+        }
+
+    def _get(self, url_name: str) -> Callable[[], tuple[int, Optional[int]]]:
+        def request():
+            response = self.client.get(reverse(url_name), secure=True)
+            if response.streaming:
+                size = sum(len(chunk) for chunk in response.streaming_content)
+            else:
+                size = len(response.content)
+            return size, response.status_code
+
+        return request
+
+    def run(self, only: Optional[list[str]] = None) -> list[BenchmarkResult]:
+        results = []
+        for name, scenario in self.scenarios().items():
+            if only and name not in only:
+                continue
+            timings = []
+            for _ in range(self.repeat):
+                if not self.warm:
+                    cache.clear()
+                metrics = RequestMetrics()
+                with connection.execute_wrapper(metrics):
+                    started = time.perf_counter()
+                    size, status = scenario()
+                    timings.append((time.perf_counter() - started) * 1000)
+            results.append(
+                BenchmarkResult(
+                    name=name,
+                    runs=len(timings),
+                    min_ms=min(timings),
+                    median_ms=statistics.median(timings),
+                    mean_ms=statistics.fmean(timings),
+                    max_ms=max(timings),
+                    queries=metrics.queries,
+                    db_ms=metrics.db_time * 1000,
+                    duplicate_queries=sum(count - 1 for _sql, count in metrics.duplicates),
+                    size_bytes=size,
+                    status=status,
+                    timings_ms=timings,
+                )
+            )
+        return results
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=getattr(settings, "BASE_DIR", None),
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip() or None
+
+
+def benchmark_report(results: list[BenchmarkResult], repeat: int, warm: bool) -> dict:
+    """Return the JSON document written by ``run_benchmarks``."""
+
+    return {
+        "created": timezone.now().isoformat(),
+        "commit": _git_commit(),
+        "database": connection.vendor,
+        "repeat": repeat,
+        "warm_cache": warm,
+        "counts": {
+            "patients": FallenBird.objects.count(),
+            "costs": Costs.objects.count(),
+            "notes": Notiz.objects.count(),
+            "stations": WildbirdHelpStation.objects.count(),
+        },
+        "results": {result.name: asdict(result) for result in results},
+    }
+
+
+def compare_reports(baseline: dict, current: dict) -> list[str]:
+    """Describe the change of the median timings against ``baseline``."""
+
+    lines = []
+    for name, result in current["results"].items():
+        before = baseline.get("results", {}).get(name)
+        if not before or not before["median_ms"]:
+            lines.append(f"{name}: {result['median_ms']:.1f} ms (neu)")
+            continue
+        change = (result["median_ms"] - before["median_ms"]) / before["median_ms"] * 100
+        lines.append(
+            f"{name}: {before['median_ms']:.1f} ms -> {result['median_ms']:.1f} ms ({change:+.1f} %), "
+            f"Abfragen {before['queries']} -> {result['queries']}"
+        )
+    return lines
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+from django.db import connections
+
+
+@dataclass(slots=True)
+class ConnectionStats:
+    alias: str
+    vendor: str
+    conn_max_age: Optional[int]
+    health_checks: bool
+    pooled: bool
+    pool: dict[str, int] = field(default_factory=dict)
+
+    def as_message(self) -> str:
+        if not self.pooled:
+            lifetime = "unbegrenzt" if self.conn_max_age is None else f"{self.conn_max_age} s"
+            return (
+                f"{self.alias} ({self.vendor}): persistente Verbindungen, Lebensdauer {lifetime}, "
+                f"Health-Checks {'an' if self.health_checks else 'aus'}"
+            )
+        return (
+            f"{self.alias} ({self.vendor}): Pool {self.pool.get('pool_size', 0)}/{self.pool.get('pool_max', 0)} "
+            f"Verbindungen, {self.pool.get('pool_available', 0)} frei, "
+            f"{self.pool.get('requests_waiting', 0)} wartend, "
+            f"{self.pool.get('requests_num', 0)} Anfragen, "
+            f"{self.pool.get('requests_errors', 0)} Zeitüberschreitungen"
+        )
+
+
+def connection_stats() -> list[ConnectionStats]:
+    """Return connection settings and, for pooled databases, pool usage of this process."""
+
+    stats = []
+    for alias in connections:
+        connection = connections[alias]
+        pool = getattr(connection, "pool", None)
+        stats.append(
+            ConnectionStats(
+                alias=alias,
+                vendor=connection.vendor,
+                conn_max_age=connection.settings_dict.get("CONN_MAX_AGE"),
+                health_checks=connection.settings_dict.get("CONN_HEALTH_CHECKS", False),
+                pooled=pool is not None,
+                pool=pool.get_stats() if pool is not None else {},
+            )
+        )
+    return stats
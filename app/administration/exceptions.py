@@ -0,0 +1,2 @@
+class BackupError(Exception):
+    """Raised when a backup operation fails."""
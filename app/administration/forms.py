@@ -16,14 +16,14 @@ class BackupRunForm(forms.Form):
 class BackupRestoreForm(forms.Form):
     backup_file = forms.FileField(
         label="Backup-Datei",
-        help_text="PostgreSQL Dump (.sql oder .dump)."
+        help_text="PostgreSQL Dump (.sql, .dump oder .tar für Verzeichnis-Dumps)."
     )
 
     def clean_backup_file(self):
         uploaded = self.cleaned_data["backup_file"]
         if uploaded.size == 0:
             raise forms.ValidationError("Die Datei ist leer.")
-        if not uploaded.name.endswith((".sql", ".dump", ".bak")):
+        if not uploaded.name.endswith((".sql", ".dump", ".bak", ".tar")):
             raise forms.ValidationError("Nur SQL-/Dump-Dateien werden unterstützt.")
         return uploaded
 
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from administration.staticfiles import find_unhashed_references
+
+
+class Command(BaseCommand):
+    help = "Vorlagen auf Verweise zu statischen Dateien ohne Hash im Dateinamen prüfen."
+
+    def handle(self, *args, **options):
+        findings = find_unhashed_references()
+        for finding in findings:
+            self.stderr.write(finding.as_message())
+        if findings:
+            raise CommandError(f"{len(findings)} Verweise auf statische Dateien ohne Hash gefunden.")
+        self.stdout.write(self.style.SUCCESS("Alle Verweise auf statische Dateien verwenden gehashte Dateinamen."))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from administration.database import connection_stats
+
+
+class Command(BaseCommand):
+    help = "Datenbankverbindungen und Auslastung des Verbindungspools anzeigen."
+
+    def handle(self, *args, **options):
+        for stats in connection_stats():
+            self.stdout.write(stats.as_message())
@@ -0,0 +1,39 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.template.defaultfilters import filesizeformat
+
+from administration.models import BackupDestination
+from administration.exceptions import BackupError
+from administration.transfer import download_file, open_store
+
+
+class Command(BaseCommand):
+    help = "Backup-Datei von einem Backup-Ziel blockweise herunterladen. Abgebrochene Downloads werden fortgesetzt."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("destination", help="Name des Backup-Ziels.")
+        parser.add_argument("file_name", help="Dateiname des Backups auf dem Ziel, z. B. fbf_backup_20250101_020000.dump.")
+        parser.add_argument("output", help="Lokale Zieldatei.")
+
+    def handle(self, *args, **options):
+        try:
+            destination = BackupDestination.objects.get(name=options["destination"])
+        except BackupDestination.DoesNotExist as exc:
+            raise CommandError(f"Backup-Ziel '{options['destination']}' existiert nicht.") from exc
+
+        def report(stats):
+            self.stdout.write(f"{filesizeformat(stats.completed_bytes)} / {filesizeformat(stats.total_bytes)}")
+
+        try:
+            with open_store(destination) as store:
+                stats = download_file(store, options["file_name"], Path(options["output"]), progress=report)
+        except BackupError as exc:
+            raise CommandError(str(exc)) from exc
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{filesizeformat(stats.total_bytes)} in {stats.elapsed:.1f} s heruntergeladen "
+                f"({filesizeformat(stats.throughput)}/s, {stats.retries} Wiederholungen)."
+            )
+        )
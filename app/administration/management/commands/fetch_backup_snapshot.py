@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from administration.models import BackupDestination
+from administration.exceptions import BackupError
+from administration.snapshots import fetch_snapshot
+
+
+class Command(BaseCommand):
+    help = "Inkrementellen Snapshot von einem Backup-Ziel laden und als SQL-Dump zusammensetzen."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("destination", help="Name des Backup-Ziels.")
+        parser.add_argument("snapshot", help="Dateiname des Snapshot-Manifests, z. B. fbf_snapshot_20250101_020000.json.")
+        parser.add_argument("output", help="Zieldatei für den zusammengesetzten SQL-Dump.")
+
+    def handle(self, *args, **options):
+        try:
+            destination = BackupDestination.objects.get(name=options["destination"])
+        except BackupDestination.DoesNotExist as exc:
+            raise CommandError(f"Backup-Ziel '{options['destination']}' existiert nicht.") from exc
+
+        try:
+            with open(options["output"], "wb") as target:
+                manifest = fetch_snapshot(destination, options["snapshot"], target)
+        except BackupError as exc:
+            raise CommandError(str(exc)) from exc
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(manifest['chunks'])} Blöcke ({manifest['size']} Bytes) nach {options['output']} geschrieben."
+            )
+        )
@@ -0,0 +1,46 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from administration.benchmarks import BenchmarkRunner, benchmark_report, compare_reports
+
+
+class Command(BaseCommand):
+    help = (
+        "Statistik, CSV-Report, Export, Patientenlisten und Stationsdaten messen und die Ergebnisse als JSON "
+        "ausgeben. Leert vor jedem Durchlauf den Cache, daher nur mit Benchmark-Datenbank und -Cache verwenden."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--repeat", type=int, default=5, help="Durchläufe je Szenario.")
+        parser.add_argument("--only", action="append", help="Nur dieses Szenario ausführen (mehrfach möglich).")
+        parser.add_argument("--warm", action="store_true", help="Cache zwischen den Durchläufen nicht leeren.")
+        parser.add_argument("--output", help="JSON-Ergebnis in diese Datei schreiben statt auf die Standardausgabe.")
+        parser.add_argument("--compare", help="Vorheriges JSON-Ergebnis, mit dem verglichen wird.")
+
+    def handle(self, *args, **options):
+        if options["repeat"] < 1:
+            raise CommandError("--repeat muss mindestens 1 sein.")
+        baseline = None
+        if options["compare"]:
+            try:
+                baseline = json.loads(Path(options["compare"]).read_text(encoding="utf-8"))
+            except (OSError, ValueError) as exc:
+                raise CommandError(f"Vergleichsdatei kann nicht gelesen werden: {exc}") from exc
+
+        runner = BenchmarkRunner(repeat=options["repeat"], warm=options["warm"])
+        unknown = set(options["only"] or []) - set(runner.scenarios())
+        if unknown:
+            raise CommandError(f"Unbekannte Szenarien: {', '.join(sorted(unknown))}")
+
+        report = benchmark_report(runner.run(options["only"]), options["repeat"], options["warm"])
+        document = json.dumps(report, indent=2, ensure_ascii=False)
+        if options["output"]:
+            Path(options["output"]).write_text(document + "\n", encoding="utf-8")
+        else:
+            self.stdout.write(document)
+
+        if baseline is not None:
+            for line in compare_reports(baseline, report):
+                self.stderr.write(line)
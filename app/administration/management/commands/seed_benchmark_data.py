@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand, CommandParser
+
+from administration.benchmarks import clear_benchmark_data, seed_benchmark_data
+
+
+class Command(BaseCommand):
+    help = (
+        "Synthetische Benchmark-Daten anlegen (Standard: 100.000 Patienten über 20 Jahre, Kosten, Notizen "
+        "und Stationen). Nur für Benchmark-Datenbanken gedacht."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--patients", type=int, default=100_000, help="Anzahl der Patienten.")
+        parser.add_argument("--years", type=int, default=20, help="Zeitraum in Jahren, über den die Funde verteilt werden.")
+        parser.add_argument("--costs", type=int, default=50_000, help="Anzahl der Kostenbuchungen.")
+        parser.add_argument("--notes", type=int, default=20_000, help="Anzahl der Notizen.")
+        parser.add_argument("--stations", type=int, default=300, help="Anzahl der Wildvogelhilfe-Stationen.")
+        parser.add_argument("--batch-size", type=int, default=2000, help="Zeilen je INSERT.")
+        parser.add_argument("--seed", type=int, default=1, help="Startwert des Zufallsgenerators.")
+        parser.add_argument("--clear", action="store_true", help="Vorher angelegte Benchmark-Daten zuerst löschen.")
+
+    def handle(self, *args, **options):
+        if options["clear"]:
+            clear_benchmark_data()
+            self.stdout.write("Vorhandene Benchmark-Daten gelöscht.")
+
+        result = seed_benchmark_data(
+            patients=options["patients"],
+            years=options["years"],
+            costs=options["costs"],
+            notes=options["notes"],
+            stations=options["stations"],
+            batch_size=options["batch_size"],
+            seed=options["seed"],
+            log=self.stdout.write if options["verbosity"] > 1 else None,
+        )
+        self.stdout.write(self.style.SUCCESS(result.as_message()))
@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('administration', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='backupdestination',
+            name='dump_format',
+            field=models.CharField(choices=[('plain', 'SQL (Klartext)'), ('custom', 'Custom (pg_dump -Fc)'), ('directory', 'Verzeichnis (pg_dump -Fd, parallel)')], default='plain', help_text='Custom- und Verzeichnis-Dumps lassen sich mit pg_restore parallel einspielen.', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='backupdestination',
+            name='jobs',
+            field=models.PositiveIntegerField(default=0, help_text='Parallele Jobs für pg_dump (nur Verzeichnisformat). 0 = Anzahl der CPU-Kerne.'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('administration', '0002_backupdestination_dump_format_jobs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='backupdestination',
+            name='incremental',
+            field=models.BooleanField(default=False, help_text='Inkrementelle, deduplizierte Snapshots: nur geänderte Blöcke des SQL-Dumps werden übertragen. Das Dump-Format wird dabei ignoriert.'),
+        ),
+        migrations.AddField(
+            model_name='backuplog',
+            name='manifest',
+            field=models.JSONField(blank=True, help_text='Blockliste eines inkrementellen Snapshots.', null=True),
+        ),
+    ]
@@ -0,0 +1,31 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('administration', '0003_backupdestination_incremental_backuplog_manifest'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='backuplog',
+            name='status',
+            field=models.CharField(choices=[('success', 'Erfolgreich'), ('failure', 'Fehlgeschlagen'), ('running', 'Läuft')], max_length=10),
+        ),
+        migrations.AddField(
+            model_name='backuplog',
+            name='bytes_total',
+            field=models.BigIntegerField(default=0, help_text='Größe der zu übertragenden Daten in Bytes.'),
+        ),
+        migrations.AddField(
+            model_name='backuplog',
+            name='bytes_transferred',
+            field=models.BigIntegerField(default=0, help_text='Bereits übertragene Bytes.'),
+        ),
+        migrations.AddField(
+            model_name='backuplog',
+            name='duration',
+            field=models.FloatField(blank=True, help_text='Dauer der Übertragung in Sekunden.', null=True),
+        ),
+    ]
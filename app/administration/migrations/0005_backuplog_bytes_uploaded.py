@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-19 20:22
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def copy_transferred_bytes(apps, schema_editor):
+    # Earlier entries only counted bytes that were actually sent.
+    BackupLog = apps.get_model("administration", "BackupLog")
+    BackupLog.objects.update(bytes_uploaded=F("bytes_transferred"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('administration', '0004_backuplog_transfer_progress'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='backuplog',
+            name='bytes_uploaded',
+            field=models.BigIntegerField(default=0, help_text='Tatsächlich gesendete Bytes, ohne fortgesetzte Teile und bereits vorhandene Snapshot-Blöcke.'),
+        ),
+        migrations.AlterField(
+            model_name='backuplog',
+            name='bytes_transferred',
+            field=models.BigIntegerField(default=0, help_text='Bereits verarbeitete Bytes.'),
+        ),
+        migrations.RunPython(copy_transferred_bytes, migrations.RunPython.noop),
+    ]
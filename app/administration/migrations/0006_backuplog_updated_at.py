@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 20:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('administration', '0005_backuplog_bytes_uploaded'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='backuplog',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, help_text='Letzte Rückmeldung des Laufs.'),
+        ),
+    ]
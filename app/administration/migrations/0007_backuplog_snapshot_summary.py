@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-19 20:36
+
+from django.db import migrations, models
+
+
+def summarise_snapshots(apps, schema_editor):
+    BackupLog = apps.get_model("administration", "BackupLog")
+    for log in BackupLog.objects.filter(manifest__isnull=False).iterator():
+        log.snapshot_chunks = len(log.manifest.get("chunks", []))
+        log.snapshot_size = log.manifest.get("size", 0)
+        log.save(update_fields=["snapshot_chunks", "snapshot_size"])
+
+
+def plain_format_for_snapshots(apps, schema_editor):
+    # Snapshots always dumped plain SQL, whatever format was selected.
+    BackupDestination = apps.get_model("administration", "BackupDestination")
+    BackupDestination.objects.filter(incremental=True).update(dump_format="plain")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('administration', '0006_backuplog_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='backuplog',
+            name='snapshot_chunks',
+            field=models.PositiveIntegerField(blank=True, help_text='Anzahl der Blöcke des Snapshots.', null=True),
+        ),
+        migrations.AddField(
+            model_name='backuplog',
+            name='snapshot_size',
+            field=models.BigIntegerField(blank=True, help_text='Größe des Snapshot-Dumps in Bytes.', null=True),
+        ),
+        migrations.AlterField(
+            model_name='backupdestination',
+            name='incremental',
+            field=models.BooleanField(default=False, help_text='Inkrementelle, deduplizierte Snapshots: nur geänderte Blöcke des SQL-Dumps werden übertragen. Erfordert das SQL-Format (Klartext).'),
+        ),
+        migrations.RunPython(summarise_snapshots, migrations.RunPython.noop),
+        migrations.RunPython(plain_format_for_snapshots, migrations.RunPython.noop),
+    ]
@@ -19,6 +19,16 @@ class BackupDestination(models.Model):
         (SFTP, "SFTP"),
     ]
 
+    FORMAT_PLAIN = "plain"
+    FORMAT_CUSTOM = "custom"
+    FORMAT_DIRECTORY = "directory"
+
+    FORMAT_CHOICES = [
+        (FORMAT_PLAIN, "SQL (Klartext)"),
+        (FORMAT_CUSTOM, "Custom (pg_dump -Fc)"),
+        (FORMAT_DIRECTORY, "Verzeichnis (pg_dump -Fd, parallel)"),
+    ]
+
     name = models.CharField(max_length=150, unique=True)
     destination_type = models.CharField(max_length=10, choices=DESTINATION_CHOICES)
     endpoint = models.CharField(
@@ -38,6 +48,20 @@ class BackupDestination(models.Model):
     )
     use_ssl = models.BooleanField(default=True, help_text="Nur für WebDAV relevant.")
     verify_ssl = models.BooleanField(default=True, help_text="SSL-Zertifikate prüfen (WebDAV).")
+    dump_format = models.CharField(
+        max_length=10,
+        choices=FORMAT_CHOICES,
+        default=FORMAT_PLAIN,
+        help_text="Custom- und Verzeichnis-Dumps lassen sich mit pg_restore parallel einspielen.",
+    )
+    jobs = models.PositiveIntegerField(
+        default=0,
+        help_text="Parallele Jobs für pg_dump (nur Verzeichnisformat). 0 = Anzahl der CPU-Kerne.",
+    )
+    incremental = models.BooleanField(
+        default=False,
+        help_text="Inkrementelle, deduplizierte Snapshots: nur geänderte Blöcke des SQL-Dumps werden übertragen. Erfordert das SQL-Format (Klartext).",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -49,6 +73,13 @@ class BackupDestination(models.Model):
     def __str__(self) -> str:
         return f"{self.get_destination_type_display()} – {self.name}"
 
+    def clean(self):
+        super().clean()
+        if self.incremental and self.dump_format != self.FORMAT_PLAIN:
+            raise ValidationError(
+                {"dump_format": "Inkrementelle Snapshots werden immer aus einem SQL-Dump (Klartext) erstellt."}
+            )
+
     def get_display_endpoint(self) -> str:
         if self.destination_type == self.SFTP and self.port:
             return f"{self.endpoint}:{self.port}"
@@ -60,6 +91,7 @@ class BackupLog(models.Model):
     ACTION_RESTORE = "restore"
     STATUS_SUCCESS = "success"
     STATUS_FAILURE = "failure"
+    STATUS_RUNNING = "running"
 
     ACTION_CHOICES = [
         (ACTION_BACKUP, "Backup"),
@@ -68,6 +100,7 @@ class BackupLog(models.Model):
     STATUS_CHOICES = [
         (STATUS_SUCCESS, "Erfolgreich"),
         (STATUS_FAILURE, "Fehlgeschlagen"),
+        (STATUS_RUNNING, "Läuft"),
     ]
 
     destination = models.ForeignKey(
@@ -81,7 +114,22 @@ class BackupLog(models.Model):
     status = models.CharField(max_length=10, choices=STATUS_CHOICES)
     message = models.TextField(blank=True)
     file_name = models.CharField(max_length=255, blank=True)
+    manifest = models.JSONField(
+        null=True,
+        blank=True,
+        help_text="Blockliste eines inkrementellen Snapshots.",
+    )
+    bytes_total = models.BigIntegerField(default=0, help_text="Größe der zu übertragenden Daten in Bytes.")
+    bytes_transferred = models.BigIntegerField(default=0, help_text="Bereits verarbeitete Bytes.")
+    bytes_uploaded = models.BigIntegerField(
+        default=0,
+        help_text="Tatsächlich gesendete Bytes, ohne fortgesetzte Teile und bereits vorhandene Snapshot-Blöcke.",
+    )
+    duration = models.FloatField(null=True, blank=True, help_text="Dauer der Übertragung in Sekunden.")
+    snapshot_chunks = models.PositiveIntegerField(null=True, blank=True, help_text="Anzahl der Blöcke des Snapshots.")
+    snapshot_size = models.BigIntegerField(null=True, blank=True, help_text="Größe des Snapshot-Dumps in Bytes.")
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, help_text="Letzte Rückmeldung des Laufs.")
 
     class Meta:
         verbose_name = "Backup-Protokoll"
@@ -91,6 +139,19 @@ class BackupLog(models.Model):
     def __str__(self) -> str:
         return f"{self.get_action_display()} – {self.get_status_display()} – {timezone.localtime(self.created_at):%d.%m.%Y %H:%M}"
 
+    @property
+    def progress_percent(self) -> Optional[int]:
+        if not self.bytes_total:
+            return None
+        return min(100, round(self.bytes_transferred * 100 / self.bytes_total))
+
+    @property
+    def throughput(self) -> Optional[float]:
+        """Average upload rate in bytes per second."""
+        if not self.duration:
+            return None
+        return self.bytes_uploaded / self.duration
+
 
 class SMTPConfiguration(models.Model):
     name = models.CharField(max_length=150, unique=True)
@@ -1,152 +1,264 @@
 from __future__ import annotations
 
 import os
-import posixpath
 import subprocess
+import tarfile
 import tempfile
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
-from urllib.parse import urljoin
 
-import paramiko
-import requests
 from django.conf import settings
+from django.utils import timezone
 
+from .exceptions import BackupError
 from .models import BackupDestination, BackupLog
-
-
-class BackupError(Exception):
-    """Raised when a backup operation fails."""
+from .transfer import TransferStats, open_store, upload_file
 
 
 def _database_settings():
     return settings.DATABASES["default"]
 
 
-def _timestamped_name(prefix: str) -> str:
-    return f"{prefix}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.sql"
+def _timestamped_name(prefix: str, extension: str = ".sql") -> str:
+    return f"{prefix}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}{extension}"
 
 
-def run_backup(destination: BackupDestination) -> str:
-    db_settings = _database_settings()
-    file_name = _timestamped_name("fbf_backup")
-    with tempfile.TemporaryDirectory() as tmpdir:
-        local_path = Path(tmpdir) / file_name
-        command = [
-            "pg_dump",
-            f"--host={db_settings.get('HOST') or 'localhost'}",
-            f"--port={db_settings.get('PORT') or '5432'}",
-            f"--username={db_settings.get('USER')}",
-            "--no-owner",
+PG_CUSTOM_MAGIC = b"PGDMP"
+
+DUMP_EXTENSIONS = {
+    BackupDestination.FORMAT_PLAIN: ".sql",
+    BackupDestination.FORMAT_CUSTOM: ".dump",
+    BackupDestination.FORMAT_DIRECTORY: ".tar",
+}
+
+
+def _connection_args(db_settings) -> list[str]:
+    return [
+        f"--host={db_settings.get('HOST') or 'localhost'}",
+        f"--port={db_settings.get('PORT') or '5432'}",
+        f"--username={db_settings.get('USER')}",
+    ]
+
+
+def _pg_env(db_settings) -> dict[str, str]:
+    env = os.environ.copy()
+    env["PGPASSWORD"] = db_settings.get("PASSWORD", "")
+    return env
+
+
+def _parallel_jobs(requested: Optional[int] = None) -> int:
+    return requested or os.cpu_count() or 1
+
+
+def _run_pg_command(command: list[str], db_settings, **kwargs) -> None:
+    completed = subprocess.run(
+        command,
+        stderr=subprocess.PIPE,
+        env=_pg_env(db_settings),
+        check=False,
+        **kwargs,
+    )
+    if completed.returncode != 0:
+        raise BackupError(completed.stderr.decode("utf-8", errors="ignore"))
+
+
+def _dump_database(db_settings, dump_format: str, local_path: Path, jobs: Optional[int] = None) -> None:
+    command = ["pg_dump", *_connection_args(db_settings), "--no-owner"]
+    if dump_format == BackupDestination.FORMAT_CUSTOM:
+        command += ["--format=custom", f"--file={local_path}", db_settings.get("NAME")]
+        _run_pg_command(command, db_settings)
+    elif dump_format == BackupDestination.FORMAT_DIRECTORY:
+        # Only the directory format supports parallel dumps; it is packed into
+        # a single tar archive so the upload targets receive one file.
+        dump_dir = local_path.with_suffix("")
+        command += [
+            "--format=directory",
+            f"--jobs={_parallel_jobs(jobs)}",
+            f"--file={dump_dir}",
             db_settings.get("NAME"),
         ]
-        env = os.environ.copy()
-        env["PGPASSWORD"] = db_settings.get("PASSWORD", "")
+        _run_pg_command(command, db_settings)
+        with tarfile.open(local_path, "w") as archive:
+            archive.add(dump_dir, arcname=dump_dir.name)
+    else:
+        command.append(db_settings.get("NAME"))
         with local_path.open("wb") as outfile:
-            completed = subprocess.run(
-                command,
-                stdout=outfile,
-                stderr=subprocess.PIPE,
-                env=env,
-                check=False,
-            )
-        if completed.returncode != 0:
-            raise BackupError(completed.stderr.decode("utf-8", errors="ignore"))
-
-        if destination.destination_type == BackupDestination.WEB_DAV:
-            _upload_via_webdav(destination, local_path)
-        else:
-            _upload_via_sftp(destination, local_path)
+            _run_pg_command(command, db_settings, stdout=outfile)
 
-        return file_name
 
+class BackupProgress:
+    """Persist transfer progress on a running ``BackupLog`` entry."""
 
-def _upload_via_webdav(destination: BackupDestination, local_path: Path) -> None:
-    url_base = destination.endpoint
-    if not url_base.endswith("/"):
-        url_base += "/"
-    remote_file = destination.remote_path.strip("/") if destination.remote_path else ""
-    remote_url = urljoin(url_base, f"{remote_file}/{local_path.name}" if remote_file else local_path.name)
-    auth = (destination.username, destination.password) if destination.username else None
-    with local_path.open("rb") as stream:
-        response = requests.put(
-            remote_url,
-            data=stream,
-            auth=auth,
-            verify=destination.verify_ssl,
+    interval = 2.0
+
+    def __init__(self, log: BackupLog):
+        self.log = log
+        self._last_update = 0.0
+
+    def __call__(self, stats: TransferStats) -> None:
+        now = time.monotonic()
+        if stats.finished is None and now - self._last_update < self.interval:
+            return
+        self._last_update = now
+        BackupLog.objects.filter(pk=self.log.pk).update(
+            bytes_total=stats.total_bytes,
+            bytes_transferred=stats.completed_bytes,
+            bytes_uploaded=stats.transferred_bytes,
+            duration=stats.elapsed,
+            updated_at=timezone.now(),
         )
-    if response.status_code not in (200, 201, 204):
-        raise BackupError(f"WebDAV Upload fehlgeschlagen ({response.status_code}): {response.text}")
-
-
-def _ensure_sftp_path(sftp: paramiko.SFTPClient, remote_path: str) -> None:
-    segments = [segment for segment in remote_path.split("/") if segment]
-    current = ""
-    for segment in segments:
-        current = f"{current}/{segment}" if current else f"/{segment}" if remote_path.startswith("/") else segment
-        try:
-            sftp.chdir(current)
-        except IOError:
-            sftp.mkdir(current)
-            sftp.chdir(current)
-
-
-def _upload_via_sftp(destination: BackupDestination, local_path: Path) -> None:
-    port = destination.port or 22
-    transport = paramiko.Transport((destination.endpoint, port))
-    try:
-        transport.connect(username=destination.username or None, password=destination.password or None)
-        sftp = paramiko.SFTPClient.from_transport(transport)
-        try:
-            remote_path = destination.remote_path or "."
-            if remote_path not in ("", "."):
-                _ensure_sftp_path(sftp, remote_path)
-            target = posixpath.join(remote_path or ".", local_path.name)
-            sftp.put(str(local_path), target)
-        finally:
-            sftp.close()
-    finally:
-        transport.close()
-
-
-def restore_database_from_file(uploaded_file) -> None:
-    db_settings = _database_settings()
-    with tempfile.NamedTemporaryFile(delete=False, suffix=Path(uploaded_file.name).suffix or ".sql") as tmp:
-        for chunk in uploaded_file.chunks():
-            tmp.write(chunk)
-        temp_path = Path(tmp.name)
-
-    try:
-        command = [
-            "psql",
-            f"--host={db_settings.get('HOST') or 'localhost'}",
-            f"--port={db_settings.get('PORT') or '5432'}",
-            f"--username={db_settings.get('USER')}",
-            db_settings.get("NAME"),
-        ]
-        env = os.environ.copy()
-        env["PGPASSWORD"] = db_settings.get("PASSWORD", "")
-        with temp_path.open("rb") as infile:
-            completed = subprocess.run(
-                command,
-                stdin=infile,
-                stderr=subprocess.PIPE,
-                env=env,
-                check=False,
-            )
-        if completed.returncode != 0:
-            raise BackupError(completed.stderr.decode("utf-8", errors="ignore"))
-    finally:
-        if temp_path.exists():
-            temp_path.unlink()
-
-
-def log_backup_event(destination: Optional[BackupDestination], action: str, status: str, message: str, file_name: str = ""):
-    BackupLog.objects.create(
+
+
+def fail_stale_backup_logs() -> int:
+    """Mark running backups without a sign of life as failed.
+
+    A run that was killed, e.g. by a worker restart, never completes its log
+    entry. Running entries count as stale once they have not been updated for
+    ``BACKUP_STALE_AFTER`` seconds; concurrent runs keep updating theirs.
+    """
+    stale_after = timedelta(seconds=getattr(settings, "BACKUP_STALE_AFTER", 3600))
+    return BackupLog.objects.filter(
+        action=BackupLog.ACTION_BACKUP,
+        status=BackupLog.STATUS_RUNNING,
+        updated_at__lt=timezone.now() - stale_after,
+    ).update(
+        status=BackupLog.STATUS_FAILURE,
+        message="Abgebrochen: Der Lauf hat sich nicht mehr gemeldet.",
+        updated_at=timezone.now(),
+    )
+
+
+def start_backup_log(destination: BackupDestination, file_name: str = "", bytes_total: int = 0) -> BackupLog:
+    fail_stale_backup_logs()
+    return BackupLog.objects.create(
         destination=destination,
-        action=action,
-        status=status,
-        message=message,
+        action=BackupLog.ACTION_BACKUP,
+        status=BackupLog.STATUS_RUNNING,
+        message="Übertragung läuft.",
         file_name=file_name,
+        bytes_total=bytes_total,
+    )
+
+
+def describe_transfer(log: BackupLog, file_name: str, bytes_total: int = 0) -> None:
+    """Store the name and size of the file a running ``log`` transfers."""
+
+    log.file_name = file_name
+    log.bytes_total = bytes_total
+    log.save(update_fields=["file_name", "bytes_total", "updated_at"])
+
+
+def run_backup(destination: BackupDestination, log: Optional[BackupLog] = None) -> str:
+    """Dump the database and upload the file to ``destination``.
+
+    :param log: Running entry from :func:`start_backup_log` that records the
+        transfer progress; a new one is created when omitted.
+    """
+    db_settings = _database_settings()
+    dump_format = destination.dump_format or BackupDestination.FORMAT_PLAIN
+    file_name = _timestamped_name("fbf_backup", DUMP_EXTENSIONS[dump_format])
+    with tempfile.TemporaryDirectory() as tmpdir:
+        local_path = Path(tmpdir) / file_name
+        _dump_database(db_settings, dump_format, local_path, jobs=destination.jobs)
+
+        log = log or start_backup_log(destination)
+        describe_transfer(log, file_name, local_path.stat().st_size)
+        with open_store(destination) as store:
+            if destination.remote_path:
+                store.ensure_dir("")
+            upload_file(store, local_path, file_name, progress=BackupProgress(log))
+
+        return file_name
+
+
+def _is_custom_dump(path: Path) -> bool:
+    with path.open("rb") as stream:
+        return stream.read(len(PG_CUSTOM_MAGIC)) == PG_CUSTOM_MAGIC
+
+
+def _extract_directory_dump(archive_path: Path, target: Path) -> Path:
+    with tarfile.open(archive_path) as archive:
+        archive.extractall(target, filter="data")
+    for toc in target.rglob("toc.dat"):
+        return toc.parent
+    raise BackupError("Das Archiv enthält keinen pg_dump-Verzeichnisdump (toc.dat fehlt).")
+
+
+def _pg_restore(db_settings, source: Path, jobs: Optional[int] = None) -> None:
+    command = [
+        "pg_restore",
+        *_connection_args(db_settings),
+        f"--dbname={db_settings.get('NAME')}",
+        f"--jobs={_parallel_jobs(jobs)}",
+        "--no-owner",
+        "--clean",
+        "--if-exists",
+        str(source),
+    ]
+    _run_pg_command(command, db_settings)
+
+
+def restore_database_from_file(uploaded_file, jobs: Optional[int] = None) -> None:
+    """Restore a plain SQL, custom or directory (tar) dump into the database.
+
+    Custom and directory dumps are replayed through ``pg_restore --jobs`` so the
+    restore time scales with the available cores; plain SQL is piped into ``psql``.
+    """
+    db_settings = _database_settings()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        temp_path = Path(tmpdir) / (Path(uploaded_file.name).name or "restore.sql")
+        with temp_path.open("wb") as tmp:
+            for chunk in uploaded_file.chunks():
+                tmp.write(chunk)
+
+        if _is_custom_dump(temp_path):
+            _pg_restore(db_settings, temp_path, jobs)
+        elif temp_path.suffix == ".tar" and tarfile.is_tarfile(temp_path):
+            dump_dir = _extract_directory_dump(temp_path, Path(tmpdir) / "restore")
+            _pg_restore(db_settings, dump_dir, jobs)
+        else:
+            command = ["psql", *_connection_args(db_settings), db_settings.get("NAME")]
+            with temp_path.open("rb") as infile:
+                _run_pg_command(command, db_settings, stdin=infile)
+
+
+def log_backup_event(
+    destination: Optional[BackupDestination],
+    action: str,
+    status: str,
+    message: str,
+    file_name: str = "",
+    manifest: Optional[dict] = None,
+    log: Optional[BackupLog] = None,
+):
+    """Record the outcome of a backup or restore.
+
+    Pass the running entry created by :func:`start_backup_log` as ``log`` to
+    complete it, so its transfer progress is kept; otherwise a new entry is added.
+    The chunk count and size of a snapshot ``manifest`` are stored alongside it.
+    """
+    snapshot_chunks = len(manifest["chunks"]) if manifest else None
+    snapshot_size = manifest["size"] if manifest else None
+    if log is None:
+        return BackupLog.objects.create(
+            destination=destination,
+            action=action,
+            status=status,
+            message=message,
+            file_name=file_name,
+            manifest=manifest,
+            snapshot_chunks=snapshot_chunks,
+            snapshot_size=snapshot_size,
+        )
+    log.status = status
+    log.message = message
+    log.file_name = file_name or log.file_name
+    log.manifest = manifest
+    log.snapshot_chunks = snapshot_chunks
+    log.snapshot_size = snapshot_size
+    log.save(
+        update_fields=["status", "message", "file_name", "manifest", "snapshot_chunks", "snapshot_size", "updated_at"]
     )
+    return log
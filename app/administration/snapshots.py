@@ -0,0 +1,198 @@
+"""Incremental, deduplicated database snapshots.
+
+The plain SQL dump is streamed from ``pg_dump`` and cut into content-defined
+chunks: a chunk ends at a line whose CRC32 matches a bit mask, bounded by a
+minimum and maximum size. Changed rows therefore only alter the chunks around
+them. Chunks are stored zlib-compressed under their SHA-256 digest, so a
+destination never receives the same chunk twice; a JSON manifest per snapshot
+lists the digests needed to reassemble the dump. Which chunks a destination
+holds is read from the destination itself, never from the local backup log,
+so moved, pruned or replaced remote directories are filled up again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import subprocess
+import tempfile
+import time
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, BinaryIO, Iterator, Optional
+
+from .exceptions import BackupError
+from .models import BackupDestination, BackupLog
+from .services import (
+    BackupProgress,
+    _connection_args,
+    _database_settings,
+    _pg_env,
+    _timestamped_name,
+    describe_transfer,
+    start_backup_log,
+)
+from .transfer import TransferStats, open_store, with_retries
+
+CHUNK_DIR = "chunks"
+SNAPSHOT_DIR = "snapshots"
+
+MIN_CHUNK_SIZE = 256 * 1024
+MAX_CHUNK_SIZE = 4 * 1024 * 1024
+# Roughly every 2048th line past the minimum size ends a chunk.
+BOUNDARY_MASK = 0x7FF
+
+
+def iter_chunks(
+    stream: BinaryIO,
+    min_size: int = MIN_CHUNK_SIZE,
+    max_size: int = MAX_CHUNK_SIZE,
+    boundary_mask: int = BOUNDARY_MASK,
+) -> Iterator[bytes]:
+    """Split a byte stream into content-defined chunks at line boundaries."""
+
+    buffer = bytearray()
+    while True:
+        line = stream.readline(max_size)
+        if not line:
+            break
+        buffer += line
+        if len(buffer) >= max_size or (
+            len(buffer) >= min_size and zlib.crc32(line) & boundary_mask == 0
+        ):
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def _format_size(num_bytes: int) -> str:
+    size = float(num_bytes)
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+@dataclass(slots=True)
+class SnapshotResult:
+    """Outcome of an incremental snapshot run."""
+
+    file_name: str
+    manifest: dict[str, Any] = field(default_factory=dict)
+    uploaded_chunks: int = 0
+    uploaded_bytes: int = 0
+
+    def as_message(self) -> str:
+        return (
+            f"Snapshot erstellt: {len(self.manifest['chunks'])} Blöcke "
+            f"({_format_size(self.manifest['size'])}), davon {self.uploaded_chunks} neu übertragen "
+            f"({_format_size(self.uploaded_bytes)})."
+        )
+
+
+def _previous_size(destination: BackupDestination) -> int:
+    size = (
+        BackupLog.objects.filter(
+            destination=destination,
+            action=BackupLog.ACTION_BACKUP,
+            status=BackupLog.STATUS_SUCCESS,
+            snapshot_size__isnull=False,
+        )
+        .order_by("-created_at")
+        .values_list("snapshot_size", flat=True)
+        .first()
+    )
+    return int(size or 0)
+
+
+def run_snapshot_backup(destination: BackupDestination, log: Optional[BackupLog] = None) -> SnapshotResult:
+    """Dump the database and upload only the chunks the destination lacks.
+
+    :param log: Running entry from :func:`~administration.services.start_backup_log`
+        that records the progress; a new one is created when omitted.
+    """
+
+    db_settings = _database_settings()
+    file_name = _timestamped_name("fbf_snapshot", ".json")
+    manifest: dict[str, Any] = {
+        "version": 1,
+        "name": file_name,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "format": BackupDestination.FORMAT_PLAIN,
+        "compression": "zlib",
+        "size": 0,
+        "chunks": [],
+    }
+    result = SnapshotResult(file_name=file_name, manifest=manifest)
+    command = ["pg_dump", *_connection_args(db_settings), "--no-owner", db_settings.get("NAME")]
+    # Progress counts dumped bytes, whether their chunk is sent or already
+    # stored. The dump size is only known at the end, so the last snapshot's
+    # size serves as the total until then.
+    stats = TransferStats(total_bytes=_previous_size(destination))
+    log = log or start_backup_log(destination)
+    describe_transfer(log, file_name)
+    progress = BackupProgress(log)
+
+    with open_store(destination) as store, tempfile.TemporaryFile() as stderr:
+        with_retries(store, lambda: store.ensure_dir(CHUNK_DIR), stats)
+        with_retries(store, lambda: store.ensure_dir(SNAPSHOT_DIR), stats)
+        # Stores that cannot list their chunks are asked for each new digest.
+        listed = with_retries(store, lambda: store.list_dir(CHUNK_DIR), stats)
+        known = set(listed or ())
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=stderr, env=_pg_env(db_settings))
+        try:
+            for chunk in iter_chunks(process.stdout):
+                digest = hashlib.sha256(chunk).hexdigest()
+                manifest["chunks"].append([digest, len(chunk)])
+                manifest["size"] += len(chunk)
+                if digest not in known:
+                    known.add(digest)
+                    name = f"{CHUNK_DIR}/{digest}"
+                    if listed is not None or not with_retries(store, lambda: store.exists(name), stats):
+                        payload = zlib.compress(chunk)
+                        with_retries(store, lambda: store.put(name, payload), stats)
+                        result.uploaded_chunks += 1
+                        result.uploaded_bytes += len(payload)
+                stats.completed_bytes = manifest["size"]
+                if stats.total_bytes:
+                    stats.total_bytes = max(stats.total_bytes, stats.completed_bytes)
+                stats.transferred_bytes = result.uploaded_bytes
+                stats.chunks = result.uploaded_chunks
+                progress(stats)
+        except BaseException:
+            process.kill()
+            raise
+        finally:
+            process.stdout.close()
+            returncode = process.wait()
+
+        if returncode != 0:
+            stderr.seek(0)
+            raise BackupError(stderr.read().decode("utf-8", errors="ignore"))
+
+        # The manifest is written last so a snapshot only exists once all chunks are stored.
+        manifest_data = json.dumps(manifest).encode("utf-8")
+        with_retries(store, lambda: store.put(f"{SNAPSHOT_DIR}/{file_name}", manifest_data), stats)
+        stats.transferred_bytes += len(manifest_data)
+
+    stats.total_bytes = manifest["size"]
+    stats.finished = time.monotonic()
+    progress(stats)
+
+    return result
+
+
+def fetch_snapshot(destination: BackupDestination, file_name: str, target: BinaryIO) -> dict[str, Any]:
+    """Reassemble the SQL dump of snapshot ``file_name`` into ``target``."""
+
+    with open_store(destination) as store:
+        manifest = json.loads(with_retries(store, lambda: store.get(f"{SNAPSHOT_DIR}/{file_name}")))
+        for digest, size in manifest["chunks"]:
+            chunk = zlib.decompress(with_retries(store, lambda: store.get(f"{CHUNK_DIR}/{digest}")))
+            if len(chunk) != size or hashlib.sha256(chunk).hexdigest() != digest:
+                raise BackupError(f"Block {digest} ist beschädigt.")
+            target.write(chunk)
+    return manifest
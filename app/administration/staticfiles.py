@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import re
+import sysconfig
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.template.utils import get_app_template_dirs
+
+STATIC_TAG = re.compile(r"""{%\s*static\s+(['"])(?P<path>[^'"]+)\1""")
+
+
+@dataclass(slots=True)
+class StaticReference:
+    template: Path
+    line: int
+    reference: str
+    reason: str
+
+    def as_message(self) -> str:
+        return f"{self.template}:{self.line}: {self.reference} ({self.reason})"
+
+
+def project_template_dirs() -> list[Path]:
+    """Return the template directories of the project, without installed packages."""
+
+    packages = {Path(sysconfig.get_paths()[key]).resolve() for key in ("purelib", "platlib")}
+    directories = [Path(directory) for engine in settings.TEMPLATES for directory in engine.get("DIRS", [])]
+    directories += [Path(directory) for directory in get_app_template_dirs("templates")]
+    result = []
+    for directory in directories:
+        directory = directory.resolve()
+        if directory.is_dir() and directory not in result and not any(
+            directory.is_relative_to(package) for package in packages
+        ):
+            result.append(directory)
+    return result
+
+
+def _static_exists(path: str) -> bool:
+    hashed_files = getattr(staticfiles_storage, "hashed_files", None)
+    if hashed_files:
+        return path in hashed_files
+    return finders.find(path) is not None
+
+
+def find_unhashed_references(directories: Optional[Iterable[Path]] = None) -> list[StaticReference]:
+    """Find template references to static files that bypass the hashed manifest names.
+
+    Hard-coded ``/static/`` URLs and ``STATIC_URL`` never get the hashed file
+    name, and ``{% static %}`` paths missing from the manifest fail at render
+    time once the manifest storage is active.
+    """
+
+    static_url = "/" + settings.STATIC_URL.lstrip("/")
+    hardcoded = re.compile(r"""{{\s*STATIC_URL\s*}}|["'(=]""" + re.escape(static_url))
+    findings = []
+    for directory in directories if directories is not None else project_template_dirs():
+        for template in sorted(Path(directory).rglob("*")):
+            if not template.is_file():
+                continue
+            try:
+                lines = template.read_text(encoding="utf-8").splitlines()
+            except UnicodeDecodeError:
+                continue
+            for number, line in enumerate(lines, start=1):
+                for match in hardcoded.finditer(line):
+                    findings.append(StaticReference(template, number, match.group(0).lstrip("\"'(="), "fest eingetragener Pfad"))
+                for match in STATIC_TAG.finditer(line):
+                    if not _static_exists(match.group("path")):
+                        findings.append(StaticReference(template, number, match.group("path"), "Datei nicht gefunden"))
+    return findings
@@ -0,0 +1,608 @@
+"""Chunked, resumable and parallel file transfer to backup destinations.
+
+Files are moved in fixed-size chunks by a small thread pool. Uploads are written
+to ``<name>.part`` while ``<name>.part.json`` on the destination records the
+offsets that are already complete, so an interrupted upload resumes where it
+stopped. SFTP writes each chunk at its offset over its own channel; WebDAV uses
+ranged ``PUT`` requests (``Content-Range``) and falls back to a single ``PUT``
+when the server does not support partial uploads. Every chunk is retried on its
+own, with a fresh connection, before the transfer is given up. The upload
+state is written every few chunks or seconds and whenever the upload fails.
+"""
+
+from __future__ import annotations
+
+import json
+import posixpath
+import stat
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+from urllib.parse import unquote, urljoin, urlsplit
+from xml.etree import ElementTree
+
+import paramiko
+import requests
+from django.conf import settings
+
+from .exceptions import BackupError
+from .models import BackupDestination
+
+CHUNK_SIZE = getattr(settings, "BACKUP_TRANSFER_CHUNK_SIZE", 8 * 1024 * 1024)
+WORKERS = getattr(settings, "BACKUP_TRANSFER_WORKERS", 4)
+RETRIES = getattr(settings, "BACKUP_TRANSFER_RETRIES", 3)
+RETRY_BACKOFF = 0.5
+STATE_EVERY_CHUNKS = getattr(settings, "BACKUP_TRANSFER_STATE_CHUNKS", 16)
+STATE_EVERY_SECONDS = getattr(settings, "BACKUP_TRANSFER_STATE_INTERVAL", 10.0)
+HTTP_TIMEOUT = 60
+
+TRANSIENT_ERRORS = (OSError, EOFError, paramiko.SSHException, requests.RequestException)
+
+
+class PartialUploadUnsupported(BackupError):
+    """Raised when a WebDAV server rejects or ignores ranged uploads."""
+
+
+@dataclass(slots=True)
+class TransferStats:
+    """Progress and throughput of a single file transfer.
+
+    ``completed_bytes`` counts towards ``total_bytes``; ``transferred_bytes``
+    is what actually went over the network in this run.
+    """
+
+    total_bytes: int = 0
+    completed_bytes: int = 0
+    resumed_bytes: int = 0
+    transferred_bytes: int = 0
+    chunks: int = 0
+    retries: int = 0
+    started: float = field(default_factory=time.monotonic)
+    finished: Optional[float] = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def throughput(self) -> float:
+        """Bytes per second sent in this run, excluding resumed chunks."""
+        elapsed = self.elapsed
+        return self.transferred_bytes / elapsed if elapsed > 0 else 0.0
+
+    def add_retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+
+ProgressCallback = Callable[[TransferStats], None]
+
+
+class RemoteStore(ABC):
+    """Named file access on a backup destination."""
+
+    def __init__(self, destination: BackupDestination):
+        self.destination = destination
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        pass
+
+    def reconnect(self) -> None:
+        pass
+
+    @abstractmethod
+    def ensure_dir(self, name: str) -> None:
+        raise NotImplementedError
+
+    def exists(self, name: str) -> bool:
+        return self.size(name) is not None
+
+    def list_dir(self, name: str) -> Optional[set[str]]:
+        """Return the file names in directory ``name``; ``None`` if the store cannot list."""
+        return None
+
+    @abstractmethod
+    def size(self, name: str) -> Optional[int]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def put(self, name: str, data: bytes) -> None:
+        raise NotImplementedError
+
+    def put_file(self, name: str, local_path: Path) -> None:
+        self.put(name, local_path.read_bytes())
+
+    @abstractmethod
+    def get(self, name: str) -> bytes:
+        raise NotImplementedError
+
+    def prepare_partial(self, name: str) -> None:
+        pass
+
+    @abstractmethod
+    def write_range(self, name: str, offset: int, data: bytes, total: int) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def read_range(self, name: str, offset: int, length: int) -> bytes:
+        raise NotImplementedError
+
+    @abstractmethod
+    def rename(self, source: str, target: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def remove(self, name: str) -> None:
+        raise NotImplementedError
+
+
+class WebDAVStore(RemoteStore):
+    def __init__(self, destination: BackupDestination):
+        super().__init__(destination)
+        self._local = threading.local()
+        self._sessions: list[requests.Session] = []
+        self._lock = threading.Lock()
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            if self.destination.username:
+                session.auth = (self.destination.username, self.destination.password)
+            session.verify = self.destination.verify_ssl
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def _base_url(self) -> str:
+        url_base = self.destination.endpoint
+        return url_base if url_base.endswith("/") else f"{url_base}/"
+
+    def _remote_name(self, name: str) -> str:
+        remote_dir = self.destination.remote_path.strip("/") if self.destination.remote_path else ""
+        return f"{remote_dir}/{name}" if remote_dir else name
+
+    def _url(self, name: str) -> str:
+        return urljoin(self._base_url(), self._remote_name(name))
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        response = self._session().request(method, url, timeout=HTTP_TIMEOUT, **kwargs)
+        if response.status_code in (408, 429) or (response.status_code >= 500 and response.status_code != 501):
+            raise requests.HTTPError(f"WebDAV {method} fehlgeschlagen ({response.status_code})", response=response)
+        return response
+
+    def close(self) -> None:
+        for session in self._sessions:
+            session.close()
+
+    def reconnect(self) -> None:
+        session = getattr(self._local, "session", None)
+        if session is not None:
+            session.close()
+            self._local.session = None
+
+    def ensure_dir(self, name: str) -> None:
+        segments = [segment for segment in self._remote_name(name).split("/") if segment]
+        for index in range(len(segments)):
+            url = urljoin(self._base_url(), "/".join(segments[: index + 1]) + "/")
+            response = self._request("MKCOL", url)
+            # 405 means the collection already exists.
+            if response.status_code not in (200, 201, 405):
+                raise BackupError(f"WebDAV Verzeichnis konnte nicht angelegt werden ({response.status_code}): {response.text}")
+
+    def size(self, name: str) -> Optional[int]:
+        response = self._request("HEAD", self._url(name))
+        if response.status_code != 200:
+            return None
+        return int(response.headers.get("Content-Length", 0))
+
+    def list_dir(self, name: str) -> Optional[set[str]]:
+        url = urljoin(self._base_url(), self._remote_name(name).rstrip("/") + "/")
+        response = self._request("PROPFIND", url, headers={"Depth": "1"})
+        if response.status_code == 404:
+            return set()
+        if response.status_code != 207:
+            return None
+        try:
+            hrefs = ElementTree.fromstring(response.content).iter("{DAV:}href")
+        except ElementTree.ParseError:
+            return None
+        collection = urlsplit(url).path
+        names = set()
+        for href in hrefs:
+            path = unquote(urlsplit(href.text or "").path)
+            # The collection itself and sub-collections end with a slash.
+            if path.endswith("/") or path.rstrip("/") == collection.rstrip("/"):
+                continue
+            names.add(posixpath.basename(path))
+        return names
+
+    def put(self, name: str, data: bytes) -> None:
+        response = self._request("PUT", self._url(name), data=data)
+        if response.status_code not in (200, 201, 204):
+            raise BackupError(f"WebDAV Upload fehlgeschlagen ({response.status_code}): {response.text}")
+
+    def put_file(self, name: str, local_path: Path) -> None:
+        with local_path.open("rb") as stream:
+            response = self._request("PUT", self._url(name), data=stream)
+        if response.status_code not in (200, 201, 204):
+            raise BackupError(f"WebDAV Upload fehlgeschlagen ({response.status_code}): {response.text}")
+
+    def get(self, name: str) -> bytes:
+        response = self._request("GET", self._url(name))
+        if response.status_code != 200:
+            raise BackupError(f"WebDAV Download fehlgeschlagen ({response.status_code}): {name}")
+        return response.content
+
+    def write_range(self, name: str, offset: int, data: bytes, total: int) -> None:
+        headers = {"Content-Range": f"bytes {offset}-{offset + len(data) - 1}/{total}"}
+        response = self._request("PUT", self._url(name), data=data, headers=headers)
+        if response.status_code in (400, 405, 501):
+            raise PartialUploadUnsupported(f"WebDAV Server unterstützt keine Teil-Uploads ({response.status_code}).")
+        if response.status_code not in (200, 201, 204):
+            raise BackupError(f"WebDAV Upload fehlgeschlagen ({response.status_code}): {response.text}")
+
+    def read_range(self, name: str, offset: int, length: int) -> bytes:
+        headers = {"Range": f"bytes={offset}-{offset + length - 1}"}
+        response = self._request("GET", self._url(name), headers=headers)
+        if response.status_code == 206:
+            return response.content
+        if response.status_code == 200:
+            # Server ignored the Range header and sent the whole file.
+            return response.content[offset : offset + length]
+        raise BackupError(f"WebDAV Download fehlgeschlagen ({response.status_code}): {name}")
+
+    def rename(self, source: str, target: str) -> None:
+        headers = {"Destination": self._url(target), "Overwrite": "T"}
+        response = self._request("MOVE", self._url(source), headers=headers)
+        if response.status_code not in (200, 201, 204):
+            raise BackupError(f"WebDAV Umbenennen fehlgeschlagen ({response.status_code}): {response.text}")
+
+    def remove(self, name: str) -> None:
+        response = self._request("DELETE", self._url(name))
+        if response.status_code not in (200, 204, 404):
+            raise BackupError(f"WebDAV Löschen fehlgeschlagen ({response.status_code}): {response.text}")
+
+
+class SFTPStore(RemoteStore):
+    def __init__(self, destination: BackupDestination):
+        super().__init__(destination)
+        self.base_path = destination.remote_path or "."
+        self.transport: Optional[paramiko.Transport] = None
+        self._generation = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connect()
+
+    def _connect(self) -> None:
+        transport = paramiko.Transport((self.destination.endpoint, self.destination.port or 22))
+        try:
+            transport.connect(username=self.destination.username or None, password=self.destination.password or None)
+        except Exception:
+            transport.close()
+            raise
+        self.transport = transport
+        self._generation += 1
+
+    def _client(self) -> paramiko.SFTPClient:
+        # Every worker thread opens its own SFTP channel on the shared SSH transport.
+        if getattr(self._local, "generation", None) != self._generation:
+            self._local.client = paramiko.SFTPClient.from_transport(self.transport)
+            self._local.generation = self._generation
+        return self._local.client
+
+    def _path(self, name: str) -> str:
+        return posixpath.join(self.base_path, name) if name else self.base_path
+
+    def close(self) -> None:
+        if self.transport is not None:
+            self.transport.close()
+
+    def reconnect(self) -> None:
+        with self._lock:
+            self._local.generation = None
+            if self.transport is not None and self.transport.is_active():
+                return
+            if self.transport is not None:
+                self.transport.close()
+            self._connect()
+
+    def ensure_dir(self, name: str) -> None:
+        path = self._path(name)
+        current = "/" if path.startswith("/") else ""
+        for segment in [segment for segment in path.split("/") if segment and segment != "."]:
+            current = posixpath.join(current, segment)
+            try:
+                self._client().stat(current)
+            except IOError:
+                self._client().mkdir(current)
+
+    def size(self, name: str) -> Optional[int]:
+        try:
+            return self._client().stat(self._path(name)).st_size
+        except IOError:
+            return None
+
+    def list_dir(self, name: str) -> Optional[set[str]]:
+        try:
+            entries = self._client().listdir_attr(self._path(name))
+        except FileNotFoundError:
+            return set()
+        return {entry.filename for entry in entries if stat.S_ISREG(entry.st_mode or 0)}
+
+    def put(self, name: str, data: bytes) -> None:
+        with self._client().open(self._path(name), "wb") as remote:
+            remote.set_pipelined(True)
+            remote.write(data)
+
+    def put_file(self, name: str, local_path: Path) -> None:
+        self._client().put(str(local_path), self._path(name))
+
+    def get(self, name: str) -> bytes:
+        try:
+            with self._client().open(self._path(name), "rb") as remote:
+                return remote.read()
+        except FileNotFoundError as exc:
+            raise BackupError(f"SFTP Download fehlgeschlagen: {name} nicht gefunden") from exc
+
+    def prepare_partial(self, name: str) -> None:
+        if self.size(name) is None:
+            self._client().open(self._path(name), "wb").close()
+
+    def write_range(self, name: str, offset: int, data: bytes, total: int) -> None:
+        # Not pipelined: paramiko drops status errors of pipelined writes.
+        with self._client().open(self._path(name), "r+b") as remote:
+            remote.seek(offset)
+            remote.write(data)
+
+    def read_range(self, name: str, offset: int, length: int) -> bytes:
+        with self._client().open(self._path(name), "rb") as remote:
+            remote.seek(offset)
+            return remote.read(length)
+
+    def rename(self, source: str, target: str) -> None:
+        client = self._client()
+        try:
+            client.posix_rename(self._path(source), self._path(target))
+        except IOError:
+            self.remove(target)
+            client.rename(self._path(source), self._path(target))
+
+    def remove(self, name: str) -> None:
+        try:
+            self._client().remove(self._path(name))
+        except FileNotFoundError:
+            pass
+
+
+def open_store(destination: BackupDestination) -> RemoteStore:
+    if destination.destination_type == BackupDestination.WEB_DAV:
+        return WebDAVStore(destination)
+    return SFTPStore(destination)
+
+
+def with_retries(store: RemoteStore, action, stats: Optional[TransferStats] = None, retries: int = RETRIES, backoff: float = RETRY_BACKOFF):
+    """Run ``action`` and retry transient network errors on a fresh connection."""
+
+    for attempt in range(retries + 1):
+        try:
+            return action()
+        except TRANSIENT_ERRORS as exc:
+            if attempt == retries:
+                raise BackupError(f"Übertragung nach {retries + 1} Versuchen fehlgeschlagen: {exc}") from exc
+            if stats is not None:
+                stats.add_retry()
+            time.sleep(backoff * (attempt + 1))
+            try:
+                store.reconnect()
+            except TRANSIENT_ERRORS:
+                pass
+
+
+def _chunks(total: int, chunk_size: int, done: set[int]) -> list[tuple[int, int]]:
+    return [
+        (offset, min(chunk_size, total - offset))
+        for offset in range(0, total, chunk_size)
+        if offset not in done
+    ]
+
+
+def _valid_state(state: dict, total: int, chunk_size: int) -> set[int]:
+    if state.get("total") != total or state.get("chunk_size") != chunk_size:
+        return set()
+    return set(state.get("done", []))
+
+
+def _dump_state(total: int, chunk_size: int, done: set[int]) -> bytes:
+    return json.dumps({"total": total, "chunk_size": chunk_size, "done": sorted(done)}).encode("utf-8")
+
+
+def _run_parallel(tasks: list[tuple[int, int]], worker, workers: int, on_done) -> None:
+    """Run ``worker`` for every chunk; ``on_done`` is called in the calling thread."""
+
+    pool = ThreadPoolExecutor(max_workers=max(1, workers))
+    try:
+        futures = {pool.submit(worker, offset, length): (offset, length) for offset, length in tasks}
+        for future in as_completed(futures):
+            future.result()
+            on_done(*futures[future])
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def upload_file(
+    store: RemoteStore,
+    local_path: Path,
+    name: str,
+    *,
+    chunk_size: int = CHUNK_SIZE,
+    workers: int = WORKERS,
+    retries: int = RETRIES,
+    backoff: float = RETRY_BACKOFF,
+    progress: Optional[ProgressCallback] = None,
+) -> TransferStats:
+    """Upload ``local_path`` as ``name``, resuming an earlier partial upload."""
+
+    total = local_path.stat().st_size
+    stats = TransferStats(total_bytes=total)
+
+    def retry(action):
+        return with_retries(store, action, stats, retries, backoff)
+
+    if total <= chunk_size:
+        retry(lambda: store.put(name, local_path.read_bytes()))
+        stats.completed_bytes = stats.transferred_bytes = total
+        stats.chunks, stats.finished = 1, time.monotonic()
+        if progress:
+            progress(stats)
+        return stats
+
+    part_name = f"{name}.part"
+    state_name = f"{part_name}.json"
+
+    done: set[int] = set()
+    if retry(lambda: store.exists(state_name)):
+        try:
+            done = _valid_state(json.loads(retry(lambda: store.get(state_name))), total, chunk_size)
+        except (BackupError, ValueError):
+            done = set()
+    if done and retry(lambda: store.size(part_name)) is None:
+        done = set()
+    if not done:
+        retry(lambda: store.prepare_partial(part_name))
+    stats.resumed_bytes = stats.completed_bytes = sum(
+        min(chunk_size, total - offset) for offset in done
+    )
+
+    def send(offset: int, length: int) -> None:
+        with local_path.open("rb") as stream:
+            stream.seek(offset)
+            data = stream.read(length)
+        retry(lambda: store.write_range(part_name, offset, data, total))
+
+    saved_chunks, saved_at = 0, time.monotonic()
+
+    def save_state() -> None:
+        nonlocal saved_chunks, saved_at
+        retry(lambda: store.put(state_name, _dump_state(total, chunk_size, done)))
+        saved_chunks, saved_at = stats.chunks, time.monotonic()
+
+    def on_done(offset: int, length: int) -> None:
+        done.add(offset)
+        stats.completed_bytes += length
+        stats.transferred_bytes += length
+        stats.chunks += 1
+        if stats.chunks - saved_chunks >= STATE_EVERY_CHUNKS or time.monotonic() - saved_at >= STATE_EVERY_SECONDS:
+            save_state()
+        if progress:
+            progress(stats)
+
+    try:
+        _run_parallel(_chunks(total, chunk_size, done), send, workers, on_done)
+        if retry(lambda: store.size(part_name)) != total:
+            raise PartialUploadUnsupported("Teil-Upload ergab eine falsche Dateigröße.")
+    except PartialUploadUnsupported:
+        retry(lambda: store.remove(part_name))
+        retry(lambda: store.remove(state_name))
+        stats.resumed_bytes = 0
+        retry(lambda: store.put_file(name, local_path))
+        stats.completed_bytes, stats.chunks = total, 1
+        stats.transferred_bytes += total
+    except Exception:
+        # Keep the chunks sent so far for the next attempt.
+        if stats.chunks > saved_chunks:
+            try:
+                save_state()
+            except BackupError:
+                pass
+        raise
+    else:
+        retry(lambda: store.rename(part_name, name))
+        retry(lambda: store.remove(state_name))
+
+    stats.finished = time.monotonic()
+    if progress:
+        progress(stats)
+    return stats
+
+
+def download_file(
+    store: RemoteStore,
+    name: str,
+    local_path: Path,
+    *,
+    chunk_size: int = CHUNK_SIZE,
+    workers: int = WORKERS,
+    retries: int = RETRIES,
+    backoff: float = RETRY_BACKOFF,
+    progress: Optional[ProgressCallback] = None,
+) -> TransferStats:
+    """Download ``name`` to ``local_path``, resuming an earlier partial download."""
+
+    stats = TransferStats()
+
+    def retry(action):
+        return with_retries(store, action, stats, retries, backoff)
+
+    total = retry(lambda: store.size(name))
+    if total is None:
+        raise BackupError(f"Datei {name} wurde auf dem Backup-Ziel nicht gefunden.")
+    stats.total_bytes = total
+
+    part_path = local_path.with_name(f"{local_path.name}.part")
+    state_path = local_path.with_name(f"{local_path.name}.part.json")
+
+    done: set[int] = set()
+    if part_path.exists() and state_path.exists():
+        try:
+            done = _valid_state(json.loads(state_path.read_text()), total, chunk_size)
+        except ValueError:
+            done = set()
+    if not done:
+        with part_path.open("wb") as stream:
+            stream.truncate(total)
+    stats.resumed_bytes = stats.completed_bytes = sum(
+        min(chunk_size, total - offset) for offset in done
+    )
+
+    def read_exact(offset: int, length: int) -> bytes:
+        data = store.read_range(name, offset, length)
+        if len(data) != length:
+            raise EOFError(f"Unvollständiger Block bei Offset {offset}.")
+        return data
+
+    def fetch(offset: int, length: int) -> None:
+        data = retry(lambda: read_exact(offset, length))
+        with part_path.open("r+b") as stream:
+            stream.seek(offset)
+            stream.write(data)
+
+    def on_done(offset: int, length: int) -> None:
+        done.add(offset)
+        stats.completed_bytes += length
+        stats.transferred_bytes += length
+        stats.chunks += 1
+        state_path.write_bytes(_dump_state(total, chunk_size, done))
+        if progress:
+            progress(stats)
+
+    _run_parallel(_chunks(total, chunk_size, done), fetch, workers, on_done)
+    part_path.replace(local_path)
+    state_path.unlink(missing_ok=True)
+
+    stats.finished = time.monotonic()
+    if progress:
+        progress(stats)
+    return stats
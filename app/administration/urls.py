@@ -6,4 +6,5 @@ app_name = "administration"
 
 urlpatterns = [
     path("backup/", views.backup_dashboard, name="backup_dashboard"),
+    path("performance/", views.performance_dashboard, name="performance_dashboard"),
 ]
@@ -2,14 +2,19 @@ from __future__ import annotations
 
 import logging
 
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.admin.views.decorators import staff_member_required
 from django.shortcuts import redirect, render
 from django.utils.translation import gettext_lazy as _
 
+from core.instrumentation import SAMPLES_PER_ROUTE, reset_summaries, route_summaries
+
+from .database import connection_stats
 from .forms import BackupRestoreForm, BackupRunForm
 from .models import BackupDestination, BackupLog
-from .services import BackupError, log_backup_event, restore_database_from_file, run_backup
+from .services import BackupError, log_backup_event, restore_database_from_file, run_backup, start_backup_log
+from .snapshots import run_snapshot_backup
 
 logger = logging.getLogger(__name__)
 
@@ -23,16 +28,21 @@ def backup_dashboard(request):
         if "run_backup" in request.POST:
             if backup_form.is_valid():
                 destination = backup_form.cleaned_data["destination"]
+                log = start_backup_log(destination)
                 try:
-                    file_name = run_backup(destination)
-                    log_backup_event(destination, BackupLog.ACTION_BACKUP, BackupLog.STATUS_SUCCESS, "Backup erfolgreich erstellt.", file_name)
+                    if destination.incremental:
+                        snapshot = run_snapshot_backup(destination, log=log)
+                        log_backup_event(destination, BackupLog.ACTION_BACKUP, BackupLog.STATUS_SUCCESS, snapshot.as_message(), snapshot.file_name, manifest=snapshot.manifest, log=log)
+                    else:
+                        file_name = run_backup(destination, log=log)
+                        log_backup_event(destination, BackupLog.ACTION_BACKUP, BackupLog.STATUS_SUCCESS, "Backup erfolgreich erstellt.", file_name, log=log)
                     messages.success(request, _(f"Backup wurde erfolgreich erstellt und an {destination} übertragen."))
                 except BackupError as exc:
-                    log_backup_event(destination, BackupLog.ACTION_BACKUP, BackupLog.STATUS_FAILURE, str(exc))
+                    log_backup_event(destination, BackupLog.ACTION_BACKUP, BackupLog.STATUS_FAILURE, str(exc), log=log)
                     logger.exception("Backup fehlgeschlagen")
                     messages.error(request, _(f"Backup fehlgeschlagen: {exc}"))
                 except Exception as exc:  # pragma: no cover
-                    log_backup_event(destination, BackupLog.ACTION_BACKUP, BackupLog.STATUS_FAILURE, str(exc))
+                    log_backup_event(destination, BackupLog.ACTION_BACKUP, BackupLog.STATUS_FAILURE, str(exc), log=log)
                     logger.exception("Backup fehlgeschlagen")
                     messages.error(request, _(f"Unbekannter Fehler beim Backup: {exc}"))
                 return redirect("administration:backup_dashboard")
@@ -63,5 +73,21 @@ def backup_dashboard(request):
         "restore_form": restore_form,
         "destinations": destinations,
         "logs": logs,
+        "connection_stats": connection_stats(),
     }
     return render(request, "administration/backup.html", context)
+
+
+@staff_member_required
+def performance_dashboard(request):
+    if request.method == "POST" and "reset" in request.POST:
+        reset_summaries()
+        messages.success(request, _("Messwerte wurden zurückgesetzt."))
+        return redirect("administration:performance_dashboard")
+
+    context = {
+        "enabled": getattr(settings, "REQUEST_INSTRUMENTATION", False),
+        "summaries": route_summaries(),
+        "samples": SAMPLES_PER_ROUTE,
+    }
+    return render(request, "administration/performance.html", context)
@@ -0,0 +1,37 @@
+from django.contrib import admin
+from django.utils.html import format_html, format_html_join
+from django.utils.translation import gettext_lazy as _
+
+from .models import AuditEntry
+
+
+@admin.register(AuditEntry)
+class AuditEntryAdmin(admin.ModelAdmin):
+    list_display = ["created", "action", "content_type", "object_repr", "user"]
+    list_filter = ["action", "content_type", "month"]
+    list_select_related = ["content_type", "user"]
+    search_fields = ["object_repr", "object_id"]
+    date_hierarchy = "created"
+    fields = ["created", "action", "content_type", "object_id", "object_repr", "user", "changes_table"]
+    readonly_fields = fields
+
+    def changes_table(self, obj):
+        rows = format_html_join(
+            "",
+            "<tr><td>{}</td><td>{}</td><td>{}</td></tr>",
+            ((name, old, new) for name, (old, new) in sorted(obj.changes.items())),
+        )
+        return format_html(
+            '<table class="table table-sm"><tr><th>{}</th><th>{}</th><th>{}</th></tr>{}</table>',
+            _("Feld"), _("Vorher"), _("Nachher"), rows,
+        )
+    changes_table.short_description = _("Änderungen")
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,17 @@
+from django.apps import AppConfig
+from django.utils.translation import gettext_lazy as _
+
+
+class AuditConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "audit"
+    verbose_name = _("Änderungsprotokoll")
+
+    def ready(self):
+        from bird.models import Bird, FallenBird
+        from costs.models import Costs
+        from stations.models import WildbirdHelpStation
+
+        from .recorder import track
+
+        track(FallenBird, Bird, Costs, WildbirdHelpStation)
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:49
+
+import django.core.serializers.json
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuditEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(default=django.utils.timezone.now, editable=False, verbose_name='Zeitpunkt')),
+                ('month', models.DateField(editable=False, verbose_name='Monat')),
+                ('object_id', models.CharField(max_length=64, verbose_name='Objekt-ID')),
+                ('object_repr', models.CharField(blank=True, max_length=200, verbose_name='Objekt')),
+                ('action', models.CharField(choices=[('create', 'Angelegt'), ('update', 'Geändert'), ('delete', 'Gelöscht')], max_length=10, verbose_name='Aktion')),
+                ('changes', models.JSONField(default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder, verbose_name='Änderungen')),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, to='contenttypes.contenttype', verbose_name='Typ')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='audit_entries', to=settings.AUTH_USER_MODEL, verbose_name='Benutzer')),
+            ],
+            options={
+                'verbose_name': 'Protokolleintrag',
+                'verbose_name_plural': 'Änderungsprotokoll',
+                'ordering': ['-created', '-id'],
+                'indexes': [models.Index(fields=['month', 'content_type', 'object_id'], name='audit_month_object_idx'), models.Index(fields=['content_type', 'object_id', 'created'], name='audit_object_created_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,67 @@
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+class AuditEntry(models.Model):
+    """Append-only record of one change to a tracked object.
+
+    ``changes`` maps field names to ``[old, new]``. ``month`` holds the first
+    day of the month of the change; history queries filter on it first so
+    they only touch the months they ask for.
+    """
+
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+
+    ACTION_CHOICES = [
+        (CREATE, _("Angelegt")),
+        (UPDATE, _("Geändert")),
+        (DELETE, _("Gelöscht")),
+    ]
+
+    created = models.DateTimeField(default=timezone.now, editable=False, verbose_name=_("Zeitpunkt"))
+    month = models.DateField(editable=False, verbose_name=_("Monat"))
+    content_type = models.ForeignKey(ContentType, on_delete=models.PROTECT, verbose_name=_("Typ"))
+    object_id = models.CharField(max_length=64, verbose_name=_("Objekt-ID"))
+    object_repr = models.CharField(max_length=200, blank=True, verbose_name=_("Objekt"))
+    action = models.CharField(max_length=10, choices=ACTION_CHOICES, verbose_name=_("Aktion"))
+    changes = models.JSONField(encoder=DjangoJSONEncoder, default=dict, verbose_name=_("Änderungen"))
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name="audit_entries",
+        verbose_name=_("Benutzer"),
+    )
+
+    class Meta:
+        verbose_name = _("Protokolleintrag")
+        verbose_name_plural = _("Änderungsprotokoll")
+        ordering = ["-created", "-id"]
+        indexes = [
+            models.Index(fields=["month", "content_type", "object_id"], name="audit_month_object_idx"),
+            models.Index(fields=["content_type", "object_id", "created"], name="audit_object_created_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.get_action_display()}: {self.object_repr} ({self.created:%d.%m.%Y %H:%M})"
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise TypeError("Protokolleinträge können nicht geändert werden.")
+        if self.month is None:
+            self.month = month_of(self.created)
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        raise TypeError("Protokolleinträge können nicht gelöscht werden.")
+
+
+def month_of(moment):
+    return timezone.localtime(moment).date().replace(day=1)
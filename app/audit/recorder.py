@@ -0,0 +1,180 @@
+"""Field-level change tracking through model signals.
+
+Changes are collected while a request runs and written with a single
+``bulk_create`` when it ends. An entry is only queued once the surrounding
+transaction commits, so rolled back changes leave no trace. Outside of
+:func:`collect` every committed change is written on its own.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Optional
+
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.search import SearchVectorField
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.db import router, transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+
+from .models import AuditEntry, month_of
+
+PREVIOUS_ATTR = "_audit_previous"
+
+_buffer: ContextVar[Optional[list[AuditEntry]]] = ContextVar("audit_buffer", default=None)
+# Holds a callable: asgiref compares context values when it switches
+# threads, and comparing a lazy request user would load it from there.
+_user: ContextVar[Callable[[], Any]] = ContextVar("audit_user", default=lambda: None)
+
+
+def _tracked_fields(model) -> list:
+    # Timestamps maintained by Django and search vectors maintained by the
+    # database would show up in every update.
+    return [
+        field
+        for field in model._meta.concrete_fields
+        if not field.primary_key
+        and not getattr(field, "auto_now", False)
+        and not isinstance(field, SearchVectorField)
+    ]
+
+
+def _normalize(field, value):
+    try:
+        return field.to_python(value)
+    except ValidationError:
+        return value
+
+
+def _snapshot(instance) -> dict[str, Any]:
+    return {
+        field.attname: _normalize(field, field.value_from_object(instance))
+        for field in _tracked_fields(type(instance))
+    }
+
+
+def _describe(instance) -> str:
+    try:
+        return str(instance)[:200]
+    except ObjectDoesNotExist:
+        # Related rows may already be gone while a cascade deletes the object.
+        return f"{instance._meta.verbose_name} {instance.pk}"
+
+
+def _current_user_id() -> Optional[int]:
+    user = _user.get()()
+    if user is None or not getattr(user, "is_authenticated", False):
+        return None
+    return user.pk
+
+
+def _queue(instance, action: str, changes: dict) -> None:
+    entry = AuditEntry(
+        content_type=ContentType.objects.get_for_model(instance),
+        object_id=str(instance.pk),
+        object_repr=_describe(instance),
+        action=action,
+        changes=changes,
+        user_id=_current_user_id(),
+    )
+    entry.month = month_of(entry.created)
+
+    def append():
+        buffer = _buffer.get()
+        if buffer is None:
+            AuditEntry.objects.bulk_create([entry])
+        else:
+            buffer.append(entry)
+
+    transaction.on_commit(append, using=router.db_for_write(type(instance), instance=instance))
+
+
+def _remember_previous(sender, instance, raw=False, **kwargs) -> None:
+    previous = None
+    if not raw and not instance._state.adding and instance.pk is not None:
+        fields = _tracked_fields(sender)
+        row = sender._base_manager.filter(pk=instance.pk).values(*(field.attname for field in fields)).first()
+        if row is not None:
+            previous = {field.attname: _normalize(field, row[field.attname]) for field in fields}
+    setattr(instance, PREVIOUS_ATTR, previous)
+
+
+def _record_save(sender, instance, created, raw=False, **kwargs) -> None:
+    if raw:
+        return
+    current = _snapshot(instance)
+    previous = instance.__dict__.pop(PREVIOUS_ATTR, None)
+    if created or previous is None:
+        changes = {name: [None, value] for name, value in current.items() if value not in (None, "")}
+        _queue(instance, AuditEntry.CREATE, changes)
+        return
+    changes = {name: [previous[name], value] for name, value in current.items() if previous[name] != value}
+    if changes:
+        _queue(instance, AuditEntry.UPDATE, changes)
+
+
+def _record_delete(sender, instance, **kwargs) -> None:
+    changes = {name: [value, None] for name, value in _snapshot(instance).items() if value not in (None, "")}
+    _queue(instance, AuditEntry.DELETE, changes)
+
+
+def track(*models) -> None:
+    """Record creates, updates and deletes of ``models``.
+
+    Bulk operations such as ``QuerySet.update()`` send no signals and are
+    not recorded.
+    """
+
+    for model in models:
+        uid = f"audit:{model._meta.label}"
+        pre_save.connect(_remember_previous, sender=model, dispatch_uid=f"{uid}:pre_save")
+        post_save.connect(_record_save, sender=model, dispatch_uid=f"{uid}:post_save")
+        post_delete.connect(_record_delete, sender=model, dispatch_uid=f"{uid}:post_delete")
+
+
+@contextmanager
+def collect(user=None):
+    """Buffer the entries of the block and write them with one query.
+
+    :param user: User the changes are attributed to, may be a lazy object.
+    """
+
+    buffer: list[AuditEntry] = []
+    buffer_token = _buffer.set(buffer)
+    user_token = _user.set(lambda: user)
+    try:
+        yield buffer
+    finally:
+        _buffer.reset(buffer_token)
+        _user.reset(user_token)
+        if buffer:
+            AuditEntry.objects.bulk_create(buffer)
+
+
+def history(obj, since=None):
+    """Return the entries of ``obj``, newest first.
+
+    :param obj: Tracked model instance.
+    :param since: Optional timezone-aware datetime; older entries are skipped
+        by month before the exact timestamp is compared.
+    """
+
+    entries = AuditEntry.objects.filter(
+        content_type=ContentType.objects.get_for_model(obj),
+        object_id=str(obj.pk),
+    )
+    if since is not None:
+        entries = entries.filter(month__gte=month_of(since), created__gte=since)
+    return entries.select_related("user")
+
+
+class AuditMiddleware:
+    """Attribute changes to the request user and write them once per request."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with collect(user=getattr(request, "user", None)):
+            return self.get_response(request)
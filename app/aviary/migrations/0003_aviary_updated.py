@@ -0,0 +1,18 @@
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aviary', '0002_aviary_capacity_aviary_contact_email_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='aviary',
+            name='updated',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name='Geändert am'),
+            preserve_default=False,
+        ),
+    ]
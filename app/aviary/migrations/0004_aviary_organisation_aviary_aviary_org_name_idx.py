@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-19 20:03
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aviary', '0003_aviary_updated'),
+        ('tenants', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='aviary',
+            name='organisation',
+            field=models.ForeignKey(blank=True, db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='tenants.organisation', verbose_name='Organisation'),
+        ),
+        migrations.AddIndex(
+            model_name='aviary',
+            index=models.Index(fields=['organisation', 'name'], name='aviary_org_name_idx'),
+        ),
+    ]
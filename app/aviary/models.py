@@ -5,6 +5,8 @@ from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 
+from tenants.models import TenantScoped
+
 
 CHOICE_AVIARY = [
     ("Offen", "Offen"),
@@ -13,7 +15,7 @@ CHOICE_AVIARY = [
 ]
 
 
-class Aviary(models.Model):
+class Aviary(TenantScoped):
     id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
     
     # Required fields expected by tests (temporary nullable for migration)
@@ -53,6 +55,7 @@ class Aviary(models.Model):
         blank=True, null=True
     )
     last_ward_round = models.DateField(verbose_name=_("letzte Visite"), blank=True, null=True)
+    updated = models.DateTimeField(auto_now=True, verbose_name=_("Geändert am"))
     comment = models.CharField(
         max_length=512, blank=True, null=True, verbose_name=_("Bemerkungen")
     )
@@ -60,6 +63,7 @@ class Aviary(models.Model):
     class Meta:
         verbose_name = _("Voliere")
         verbose_name_plural = _("Volieren")
+        indexes = [models.Index(fields=["organisation", "name"], name="aviary_org_name_idx")]
 
     def __str__(self):
         return self.name or self.description or f"Voliere {self.id}"
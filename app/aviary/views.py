@@ -39,7 +39,11 @@ def aviary_create(request):
 @login_required(login_url="account_login")
 def aviary_single(request, id):
     aviary = Aviary.objects.get(id=id)
-    birds = FallenBird.objects.filter(aviary_id=id).order_by("created")
+    birds = (
+        FallenBird.objects.filter(aviary_id=id)
+        .select_related("bird", "find_circumstances")
+        .order_by("created")
+    )
     form = AviaryEditForm(request.POST or None, instance=aviary)
     if request.method == "POST":
         if form.is_valid():
@@ -2,12 +2,22 @@ from django.contrib import admin
 from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 from django.urls import reverse
-from django.db.models import Q
+from django.db.models import Count, Q
 from datetime import date
 
+from tenants.scope import ALL, current
+
 from .models import Bird, FallenBird, BirdStatus, Circumstance
 
 
+def patient_count():
+    """Count the patients of the active organisation; reverse relations are unscoped."""
+    organisation_id = current()
+    if organisation_id is ALL:
+        return Count("fallenbird")
+    return Count("fallenbird", filter=Q(fallenbird__organisation_id=organisation_id))
+
+
 @admin.register(FallenBird)
 class FallenBirdAdmin(admin.ModelAdmin):
     """Comprehensive admin interface for all bird patients (including closed cases)."""
@@ -277,21 +287,27 @@ class BirdAdmin(admin.ModelAdmin):
 class BirdStatusAdmin(admin.ModelAdmin):
     list_display = ["id", "description", "usage_count"]
     ordering = ["id"]
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(patient_count=patient_count())
     
     def usage_count(self, obj):
         """Show how many birds have this status."""
-        count = FallenBird.objects.filter(status=obj).count()
-        return f"{count} Patienten"
+        return f"{obj.patient_count} Patienten"
     usage_count.short_description = _('Verwendung')
+    usage_count.admin_order_field = 'patient_count'
 
 
 @admin.register(Circumstance)
 class CircumstanceAdmin(admin.ModelAdmin):
     list_display = ["description", "usage_count"]
     ordering = ["description"]
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(patient_count=patient_count())
     
     def usage_count(self, obj):
         """Show how many birds have this circumstance."""
-        count = FallenBird.objects.filter(find_circumstances=obj).count()
-        return f"{count} Patienten"
+        return f"{obj.patient_count} Patienten"
     usage_count.short_description = _('Verwendung')
+    usage_count.admin_order_field = 'patient_count'
@@ -6,3 +6,15 @@ class BirdConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "bird"
     verbose_name = _("Vögel")
+
+    def ready(self):
+        from core.cache import invalidate_on_change
+
+        from aviary.models import Aviary
+        from costs.models import Costs
+
+        from .models import Bird, BirdStatus, Circumstance, FallenBird
+
+        invalidate_on_change("bird", Bird)
+        # Everything shown in the table of patients in treatment.
+        invalidate_on_change("patient_list", FallenBird, Costs, Bird, Aviary, BirdStatus, Circumstance)
@@ -3,6 +3,8 @@ from datetime import date
 from django import forms
 from django.utils.translation import gettext_lazy as _
 
+from tenants.forms import TenantScopedFormMixin
+
 from .models import FallenBird, Bird
 
 
@@ -64,7 +66,7 @@ class BirdAddForm(forms.ModelForm):
         )
 
 
-class BirdEditForm(forms.ModelForm):
+class BirdEditForm(TenantScopedFormMixin, forms.ModelForm):
     class Meta:
         widgets = {"date_found": DateInput(format="%Y-%m-%d")}
         model = FallenBird
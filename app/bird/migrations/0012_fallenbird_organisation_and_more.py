@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-19 20:03
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aviary', '0004_aviary_organisation_aviary_aviary_org_name_idx'),
+        ('bird', '0011_alter_fallenbird_options'),
+        ('tenants', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='fallenbird',
+            name='organisation',
+            field=models.ForeignKey(blank=True, db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='tenants.organisation', verbose_name='Organisation'),
+        ),
+        migrations.AddIndex(
+            model_name='fallenbird',
+            index=models.Index(fields=['organisation', 'date_found'], name='patient_org_found_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='fallenbird',
+            index=models.Index(fields=['organisation', 'status'], name='patient_org_status_idx'),
+        ),
+    ]
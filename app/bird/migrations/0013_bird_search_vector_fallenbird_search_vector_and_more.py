@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-19 20:08
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aviary', '0004_aviary_organisation_aviary_aviary_org_name_idx'),
+        ('bird', '0012_fallenbird_organisation_and_more'),
+        ('tenants', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bird',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='fallenbird',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='bird',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='bird_search_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='fallenbird',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='patient_search_idx'),
+        ),
+    ]
@@ -2,12 +2,15 @@ from datetime import date
 from uuid import uuid4
 
 from django.conf import settings
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, transaction
 from django.utils.translation import gettext_lazy as _
 
 from django_ckeditor_5.fields import CKEditor5Field
 
 from aviary.models import Aviary
+from tenants.models import TenantScoped
 
 
 CHOICE_AGE = [
@@ -30,7 +33,7 @@ def costs_default():
     return [{"date": date.today().strftime("%Y-%m-%d"), "cost_entry": "0.00"}]
 
 
-class FallenBird(models.Model):
+class FallenBird(TenantScoped):
     id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
     bird_identifier = models.CharField(
         max_length=256, blank=True, null=True, verbose_name=_("Patienten Alias")
@@ -117,10 +120,16 @@ class FallenBird(models.Model):
         verbose_name=_("Finder"),
         default="Vorname: \nNachname: \nStraße: \nHausnummer: \nStadt: \nPLZ: \nTelefonnummer: ",
     )
+    search_vector = SearchVectorField(null=True, editable=False)
 
     class Meta:
         verbose_name = _("Patient")
         verbose_name_plural = _("Patienten")
+        indexes = [
+            models.Index(fields=["organisation", "date_found"], name="patient_org_found_idx"),
+            models.Index(fields=["organisation", "status"], name="patient_org_status_idx"),
+            GinIndex(fields=["search_vector"], name="patient_search_idx"),
+        ]
 
     def save(self, *args, **kwargs):
         """Override save to automatically set patient_file_close_date when status changes to closed states."""
@@ -144,7 +153,9 @@ class FallenBird(models.Model):
                 # This shouldn't happen in normal circumstances, but handle gracefully
                 pass
         
-        super().save(*args, **kwargs)
+        # Signal receivers such as the webhook outbox write in the same transaction.
+        with transaction.atomic(using=kwargs.get("using")):
+            super().save(*args, **kwargs)
 
     def __str__(self):
         bird_name = str(self.bird) if self.bird else "Unbekannt"
@@ -238,11 +249,13 @@ class Bird(models.Model):
         default=True,
         verbose_name=_("Melden an Wildvogelhilfe-Team")
     )
+    search_vector = SearchVectorField(null=True, editable=False)
 
     class Meta:
         verbose_name = _("Vogel")
         verbose_name_plural = _("Vögel")
         ordering = ["name"]
+        indexes = [GinIndex(fields=["search_vector"], name="bird_search_idx")]
 
     def __str__(self):
         return self.name or f"Bird {self.id}"
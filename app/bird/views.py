@@ -4,11 +4,13 @@ The docstrings follow ``:param`` / ``:returns`` conventions to keep the module
 compatible with Doxygen generated documentation.
 """
 
+import asyncio
 import logging
 
 import names
 from smtplib import SMTPException
 
+from asgiref.sync import async_to_sync, sync_to_async
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.conf import settings
@@ -17,6 +19,7 @@ from django.db.models import Q, Sum
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import redirect, render
 
+from core.cache import cache_policy, get_or_build, latest_update, scoped_version, tenant_namespace
 from sendemail.message import messagebody
 from sendemail.models import Emailadress
 
@@ -51,6 +54,45 @@ def _collect_notification_recipients(bird: Bird) -> list[str]:
     )
 
 
+def _send_intake_notification(patient: FallenBird, recipients: list[str]) -> None:
+    """Send the intake e-mail for a single patient.
+
+    :param patient: Newly created patient.
+    :param recipients: Addresses that receive the notification.
+    """
+
+    send_mail(
+        subject=f"Wildvogel gefunden! (Patient: {patient.bird_identifier})",
+        message=messagebody(
+            patient.date_found,
+            patient.bird,
+            patient.place,
+            patient.diagnostic_finding,
+            patient.bird_identifier,
+        ),
+        from_email=getattr(settings, "DEFAULT_FROM_EMAIL", "noreply@example.com"),
+        recipient_list=recipients,
+    )
+
+
+async def send_intake_notifications(patients: list[FallenBird], recipients: list[str]) -> list[BaseException | None]:
+    """Send the intake e-mails of all ``patients`` concurrently.
+
+    Each SMTP conversation runs in its own worker thread, so several
+    patients from one intake do not wait for each other.
+
+    :param patients: Newly created patients.
+    :param recipients: Addresses that receive the notifications.
+    :returns: One entry per patient, the raised exception or ``None``.
+    """
+
+    send = sync_to_async(_send_intake_notification, thread_sensitive=False)
+    return await asyncio.gather(
+        *(send(patient, recipients) for patient in patients),
+        return_exceptions=True,
+    )
+
+
 @login_required(login_url="account_login")
 def bird_create(request: HttpRequest) -> HttpResponse:
     """Create one or multiple ``FallenBird`` instances from the add form.
@@ -89,25 +131,14 @@ def bird_create(request: HttpRequest) -> HttpResponse:
 
                 created_patients.append(patient)
 
-                if notification_recipients:
-                    try:
-                        send_mail(
-                            subject=f"Wildvogel gefunden! (Patient: {unique_identifier})",
-                            message=messagebody(
-                                patient.date_found,
-                                patient.bird,
-                                patient.place,
-                                patient.diagnostic_finding,
-                                unique_identifier,
-                            ),
-                            from_email=getattr(
-                                settings, "DEFAULT_FROM_EMAIL", "noreply@example.com"
-                            ),
-                            recipient_list=notification_recipients,
-                        )
-                    except BadHeaderError:
+            if notification_recipients:
+                errors = async_to_sync(send_intake_notifications)(
+                    created_patients, notification_recipients
+                )
+                for exc in errors:
+                    if isinstance(exc, BadHeaderError):
                         return HttpResponse("Invalid header found.")
-                    except SMTPException as exc:
+                    if isinstance(exc, SMTPException):
                         # Use messages framework to surface delivery issues without failing the request.
                         messages.warning(
                             request,
@@ -115,7 +146,9 @@ def bird_create(request: HttpRequest) -> HttpResponse:
                             extra_tags="email-failure",
                             fail_silently=True,
                         )
-                        logger.exception("Error sending intake email")
+                        logger.error("Error sending intake email", exc_info=exc)
+                    elif exc is not None:
+                        raise exc
 
             request.session["rescuer_id"] = None
 
@@ -139,7 +172,14 @@ def bird_create(request: HttpRequest) -> HttpResponse:
     return render(request, "bird/bird_create.html", context)
 
 
+def _species_by_name() -> list[Bird]:
+    """Return all ``Bird`` species sorted by name from the ``bird`` cache."""
+
+    return get_or_build("bird", ("species",), lambda: list(Bird.objects.order_by("name")))
+
+
 @login_required(login_url="account_login")
+@cache_policy("bird")
 def bird_help(request: HttpRequest) -> HttpResponse:
     """Render a help view containing all ``Bird`` species.
 
@@ -147,12 +187,13 @@ def bird_help(request: HttpRequest) -> HttpResponse:
     :returns: Rendered help template with the ``Bird`` queryset.
     """
 
-    birds = Bird.objects.all().order_by("name")
-    context = {"birds": birds}
+    birds = _species_by_name()
+    context = {"birds": birds, "species_updated": latest_update(birds)}
     return render(request, "bird/bird_help.html", context)
 
 
 @login_required(login_url="account_login")
+@cache_policy("bird")
 def bird_help_single(request: HttpRequest, id: int) -> HttpResponse:
     """Show help information for a single ``Bird`` species.
 
@@ -161,7 +202,7 @@ def bird_help_single(request: HttpRequest, id: int) -> HttpResponse:
     :returns: Rendered template for the selected bird.
     """
 
-    bird = Bird.objects.get(id=id)
+    bird = get_or_build("bird", ("help", id), lambda: Bird.objects.get(id=id))
     context = {"bird": bird}
     return render(request, "bird/bird_help_single.html", context)
 
@@ -176,10 +217,13 @@ def bird_all(request: HttpRequest) -> HttpResponse:
 
     birds = (
         FallenBird.objects.filter(Q(status="1") | Q(status="2"))
+        .select_related("bird", "status", "aviary")
         .annotate(total_costs=Sum("costs__costs"))
         .order_by("date_found")
     )
-    context = {"birds": birds}
+    # The table is cached as a whole; its query only runs on a cache miss.
+    namespace = tenant_namespace("patient_list")
+    context = {"birds": birds, "table_key": f"{namespace}:{scoped_version(namespace)}"}
     return render(request, "bird/bird_all.html", context)
 
 
@@ -193,6 +237,7 @@ def bird_inactive(request: HttpRequest) -> HttpResponse:
 
     birds = (
         FallenBird.objects.filter(~Q(status="1") & ~Q(status="2"))
+        .select_related("bird", "status")
         .annotate(total_costs=Sum("costs__costs"))
         .order_by("date_found")
     )
@@ -243,6 +288,7 @@ def bird_delete(request: HttpRequest, id: str) -> HttpResponse:
 
 
 @login_required(login_url="account_login")
+@cache_policy("bird")
 def bird_species_list(request: HttpRequest) -> HttpResponse:
     """List all bird species with their notification settings.
 
@@ -250,8 +296,7 @@ def bird_species_list(request: HttpRequest) -> HttpResponse:
     :returns: Rendered species list template.
     """
 
-    birds = Bird.objects.all().order_by("name")
-    context = {"birds": birds}
+    context = {"birds": _species_by_name()}
     return render(request, "bird/bird_species_list.html", context)
 
 
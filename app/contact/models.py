@@ -2,11 +2,15 @@ from django.db import models
 from uuid import uuid4
 
 from django.contrib.auth.models import User
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 
+from tenants.models import TenantScoped
 
-class Contact(models.Model):
+
+class Contact(TenantScoped):
     id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
     
     # Required fields expected by tests (temporary nullable for migration)
@@ -62,10 +66,16 @@ class Contact(models.Model):
         verbose_name=_("Tag"),
     )
 
+    search_vector = SearchVectorField(null=True, editable=False)
+
     class Meta:
         verbose_name = _("Kontakt")
         verbose_name_plural = _("Kontakte")
         ordering = ['last_name', 'first_name']
+        indexes = [
+            models.Index(fields=['organisation', 'last_name', 'first_name'], name='contact_org_name_idx'),
+            GinIndex(fields=['search_vector'], name='contact_search_idx'),
+        ]
 
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
@@ -6,6 +6,6 @@ from .models import Contact
 
 @login_required(login_url="account_login")
 def contact_all(request):
-    contacts = Contact.objects.all()
+    contacts = Contact.objects.select_related("tag_id")
     context = {"contacts": contacts}
     return render(request, "contact/contact_all.html", context)
@@ -0,0 +1,186 @@
+"""Namespaced caching helpers shared by the apps.
+
+Every app caches its data below its own namespace. A namespace carries a
+version number that is bumped by model signals, so invalidating a namespace
+never needs to know which keys were written.
+
+Template fragments use Django's ``{% cache %}`` tag and are keyed by the
+``updated`` timestamps of the rendered objects, e.g.
+``{% cache 86400 bird_help_description bird.pk bird.updated %}``. Lists use
+:func:`latest_update`; data without timestamps adds a namespace version.
+
+Data of a single organisation lives in a tenant namespace such as
+``statistic@3`` (see :func:`tenant_namespace`). A change to a record of one
+organisation only invalidates its own namespace and the unscoped one, while
+shared data like species still invalidates every organisation at once.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from functools import wraps
+from typing import Any, Callable, Iterable
+
+from django.core.cache import cache
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition
+
+from tenants.scope import ALL, current
+
+def _version_key(namespace: str) -> str:
+    return f"{namespace}:version"
+
+
+def namespace_version(namespace: str) -> int:
+    """Return the current version of ``namespace``.
+
+    :param namespace: Name of the cache namespace, usually the app label.
+    :returns: Version number that is part of every key in the namespace.
+    """
+
+    version = cache.get(_version_key(namespace))
+    if version is None:
+        # Start from the clock so a namespace evicted from the cache does
+        # not reuse the version of older entries.
+        version = time.time_ns()
+        cache.add(_version_key(namespace), version, timeout=None)
+        version = cache.get(_version_key(namespace), version)
+    return version
+
+
+def tenant_namespace(namespace: str) -> str:
+    """Return the namespace of the active organisation below ``namespace``."""
+
+    return f"{namespace}@{current()}"
+
+
+def scoped_version(namespace: str) -> str:
+    """Return the version of ``namespace`` including its parent namespace."""
+
+    parent, separator, _tenant = namespace.partition("@")
+    if not separator:
+        return str(namespace_version(namespace))
+    return f"{namespace_version(parent)}.{namespace_version(namespace)}"
+
+
+def invalidate(namespace: str) -> None:
+    """Drop all entries of ``namespace`` by moving to a new version."""
+
+    try:
+        cache.incr(_version_key(namespace))
+    except ValueError:
+        cache.set(_version_key(namespace), time.time_ns(), timeout=None)
+
+
+def latest_update(objects: Iterable[Any], field: str = "updated") -> str:
+    """Return a fragment key part describing a list of objects.
+
+    :param objects: Model instances carrying a timestamp field.
+    :param field: Name of the timestamp field.
+    :returns: Number of objects and their newest timestamp.
+    """
+
+    objects = list(objects)
+    timestamps = [getattr(obj, field) for obj in objects if getattr(obj, field, None)]
+    newest = max(timestamps).isoformat() if timestamps else "-"
+    return f"{len(objects)}:{newest}"
+
+
+def make_key(namespace: str, *parts: Any) -> str:
+    """Build a versioned cache key inside ``namespace``."""
+
+    suffix = ":".join(str(part) for part in parts)
+    return f"{namespace}:{scoped_version(namespace)}:{suffix}"
+
+
+def get_or_build(namespace: str, parts: Iterable[Any], builder: Callable[[], Any], timeout: int | None = None) -> Any:
+    """Return the cached value for ``parts`` or store the result of ``builder``.
+
+    :param namespace: Cache namespace the value belongs to.
+    :param parts: Values identifying the entry inside the namespace.
+    :param builder: Callable computing the value on a cache miss.
+    :param timeout: Lifetime in seconds, ``None`` uses the backend default.
+    :returns: Cached or freshly built value.
+    """
+
+    key = make_key(namespace, *parts)
+    value = cache.get(key)
+    if value is None:
+        value = builder()
+        if timeout is None:
+            cache.set(key, value)
+        else:
+            cache.set(key, value, timeout)
+    return value
+
+
+def invalidate_on_change(namespace: str, *models) -> None:
+    """Invalidate ``namespace`` whenever one of ``models`` is saved or deleted.
+
+    Many-to-many relations of the models are watched as well. Changes to
+    records of an organisation only invalidate its tenant namespace and the
+    unscoped one.
+    """
+
+    def receiver(sender, **kwargs):
+        if not kwargs.get("action", "post_").startswith("post_"):
+            return
+        instance = kwargs.get("instance")
+        if hasattr(instance, "organisation_id"):
+            invalidate(f"{namespace}@{instance.organisation_id}")
+            invalidate(f"{namespace}@{ALL}")
+        else:
+            invalidate(namespace)
+
+    # The receiver is a closure, so the signals must hold a strong reference.
+    for model in models:
+        uid = f"cache:{namespace}:{model._meta.label}"
+        post_save.connect(receiver, sender=model, weak=False, dispatch_uid=f"{uid}:save")
+        post_delete.connect(receiver, sender=model, weak=False, dispatch_uid=f"{uid}:delete")
+        for field in model._meta.local_many_to_many:
+            m2m_changed.connect(
+                receiver,
+                sender=field.remote_field.through,
+                weak=False,
+                dispatch_uid=f"{uid}:{field.name}",
+            )
+
+
+def cache_policy(*namespaces: str, per_tenant: bool = False) -> Callable:
+    """Let browsers revalidate a view against the versions of ``namespaces``.
+
+    The ETag combines the namespace versions with the session, the requested
+    URL and the current date. As long as none of the watched models changed,
+    a revalidating browser gets a ``304`` without the view being rendered.
+    Responses stay private because the pages contain per-user content.
+    With ``per_tenant`` the namespaces of the active organisation are used.
+    """
+
+    def etag(request, *args, **kwargs) -> str:
+        watched = [tenant_namespace(namespace) for namespace in namespaces] if per_tenant else namespaces
+        parts = [scoped_version(namespace) for namespace in watched]
+        session = getattr(request, "session", None)
+        parts += [
+            getattr(request.user, "pk", None),
+            session.session_key if session is not None else None,
+            request.get_full_path(),
+            timezone.localdate().isoformat(),
+        ]
+        source = ":".join(str(part) for part in parts).encode("utf-8")
+        return hashlib.md5(source, usedforsecurity=False).hexdigest()
+
+    def decorator(view_func: Callable) -> Callable:
+        conditional_view = condition(etag_func=etag)(view_func)
+
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            response = conditional_view(request, *args, **kwargs)
+            patch_cache_control(response, private=True, max_age=0, must_revalidate=True)
+            return response
+
+        return wrapper
+
+    return decorator
@@ -10,7 +10,6 @@ CSP_DEFAULT_SRC = (
 CSP_STYLE_SRC = (
     "'self'",
     "'unsafe-inline'",
-    "https://bootswatch.com",
     "https://cdn.datatables.net",
     "https://cdnjs.cloudflare.com",
     "https://fonts.googleapis.com",
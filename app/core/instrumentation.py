@@ -0,0 +1,238 @@
+"""Opt-in instrumentation of SQL queries, template rendering and latency.
+
+With ``REQUEST_INSTRUMENTATION`` enabled every response carries a
+``Server-Timing`` header with query count, database time, template render
+time and total latency. The last samples of each route are kept in the cache
+so the administration can show a summary across all worker processes.
+
+Statements that run more than once within a request with the same SQL,
+ignoring parameters and literals, are flagged as duplicates; they usually
+point to N+1 patterns. Repeats with identical parameters are counted
+separately, as they could be avoided entirely.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.template.backends.django import Template as DjangoTemplate
+
+logger = logging.getLogger(__name__)
+
+SAMPLES_PER_ROUTE = 200
+SUMMARY_TIMEOUT = 7 * 24 * 3600
+ROUTES_KEY = "instrumentation:routes"
+
+_current: ContextVar[Optional["RequestMetrics"]] = ContextVar("request_metrics", default=None)
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_VALUE_LISTS = re.compile(r"\((?:\s*(?:%s|\?)\s*,)+\s*(?:%s|\?)\s*\)")
+
+
+def normalize_sql(sql: str) -> str:
+    """Return ``sql`` without literals and with ``IN`` lists of any length collapsed."""
+
+    sql = _LITERALS.sub("?", sql)
+    sql = _VALUE_LISTS.sub("(...)", sql)
+    return " ".join(sql.split())
+
+
+@dataclass(slots=True)
+class RequestMetrics:
+    """Measurements of a single request, also used as query execute wrapper."""
+
+    queries: int = 0
+    db_time: float = 0.0
+    template_time: float = 0.0
+    template_depth: int = 0
+    statements: Counter = field(default_factory=Counter)
+    similar: Counter = field(default_factory=Counter)
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - start
+            self.queries += 1
+            self.statements[(sql, repr(params))] += 1
+            self.similar[normalize_sql(sql)] += 1
+
+    @property
+    def duplicates(self) -> list[tuple[str, int]]:
+        """Return ``(sql, executions)`` of similar statements run more than once, most frequent first."""
+
+        return [(sql, count) for sql, count in self.similar.most_common() if count > 1]
+
+    @property
+    def identical_repeats(self) -> int:
+        """Number of executions that repeated an earlier statement with the same parameters."""
+
+        return sum(count - 1 for count in self.statements.values())
+
+    def server_timing(self, total: float) -> str:
+        duplicates = sum(count - 1 for _sql, count in self.duplicates)
+        return ", ".join(
+            [
+                f'db;dur={self.db_time * 1000:.1f};desc="SQL: {self.queries} Abfragen, '
+                f'{duplicates} doppelt ({self.identical_repeats} identisch)"',
+                f'tpl;dur={self.template_time * 1000:.1f};desc="Templates"',
+                f'total;dur={total * 1000:.1f};desc="Gesamt"',
+            ]
+        )
+
+
+@dataclass(slots=True)
+class RouteSummary:
+    route: str
+    requests: int
+    avg_ms: float
+    p95_ms: float
+    avg_queries: float
+    max_queries: int
+    avg_db_ms: float
+    avg_template_ms: float
+    duplicate_requests: int
+    duplicate_sql: str
+
+
+def _instrument_templates() -> None:
+    """Time top-level template renders of requests being measured."""
+
+    if getattr(DjangoTemplate.render, "instrumented", False):
+        return
+    original = DjangoTemplate.render
+
+    @wraps(original)
+    def render(self, context=None, request=None):
+        metrics = _current.get()
+        if metrics is None:
+            return original(self, context, request)
+        metrics.template_depth += 1
+        start = time.perf_counter()
+        try:
+            return original(self, context, request)
+        finally:
+            metrics.template_depth -= 1
+            # Templates rendered from template tags are part of the outer render.
+            if metrics.template_depth == 0:
+                metrics.template_time += time.perf_counter() - start
+
+    render.instrumented = True
+    DjangoTemplate.render = render
+
+
+def _route_key(route: str) -> str:
+    return f"instrumentation:route:{hashlib.md5(route.encode('utf-8'), usedforsecurity=False).hexdigest()}"
+
+
+def route_label(request) -> Optional[str]:
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return None
+    return f"{request.method} /{match.route}"
+
+
+def record_sample(route: str, metrics: RequestMetrics, total: float) -> None:
+    """Append the measurements of one request to the rolling samples of ``route``."""
+
+    duplicates = metrics.duplicates
+    sample = {
+        "total_ms": total * 1000,
+        "db_ms": metrics.db_time * 1000,
+        "template_ms": metrics.template_time * 1000,
+        "queries": metrics.queries,
+        "duplicate_sql": duplicates[0][0][:500] if duplicates else "",
+    }
+    # Samples are read-modify-written without locking; losing a sample to a
+    # concurrent request is acceptable for these statistics.
+    samples = cache.get(_route_key(route), [])
+    samples = (samples + [sample])[-SAMPLES_PER_ROUTE:]
+    cache.set(_route_key(route), samples, SUMMARY_TIMEOUT)
+    routes = cache.get(ROUTES_KEY, set())
+    if route not in routes:
+        cache.set(ROUTES_KEY, routes | {route}, SUMMARY_TIMEOUT)
+
+
+def route_summaries() -> list[RouteSummary]:
+    """Summarise the recorded samples per route, slowest routes first."""
+
+    summaries = []
+    for route in cache.get(ROUTES_KEY, set()):
+        samples = cache.get(_route_key(route))
+        if not samples:
+            continue
+        count = len(samples)
+        latencies = sorted(sample["total_ms"] for sample in samples)
+        flagged = [sample["duplicate_sql"] for sample in samples if sample["duplicate_sql"]]
+        summaries.append(
+            RouteSummary(
+                route=route,
+                requests=count,
+                avg_ms=sum(latencies) / count,
+                p95_ms=latencies[int(0.95 * (count - 1))],
+                avg_queries=sum(sample["queries"] for sample in samples) / count,
+                max_queries=max(sample["queries"] for sample in samples),
+                avg_db_ms=sum(sample["db_ms"] for sample in samples) / count,
+                avg_template_ms=sum(sample["template_ms"] for sample in samples) / count,
+                duplicate_requests=len(flagged),
+                duplicate_sql=flagged[-1] if flagged else "",
+            )
+        )
+    return sorted(summaries, key=lambda summary: summary.avg_ms, reverse=True)
+
+
+def reset_summaries() -> None:
+    for route in cache.get(ROUTES_KEY, set()):
+        cache.delete(_route_key(route))
+    cache.delete(ROUTES_KEY)
+
+
+class QueryInstrumentationMiddleware:
+    """Measure queries, template rendering and latency of each request.
+
+    The middleware is synchronous; under ASGI enabling it runs the whole
+    request in a thread, which is fine for a diagnostic setting.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "REQUEST_INSTRUMENTATION", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        _instrument_templates()
+
+    def __call__(self, request) -> Any:
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for alias in connections:
+                    stack.enter_context(connections[alias].execute_wrapper(metrics))
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        total = time.perf_counter() - start
+
+        response["Server-Timing"] = metrics.server_timing(total)
+        route = route_label(request)
+        if route is not None:
+            record_sample(route, metrics, total)
+            duplicates = metrics.duplicates
+            if duplicates:
+                sql, count = duplicates[0]
+                logger.warning("%s: %d mehrfach ausgeführte Abfragen, z. B. %dx %s", route, len(duplicates), count, sql[:200])
+        return response
@@ -66,6 +66,12 @@ JAZZMIN_SETTINGS = {
     #  "order_with_respect_to": ["auth", "books", "books.author", "books.book"],
     # Custom links to append to app groups, keyed on app name
     "custom_links": {
+        "administration": [{
+            "name": "Performance",
+            "url": "/admin/administration/performance/",
+            "icon": "fas fa-tachometer-alt",
+            "permissions": ["is_staff"]
+        }],
         "reports": [{
             "name": "Reports Dashboard",
             "url": "/admin/reports/",
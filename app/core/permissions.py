@@ -0,0 +1,42 @@
+"""Request-scoped access to the group memberships of the current user.
+
+The group names are loaded with a single query the first time a request asks
+for them and are kept on the user object, which lives exactly as long as the
+request. Templates read them through the ``user_groups`` context processor or
+the ``group_check`` filter.
+"""
+
+from __future__ import annotations
+
+from django.utils.functional import SimpleLazyObject
+
+GROUP_CACHE_ATTR = "_group_names_cache"
+
+
+def group_names(user) -> frozenset[str]:
+    """Return the names of the groups ``user`` belongs to.
+
+    :param user: User instance or ``AnonymousUser``.
+    :returns: Group names, loaded once per user instance.
+    """
+
+    if not getattr(user, "is_authenticated", False):
+        return frozenset()
+    names = getattr(user, GROUP_CACHE_ATTR, None)
+    if names is None:
+        names = frozenset(user.groups.values_list("name", flat=True))
+        setattr(user, GROUP_CACHE_ATTR, names)
+    return names
+
+
+def forget_group_names(sender, instance, action, reverse, **kwargs) -> None:
+    """Drop the cached names when the groups of a user instance change."""
+
+    if action.startswith("post_") and not reverse:
+        instance.__dict__.pop(GROUP_CACHE_ATTR, None)
+
+
+def user_groups(request) -> dict:
+    """Context processor exposing the group names of the current user."""
+
+    return {"user_groups": SimpleLazyObject(lambda: group_names(request.user))}
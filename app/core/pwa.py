@@ -0,0 +1,72 @@
+"""Static assets precached by the PWA service worker.
+
+With a manifest storage the asset list and the cache version are read from
+the ``collectstatic`` manifest. Hashed file names never change their content,
+so the service worker can serve them cache-first, and every deploy that
+changes one of them yields a new cache version which drops the old cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+
+CACHE_PREFIX = "fbf-pwa"
+
+# App shell: own styles and scripts, icons and the self-hosted vendor CSS.
+PRECACHE_PATHS = (
+    "css/",
+    "js/",
+    "img/appicon/",
+    "img/favicon/",
+    "img/logo/wvh.svg",
+    "vendor/bootswatch/5/",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class PrecacheManifest:
+    """Static URLs to precache and the cache name derived from them."""
+
+    urls: list[str]
+    cache_name: str
+
+
+def _wanted(path: str) -> bool:
+    return path.startswith(PRECACHE_PATHS) and not path.endswith(".map")
+
+
+def _manifest_entries() -> dict[str, str]:
+    """Return ``path -> version`` for all precached files.
+
+    The version is the hashed file name from the manifest. Without a
+    manifest (development) the modification time of the source file is used.
+    """
+
+    hashed_files = getattr(staticfiles_storage, "hashed_files", None)
+    if hashed_files:
+        return {path: hashed for path, hashed in hashed_files.items() if _wanted(path)}
+
+    entries = {}
+    for finder in finders.get_finders():
+        for path, storage in finder.list([]):
+            path = path.replace("\\", "/")
+            if _wanted(path) and path not in entries:
+                entries[path] = str(storage.get_modified_time(path).timestamp())
+    return entries
+
+
+def precache_manifest() -> PrecacheManifest:
+    """Build the precache list and the versioned cache name."""
+
+    entries = _manifest_entries()
+    digest = hashlib.sha256(
+        "\n".join(f"{path}:{version}" for path, version in sorted(entries.items())).encode("utf-8")
+    ).hexdigest()[:12]
+    return PrecacheManifest(
+        urls=[staticfiles_storage.url(path) for path in sorted(entries)],
+        cache_name=f"{CACHE_PREFIX}-{digest}",
+    )
@@ -0,0 +1,148 @@
+"""Rate limiting for public endpoints.
+
+``RATE_LIMITS`` maps URL names to a rate such as ``"5/h"`` and optionally the
+limited HTTP methods::
+
+    RATE_LIMITS = {
+        "stations:report": {"rate": "5/h", "methods": ["POST"]},
+        "stations:data": {"rate": "60/m"},
+    }
+
+Requests are counted per client address and route in the default cache.
+The window slides: the count of the previous fixed window is weighted by
+the part of it that still overlaps, which avoids bursts at window borders
+without storing individual timestamps. Rejected requests are not counted,
+so a client is served again as soon as its rate drops below the limit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.deprecation import MiddlewareMixin
+
+logger = logging.getLogger(__name__)
+
+PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+@dataclass(slots=True)
+class Rule:
+    limit: int
+    window: int
+    methods: Optional[frozenset[str]] = None
+
+    @classmethod
+    def from_setting(cls, value) -> "Rule":
+        if isinstance(value, str):
+            value = {"rate": value}
+        limit, window = parse_rate(value["rate"])
+        methods = value.get("methods")
+        return cls(limit, window, frozenset(method.upper() for method in methods) if methods else None)
+
+    def applies_to(self, method: str) -> bool:
+        return self.methods is None or method in self.methods
+
+
+def parse_rate(rate: str) -> tuple[int, int]:
+    """Return ``(requests, seconds)`` for rates like ``"5/h"`` or ``"100/10m"``."""
+
+    count, _, period = rate.partition("/")
+    multiplier = int(period[:-1]) if period[:-1] else 1
+    try:
+        return int(count), multiplier * PERIODS[period[-1:]]
+    except KeyError:
+        raise ValueError(f"Unbekannte Zeiteinheit in Rate {rate!r}") from None
+
+
+def client_address(request) -> str:
+    """Return the client address, honouring ``RATE_LIMIT_PROXY_COUNT`` proxies.
+
+    Behind a reverse proxy ``REMOTE_ADDR`` is the proxy itself. The last
+    proxy appends the address it saw to ``X-Forwarded-For``, so with ``n``
+    trusted proxies the ``n``-th entry from the right is the client; entries
+    further left can be forged.
+    """
+
+    proxies = getattr(settings, "RATE_LIMIT_PROXY_COUNT", 0)
+    if proxies:
+        forwarded = [part.strip() for part in request.META.get("HTTP_X_FORWARDED_FOR", "").split(",") if part.strip()]
+        if len(forwarded) >= proxies:
+            return forwarded[-proxies]
+    return request.META.get("REMOTE_ADDR", "")
+
+
+def hit(key: str, rule: Rule, now: Optional[float] = None) -> Optional[int]:
+    """Count one request for ``key``.
+
+    :returns: ``None`` when the request is allowed, otherwise the number of
+        seconds after which the client may retry.
+    """
+
+    now = time.time() if now is None else now
+    index, offset = divmod(now, rule.window)
+    current_key = f"{key}:{int(index)}"
+    previous_key = f"{key}:{int(index) - 1}"
+    counts = cache.get_many([current_key, previous_key])
+    current = counts.get(current_key, 0)
+    previous = counts.get(previous_key, 0)
+    overlap = 1 - offset / rule.window
+
+    if previous * overlap + current >= rule.limit:
+        # Time until the weighted count drops below the limit, assuming no
+        # further requests are accepted in between.
+        if current >= rule.limit:
+            wait = rule.window - offset + (1 - rule.limit / current) * rule.window
+        else:
+            wait = (overlap - (rule.limit - current) / previous) * rule.window
+        return math.floor(wait) + 1
+
+    if not cache.add(current_key, 1, timeout=2 * rule.window):
+        try:
+            cache.incr(current_key)
+        except ValueError:
+            cache.set(current_key, 1, timeout=2 * rule.window)
+    return None
+
+
+def too_many_requests(retry_after: int) -> HttpResponse:
+    response = HttpResponse(
+        "Zu viele Anfragen. Bitte versuchen Sie es später erneut.",
+        status=429,
+        content_type="text/plain; charset=utf-8",
+    )
+    response["Retry-After"] = str(retry_after)
+    return response
+
+
+class RateLimitMiddleware(MiddlewareMixin):
+    """Answer requests above the configured rate of their route with ``429``.
+
+    Runs after URL resolution, so routes without a rule cost a dictionary
+    lookup and nothing else.
+    """
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        rules = getattr(settings, "RATE_LIMITS", None)
+        match = request.resolver_match
+        if not rules or match is None or match.view_name not in rules:
+            return None
+        rule = Rule.from_setting(rules[match.view_name])
+        if not rule.applies_to(request.method):
+            return None
+
+        address = client_address(request)
+        digest = hashlib.md5(address.encode("utf-8"), usedforsecurity=False).hexdigest()
+        retry_after = hit(f"ratelimit:{match.view_name}:{digest}", rule)
+        if retry_after is None:
+            return None
+        logger.warning("Rate limit für %s überschritten von %s", match.view_name, address)
+        return too_many_requests(retry_after)
@@ -62,6 +62,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     # -----------------------------------
     # All auth
     # -----------------------------------
@@ -91,21 +92,33 @@ INSTALLED_APPS = [
     "sendemail",
     "administration",
     "stations",
+    "audit",
+    "webhooks",
+    "tenants",
+    "search",
 ]
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "allauth.account.middleware.AccountMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    "core.instrumentation.QueryInstrumentationMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
+    "core.ratelimit.RateLimitMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "tenants.scope.TenantMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
+    "audit.recorder.AuditMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "csp.middleware.CSPMiddleware",
 ]
 
+# Per-request query count, DB/template time and latency as Server-Timing
+# headers plus a per-route summary in the administration. Off by default.
+REQUEST_INSTRUMENTATION = env.bool("REQUEST_INSTRUMENTATION", default=False)
+
 # -----------------------------------
 # DJANGO Content Security Policy
 # -----------------------------------
@@ -127,18 +140,29 @@ TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [os.path.join(BASE_DIR, "templates")],
-        "APP_DIRS": True,
         "OPTIONS": {
             "context_processors": [
                 "django.template.context_processors.debug",
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
+                "core.permissions.user_groups",
+            ],
+            "loaders": [
+                "django.template.loaders.filesystem.Loader",
+                "django.template.loaders.app_directories.Loader",
             ],
         },
     },
 ]
 
+# Compile templates once per process in production. During development the
+# loaders above read templates from disk so changes show up immediately.
+if not DEBUG:
+    TEMPLATES[0]["OPTIONS"]["loaders"] = [
+        ("django.template.loaders.cached.Loader", TEMPLATES[0]["OPTIONS"]["loaders"]),
+    ]
+
 AUTHENTICATION_BACKENDS = [
     # Needed to login by username in Django admin, regardless of `allauth`
     "django.contrib.auth.backends.ModelBackend",
@@ -162,10 +186,61 @@ DATABASES = {
         "PASSWORD": env("DB_PASSWORD"),
         "PORT": env("DB_PORT"),
         "USER": env("DB_USER"),
+        # Keep connections open between requests and check them before reuse.
+        # Under ASGI every request runs in its own thread, so persistent
+        # connections would pile up; use DB_POOL there instead.
+        "CONN_MAX_AGE": env.int("DB_CONN_MAX_AGE", default=0 if env("SERVER_MODE", default="wsgi") == "asgi" else 60),
+        "CONN_HEALTH_CHECKS": env.bool("DB_CONN_HEALTH_CHECKS", default=True),
+    }
+}
+
+# Optional psycopg 3 connection pool shared by all threads of a worker.
+# Django manages pooled connections itself, so persistent connections are
+# switched off while the pool is active.
+if env.bool("DB_POOL", default=False):
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": env.int("DB_POOL_MIN_SIZE", default=2),
+            "max_size": env.int("DB_POOL_MAX_SIZE", default=10),
+            "timeout": env.float("DB_POOL_TIMEOUT", default=10.0),
+            "max_idle": env.float("DB_POOL_MAX_IDLE", default=600.0),
+        },
+    }
+
+
+# -----------------------------------
+# Cache
+# -----------------------------------
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# CACHE_URL selects the backend, e.g. filecache:///var/tmp/fbf_cache,
+# dbcache://fbf_cache (run createcachetable) or redis://cache:6379/1.
+
+CACHES = {
+    "default": {
+        **env.cache_url("CACHE_URL", default="locmemcache://"),
+        "KEY_PREFIX": env("CACHE_KEY_PREFIX", default="fbf"),
+        "TIMEOUT": env.int("CACHE_TIMEOUT", default=600),
     }
 }
 
 
+# -----------------------------------
+# Rate limiting
+# -----------------------------------
+# Requests per client and route for the public endpoints, e.g. "5/h" or
+# "60/m". Counters live in the default cache; see core/ratelimit.py.
+
+RATE_LIMITS = {
+    "stations:report": {"rate": env("RATE_LIMIT_STATION_REPORT", default="5/h"), "methods": ["POST"]},
+    "stations:data": {"rate": env("RATE_LIMIT_STATION_DATA", default="60/m")},
+}
+
+# Number of reverse proxies (e.g. Traefik) in front of the application whose
+# X-Forwarded-For entries are trusted to identify the client.
+RATE_LIMIT_PROXY_COUNT = env.int("RATE_LIMIT_PROXY_COUNT", default=0)
+
+
 # -----------------------------------
 # Password validation
 # -----------------------------------
@@ -238,6 +313,23 @@ STATIC_URL = "static/"
 STATICFILES_DIRS = [BASE_DIR / "static"]
 STATIC_ROOT = BASE_DIR / "staticfiles"
 
+# Hashed file names from the collectstatic manifest let browsers and the
+# service worker cache static assets until the next deploy changes them.
+# collectstatic also writes gzip and brotli variants, which WhiteNoise serves
+# to clients accepting them. Hashed files get far-future immutable headers.
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {
+        "BACKEND": (
+            "django.contrib.staticfiles.storage.StaticFilesStorage"
+            if DEBUG
+            else "whitenoise.storage.CompressedManifestStaticFilesStorage"
+        ),
+    },
+}
+# Files without hash in their name (e.g. referenced from third party code).
+WHITENOISE_MAX_AGE = env.int("WHITENOISE_MAX_AGE", default=0 if DEBUG else 3600)
+
 # -----------------------------------
 # Media files (User uploaded content)
 # -----------------------------------
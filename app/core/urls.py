@@ -16,15 +16,17 @@ urlpatterns = [
     path("statistics/", include("statistic.urls")),
     path("export/", include("export.urls")),
     path("notizen/", include("notizen.urls")),
+    path("suche/", include("search.urls")),
     # PWA support
     path("manifest.webmanifest", core_views.ManifestView.as_view(), name="pwa_manifest"),
     path("service-worker.js", core_views.ServiceWorkerView.as_view(), name="pwa_service_worker"),
     path("pwa/offline/", core_views.PWAOfflineView.as_view(), name="pwa_offline"),
     path("pwa/install/", core_views.PWAInstallView.as_view(), name="pwa_install"),
+    path("pwa/sync/", core_views.PWASyncView.as_view(), name="pwa_sync"),
     # Admin
     path("admin/administration/", include("administration.urls")),
-    path("admin/", admin.site.urls),
     path("admin/reports/", include("reports.urls", namespace="reports")),
+    path("admin/", admin.site.urls),
     # Allauth
     path("accounts/", include("allauth.urls")),
     # CKEditor 5
@@ -5,11 +5,15 @@ from __future__ import annotations
 import json
 from typing import Any
 
-from django.http import HttpResponse
-from django.templatetags.static import static
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.urls import reverse
+from django.views import View
 from django.views.generic import TemplateView
 
+from .pwa import precache_manifest
+from .sync import build_sync_payload
+
 
 class ManifestView(TemplateView):
     """Serve the web app manifest from the application root."""
@@ -29,25 +33,21 @@ class ServiceWorkerView(TemplateView):
     template_name = "pwa/service-worker.js"
     content_type = "application/javascript"
 
-    cache_name = "fbf-pwa-v1"
-
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
+        manifest = precache_manifest()
 
         precache_urls = [
             reverse("account_login"),
             reverse("pwa_offline"),
-            static("css/style.css"),
-            static("css/login.css"),
-            static("img/logo/wvh.svg"),
-            static("img/appicon/appiconfbf.png"),
-            "https://bootswatch.com/5/cosmo/bootstrap.min.css",
+            *manifest.urls,
         ]
 
         context.update(
             {
-                "cache_name": self.cache_name,
+                "cache_name": manifest.cache_name,
                 "offline_url": reverse("pwa_offline"),
+                "sync_url": reverse("pwa_sync"),
                 "precache_urls": json.dumps(sorted(set(precache_urls))),
             }
         )
@@ -60,6 +60,16 @@ class ServiceWorkerView(TemplateView):
         return response
 
 
+class PWASyncView(LoginRequiredMixin, View):
+    """Return the patient data changed since the ``since`` token as JSON."""
+
+    def get(self, request: HttpRequest) -> JsonResponse:
+        response = JsonResponse(build_sync_payload(request.user, request.GET.get("since")))
+        # Patient data must not end up in shared or browser caches.
+        response["Cache-Control"] = "no-store"
+        return response
+
+
 class PWAInstallView(TemplateView):
     """Static documentation page explaining how to install the PWA."""
 
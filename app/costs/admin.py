@@ -3,6 +3,15 @@ from django.contrib import admin
 from .models import Costs
 
 
+class PatientListFilter(admin.RelatedFieldListFilter):
+    """Patient filter loading the bird names of all choices in one query."""
+
+    def field_choices(self, field, request, model_admin):
+        ordering = self.field_admin_ordering(field, request, model_admin)
+        patients = field.related_model._default_manager.select_related("bird").order_by(*ordering)
+        return [(patient.pk, str(patient)) for patient in patients]
+
+
 @admin.register(Costs)
 class FallenBirdAdmin(admin.ModelAdmin):
     list_display = [
@@ -12,4 +21,5 @@ class FallenBirdAdmin(admin.ModelAdmin):
         "comment",
         "user",
     ]
-    list_filter = ("id_bird", "created")
+    list_filter = (("id_bird", PatientListFilter), "created")
+    list_select_related = ("id_bird__bird", "user")
@@ -2,6 +2,8 @@ from datetime import date
 from django import forms
 from django.utils.translation import gettext_lazy as _
 
+from tenants.forms import TenantScopedFormMixin
+
 from .models import Costs
 
 
@@ -9,7 +11,7 @@ class DateInput(forms.DateInput):
     input_type = "date"
 
 
-class CostsForm(forms.ModelForm):
+class CostsForm(TenantScopedFormMixin, forms.ModelForm):
     class Meta:
         model = Costs
         fields = ["id_bird", "costs", "comment"]
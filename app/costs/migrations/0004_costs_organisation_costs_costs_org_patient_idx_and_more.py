@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-19 20:03
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bird', '0012_fallenbird_organisation_and_more'),
+        ('costs', '0003_alter_costs_created'),
+        ('tenants', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='costs',
+            name='organisation',
+            field=models.ForeignKey(blank=True, db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='tenants.organisation', verbose_name='Organisation'),
+        ),
+        migrations.AddIndex(
+            model_name='costs',
+            index=models.Index(fields=['organisation', 'id_bird'], name='costs_org_patient_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='costs',
+            index=models.Index(fields=['organisation', 'created'], name='costs_org_created_idx'),
+        ),
+    ]
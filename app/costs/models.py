@@ -7,6 +7,7 @@ from django.core.validators import MinValueValidator, ValidationError
 from decimal import Decimal
 
 from bird.models import Bird
+from tenants.models import TenantScoped
 
 
 CHOICE_CATEGORY = [
@@ -18,7 +19,7 @@ CHOICE_CATEGORY = [
 ]
 
 
-class Costs(models.Model):
+class Costs(TenantScoped):
     id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
     
     # Main relationship - could be to Bird or FallenBird
@@ -113,6 +114,10 @@ class Costs(models.Model):
     class Meta:
         verbose_name = _("Kosten")
         verbose_name_plural = _("Kosten")
+        indexes = [
+            models.Index(fields=["organisation", "id_bird"], name="costs_org_patient_idx"),
+            models.Index(fields=["organisation", "created"], name="costs_org_created_idx"),
+        ]
         
     def clean(self):
         """Validate that amount is not negative."""
@@ -4,3 +4,15 @@ from django.apps import AppConfig
 class ExportConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "export"
+
+    def ready(self):
+        from django.contrib.auth import get_user_model
+        from django.db.models.signals import m2m_changed
+
+        from core.permissions import forget_group_names
+
+        m2m_changed.connect(
+            forget_group_names,
+            sender=get_user_model().groups.through,
+            dispatch_uid="export:forget_group_names",
+        )
@@ -0,0 +1,261 @@
+"""Streaming CSV and ZIP exports.
+
+Rows are read from the database in chunks and sent to the client as soon as
+a chunk is written, so memory use does not depend on the size of the export
+and the download starts immediately. Under ASGI the chunks are produced in a
+worker thread one at a time, which keeps the event loop free while the
+client downloads.
+"""
+
+from __future__ import annotations
+
+import csv
+import zipfile
+from dataclasses import dataclass
+from itertools import islice
+from typing import Callable, Iterable, Iterator
+
+from asgiref.sync import sync_to_async
+from django.contrib.contenttypes.models import ContentType
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+
+from bird.models import FallenBird
+from costs.models import Costs
+from notizen.models import Notiz
+
+CHUNK_SIZE = 2000
+BOM = "\ufeff"
+
+
+@dataclass(slots=True)
+class ExportTable:
+    filename: str
+    header: list[str]
+    rows: Callable[[], Iterable[list]]
+
+
+class _Line:
+    """File-like object returning what the CSV writer writes to it."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+class Pipe:
+    """Write-only binary file collecting output until it is drained."""
+
+    closed = False
+
+    def __init__(self):
+        self._parts: list[bytes] = []
+        self._position = 0
+
+    def write(self, data) -> int:
+        self._parts.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
+def _date(value) -> str:
+    return value.strftime("%Y-%m-%d") if value else ""
+
+
+def chunked(iterable: Iterable, size: int) -> Iterator[list]:
+    """Yield lists of up to ``size`` items of ``iterable``."""
+
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def patient_table(with_id: bool = False) -> ExportTable:
+    """All patients with the columns of the full patient export."""
+
+    header = [
+        "Patienten Alias",
+        "Vogel",
+        "Alter",
+        "Geschlecht",
+        "Gefunden am",
+        "Fundort",
+        "Patient angelegt am",
+        "Patient aktualisiert am",
+        "Fundumstände",
+        "Diagnose bei Fund",
+        "Benutzer",
+        "Status",
+        "Voliere",
+        "Übermittelt nach",
+        "Auswilderungsort",
+        "Akte geschlossen am",
+    ]
+
+    def rows():
+        birds = (
+            FallenBird.objects.select_related("bird", "status", "aviary", "user", "find_circumstances")
+            .order_by("date_found", "id")
+            .iterator(chunk_size=CHUNK_SIZE)
+        )
+        for bird in birds:
+            # The close date falls back to the last update for older records.
+            close_date = bird.patient_file_close_date or bird.updated
+            row = [
+                bird.bird_identifier or "",
+                bird.bird.name if bird.bird else "",
+                bird.get_age_display() if bird.age else "",
+                bird.get_sex_display() if bird.sex else "",
+                _date(bird.date_found),
+                bird.place or "",
+                _date(bird.created),
+                _date(bird.updated),
+                bird.find_circumstances.description if bird.find_circumstances else "",
+                bird.diagnostic_finding or "",
+                bird.user.username if bird.user else "",
+                bird.status.description if bird.status else "",
+                bird.aviary.description if bird.aviary else "",
+                bird.sent_to or "",
+                bird.release_location or "",
+                _date(close_date),
+            ]
+            yield [str(bird.id), *row] if with_id else row
+
+    return ExportTable("patienten.csv", ["Patienten-ID", *header] if with_id else header, rows)
+
+
+def costs_table() -> ExportTable:
+    """All cost entries with the patient they are booked on."""
+
+    def rows():
+        costs = (
+            Costs.objects.select_related("id_bird", "user")
+            .order_by("created", "id")
+            .iterator(chunk_size=CHUNK_SIZE)
+        )
+        for entry in costs:
+            yield [
+                str(entry.id_bird_id or ""),
+                entry.id_bird.bird_identifier if entry.id_bird else "",
+                entry.amount if entry.amount is not None else entry.costs,
+                entry.get_category_display() if entry.category else "",
+                entry.description or "",
+                _date(entry.cost_date),
+                entry.invoice_number or "",
+                entry.vendor or "",
+                entry.comment or "",
+                entry.user.username if entry.user else "",
+                _date(entry.created),
+            ]
+
+    header = [
+        "Patienten-ID",
+        "Patienten Alias",
+        "Betrag",
+        "Kategorie",
+        "Beschreibung",
+        "Datum",
+        "Rechnungsnummer",
+        "Lieferant",
+        "Bemerkung",
+        "Benutzer",
+        "Gebucht am",
+    ]
+    return ExportTable("kosten.csv", header, rows)
+
+
+def notes_table() -> ExportTable:
+    """All notes attached to patients."""
+
+    def rows():
+        notes = (
+            Notiz.objects.filter(content_type=ContentType.objects.get_for_model(FallenBird))
+            .select_related("erstellt_von")
+            .order_by("erstellt_am", "id")
+            .iterator(chunk_size=CHUNK_SIZE)
+        )
+        for chunk in chunked(notes, CHUNK_SIZE):
+            # Generic relations cannot be joined; resolve the aliases per chunk.
+            aliases = {
+                str(pk): alias
+                for pk, alias in FallenBird.objects.filter(
+                    id__in={note.object_id for note in chunk}
+                ).values_list("id", "bird_identifier")
+            }
+            for note in chunk:
+                yield [
+                    note.object_id,
+                    aliases.get(note.object_id) or "",
+                    note.name,
+                    note.inhalt,
+                    note.erstellt_von.username if note.erstellt_von else "",
+                    _date(note.erstellt_am),
+                    _date(note.geaendert_am),
+                ]
+
+    header = [
+        "Patienten-ID",
+        "Patienten Alias",
+        "Notiz",
+        "Inhalt",
+        "Erstellt von",
+        "Erstellt am",
+        "Geändert am",
+    ]
+    return ExportTable("notizen.csv", header, rows)
+
+
+def csv_chunks(table: ExportTable, rows_per_chunk: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield ``table`` as UTF-8 encoded CSV with BOM for Excel."""
+
+    writer = csv.writer(_Line(), delimiter=";", quoting=csv.QUOTE_ALL)
+    yield (BOM + writer.writerow(table.header)).encode("utf-8")
+    for rows in chunked(table.rows(), rows_per_chunk):
+        yield "".join(writer.writerow(row) for row in rows).encode("utf-8")
+
+
+def zip_chunks(tables: Iterable[ExportTable]) -> Iterator[bytes]:
+    """Yield a ZIP archive with one CSV file per table."""
+
+    pipe = Pipe()
+    # Written to an unseekable pipe, sizes are stored after each member.
+    with zipfile.ZipFile(pipe, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for table in tables:
+            with archive.open(table.filename, "w", force_zip64=True) as member:
+                for chunk in csv_chunks(table):
+                    member.write(chunk)
+                    if data := pipe.drain():
+                        yield data
+            yield pipe.drain()
+    yield pipe.drain()
+
+
+async def _async_chunks(chunks: Iterator[bytes]):
+    next_chunk = sync_to_async(next, thread_sensitive=True)
+    while (chunk := await next_chunk(chunks, None)) is not None:
+        yield chunk
+
+
+def streaming_response(request, chunks: Iterator[bytes], filename: str, content_type: str) -> StreamingHttpResponse:
+    """Return a download streaming ``chunks``.
+
+    ASGI servers get an asynchronous iterator; Django would otherwise read a
+    synchronous iterator completely into memory before sending it.
+    """
+
+    if isinstance(request, ASGIRequest):
+        chunks = _async_chunks(iter(chunks))
+    response = StreamingHttpResponse(chunks, content_type=content_type)
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    response["Cache-Control"] = "no-store"
+    return response
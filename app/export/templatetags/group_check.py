@@ -1,13 +1,10 @@
 from django import template
-from django.contrib.auth.models import Group
+
+from core.permissions import group_names
 
 register = template.Library()
 
 
 @register.filter(name="group_check")
 def has_group(user, group_name):
-    try:
-        group = Group.objects.get(name=group_name)
-        return group in user.groups.all()
-    except Group.DoesNotExist:
-        return False
+    return group_name in group_names(user)
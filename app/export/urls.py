@@ -2,7 +2,8 @@ from django.urls import path
 
 from .views import (
     export_birds,
-    export_birds_all, 
+    export_archive,
+    export_birds_all,
     export_birds_custom,
     site_exports,
 )
@@ -11,5 +12,6 @@ urlpatterns = [
     path("", site_exports, name="site_exports"),
     path("birds/", export_birds, name="export_birds"),  # Legacy compatibility
     path("birds/all/", export_birds_all, name="export_birds_all"),
+    path("archive/", export_archive, name="export_archive"),
     path("birds/custom/", export_birds_custom, name="export_birds_custom"),
 ]
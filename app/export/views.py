@@ -1,84 +1,55 @@
-import csv
-from datetime import date
-
-from bird.models import FallenBird
 from django.contrib.auth.decorators import login_required
-from django.http import HttpResponse
-from django.shortcuts import render
+from django.http import Http404
+from django.shortcuts import redirect, render
 from django.contrib import messages
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from .columnar import FORMATS, columnar_available, columnar_chunks
 from .forms import CustomExportForm
 from .services import BirdExportService
-
-
-today = date.today().strftime("%Y-%m-%d")
+from .streaming import costs_table, csv_chunks, notes_table, patient_table, streaming_response, zip_chunks
 
 
 @login_required(login_url="account_login")
 def site_exports(request):
     """Main export page with options for different export types."""
-    return render(request, "export/overview.html")
+    return render(request, "export/overview.html", {"columnar_available": columnar_available()})
 
 
 @login_required(login_url="account_login")
 def export_birds_all(request):
-    """Export all birds with extended fields including new columns."""
-    birds = FallenBird.objects.all().select_related('bird', 'status', 'aviary', 'user', 'find_circumstances')
-    
-    response = HttpResponse(content_type="text/csv; charset=utf-8")
-    response["Content-Disposition"] = f"attachment; filename=fbf_all_birds_{today}.csv"
-    
-    # Add BOM for proper UTF-8 encoding in Excel
-    response.write('\ufeff')
-    
-    writer = csv.writer(response, delimiter=';', quoting=csv.QUOTE_ALL)
-    writer.writerow([
-        "Patienten Alias",
-        "Vogel",
-        "Alter",
-        "Geschlecht",
-        "Gefunden am",
-        "Fundort",
-        "Patient angelegt am",
-        "Patient aktualisiert am",
-        "Fundumstände",
-        "Diagnose bei Fund",
-        "Benutzer",
-        "Status",
-        "Voliere",
-        "Übermittelt nach",
-        "Auswilderungsort",
-        "Akte geschlossen am",
-    ])
-    
-    for bird in birds:
-        # Use patient_file_close_date if available, otherwise fall back to updated date
-        if bird.patient_file_close_date:
-            close_date = bird.patient_file_close_date.strftime('%Y-%m-%d')
-        else:
-            close_date = bird.updated.strftime('%Y-%m-%d') if bird.updated else ''
-        
-        writer.writerow([
-            bird.bird_identifier or '',
-            bird.bird.name if bird.bird else '',
-            bird.get_age_display() if bird.age else '',
-            bird.get_sex_display() if bird.sex else '',
-            bird.date_found.strftime('%Y-%m-%d') if bird.date_found else '',
-            bird.place or '',
-            bird.created.strftime('%Y-%m-%d') if bird.created else '',
-            bird.updated.strftime('%Y-%m-%d') if bird.updated else '',
-            bird.find_circumstances.description if bird.find_circumstances else '',
-            bird.diagnostic_finding or '',
-            bird.user.username if bird.user else '',
-            bird.status.description if bird.status else '',
-            bird.aviary.description if bird.aviary else '',
-            bird.sent_to or '',
-            bird.release_location or '',
-            close_date,
-        ])
-    
-    return response
+    """Stream all patients with extended fields as CSV, Parquet or Arrow."""
+    today = timezone.localdate().isoformat()
+    file_format = request.GET.get("format", "csv")
+    if file_format in FORMATS:
+        if not columnar_available():
+            messages.error(request, _("Für diesen Export muss das Paket pyarrow installiert sein."))
+            return redirect("site_exports")
+        extension, content_type = FORMATS[file_format]
+        return streaming_response(
+            request, columnar_chunks(file_format), f"fbf_all_birds_{today}.{extension}", content_type
+        )
+    if file_format != "csv":
+        raise Http404
+    return streaming_response(
+        request,
+        csv_chunks(patient_table()),
+        f"fbf_all_birds_{today}.csv",
+        "text/csv; charset=utf-8",
+    )
+
+
+@login_required(login_url="account_login")
+def export_archive(request):
+    """Stream patients, costs and notes as a ZIP archive of CSV files."""
+    today = timezone.localdate().isoformat()
+    return streaming_response(
+        request,
+        zip_chunks([patient_table(with_id=True), costs_table(), notes_table()]),
+        f"fbf_archiv_{today}.zip",
+        "application/zip",
+    )
 
 
 @login_required(login_url="account_login")
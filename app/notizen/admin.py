@@ -1,4 +1,7 @@
 from django.contrib import admin
+from django.contrib.contenttypes.prefetch import GenericPrefetch
+
+from bird.models import FallenBird
 from .models import Notiz, Page
 
 
@@ -8,6 +11,13 @@ class NotizAdmin(admin.ModelAdmin):
     list_filter = ['erstellt_am', 'geaendert_am', 'content_type']
     search_fields = ['name', 'inhalt']
     readonly_fields = ['erstellt_am', 'geaendert_am']
+    list_select_related = ['erstellt_von', 'content_type']
+
+    def get_queryset(self, request):
+        # Patient names come from the related bird species.
+        return super().get_queryset(request).prefetch_related(
+            GenericPrefetch('content_object', [FallenBird.objects.select_related('bird')])
+        )
     
     def save_model(self, request, obj, form, change):
         if not change:  # If creating a new object
@@ -0,0 +1,38 @@
+from django.db import migrations, models
+
+from notizen.rendering import render_markdown
+
+
+def render_existing_notes(apps, schema_editor):
+    Notiz = apps.get_model('notizen', 'Notiz')
+    batch = []
+    for notiz in Notiz.objects.only('pk', 'inhalt').iterator(chunk_size=500):
+        notiz.inhalt_html = render_markdown(notiz.inhalt)
+        batch.append(notiz)
+        if len(batch) >= 500:
+            Notiz.objects.bulk_update(batch, ['inhalt_html'])
+            batch = []
+    if batch:
+        Notiz.objects.bulk_update(batch, ['inhalt_html'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notizen', '0004_notiz_is_public_public_token'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notiz',
+            name='inhalt_html',
+            field=models.TextField(
+                blank=True,
+                default='',
+                editable=False,
+                help_text='Beim Speichern aus dem Inhalt erzeugtes HTML',
+                verbose_name='Inhalt (HTML)'
+            ),
+        ),
+        migrations.RunPython(render_existing_notes, migrations.RunPython.noop),
+    ]
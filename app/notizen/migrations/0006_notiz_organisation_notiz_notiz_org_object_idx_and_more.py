@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-19 20:03
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('notizen', '0005_notiz_inhalt_html'),
+        ('tenants', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notiz',
+            name='organisation',
+            field=models.ForeignKey(blank=True, db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='tenants.organisation', verbose_name='Organisation'),
+        ),
+        migrations.AddIndex(
+            model_name='notiz',
+            index=models.Index(fields=['organisation', 'content_type', 'object_id'], name='notiz_org_object_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notiz',
+            index=models.Index(fields=['organisation', '-geaendert_am'], name='notiz_org_changed_idx'),
+        ),
+    ]
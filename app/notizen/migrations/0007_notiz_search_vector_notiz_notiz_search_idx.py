@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-19 20:08
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('notizen', '0006_notiz_organisation_notiz_notiz_org_object_idx_and_more'),
+        ('tenants', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notiz',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='notiz',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='notiz_search_idx'),
+        ),
+    ]
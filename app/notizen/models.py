@@ -5,8 +5,14 @@ from django.contrib.auth.models import User
 from django.urls import reverse
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django_ckeditor_5.fields import CKEditor5Field
 
+from tenants.models import TenantScoped
+
+from .rendering import render_markdown
+
 
 class Page(models.Model):
     """
@@ -41,7 +47,7 @@ class Page(models.Model):
         return self.name
 
 
-class Notiz(models.Model):
+class Notiz(TenantScoped):
     """
     Model for user notes that can be attached to different objects.
     """
@@ -56,6 +62,13 @@ class Notiz(models.Model):
         help_text="Inhalt der Notiz in Markdown-Format",
         config_name='extends'
     )
+    inhalt_html = models.TextField(
+        blank=True,
+        default='',
+        editable=False,
+        verbose_name="Inhalt (HTML)",
+        help_text="Beim Speichern aus dem Inhalt erzeugtes HTML"
+    )
     
     # Generic foreign key to attach notes to any model
     content_type = models.ForeignKey(
@@ -101,13 +114,35 @@ class Notiz(models.Model):
         verbose_name="Öffentlicher Zugriffstoken"
     )
     
+    search_vector = SearchVectorField(null=True, editable=False)
+    
     class Meta:
         verbose_name = "Notiz"
         verbose_name_plural = "Notizen"
         ordering = ['-geaendert_am']
+        indexes = [
+            models.Index(fields=['organisation', 'content_type', 'object_id'], name='notiz_org_object_idx'),
+            models.Index(fields=['organisation', '-geaendert_am'], name='notiz_org_changed_idx'),
+            GinIndex(fields=['search_vector'], name='notiz_search_idx'),
+        ]
     
     def __str__(self):
         return self.name
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'inhalt' in update_fields:
+            self.inhalt_html = render_markdown(self.inhalt)
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'inhalt_html'}
+        super().save(*args, **kwargs)
+
+    @property
+    def html_content(self):
+        """Return the rendered content, rendering notes saved without it."""
+        if not self.inhalt_html and self.inhalt:
+            self.inhalt_html = render_markdown(self.inhalt)
+        return self.inhalt_html
     
     def get_absolute_url(self):
         return reverse('notizen:detail', kwargs={'pk': self.pk})
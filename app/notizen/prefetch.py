@@ -0,0 +1,58 @@
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Count
+
+from .models import Notiz
+
+NOTIZEN_ATTR = '_prefetched_notizen'
+COUNT_ATTR = '_prefetched_notizen_count'
+
+# Keeps the IN clause below the parameter limit of SQLite.
+BATCH_SIZE = 500
+
+
+def _group_by_content_type(objects):
+    grouped = defaultdict(lambda: defaultdict(list))
+    for obj in objects:
+        content_type = ContentType.objects.get_for_model(obj)
+        grouped[content_type][str(obj.pk)].append(obj)
+    return grouped
+
+
+def _batches(object_ids):
+    object_ids = list(object_ids)
+    for start in range(0, len(object_ids), BATCH_SIZE):
+        yield object_ids[start:start + BATCH_SIZE]
+
+
+def prefetch_notizen(objects, counts_only=False):
+    """
+    Load the notes attached to ``objects`` with one query per content type.
+
+    The notes are stored on each object and picked up by
+    ``show_object_notizen`` and ``notiz_count_for_object``. With
+    ``counts_only`` only the number of notes is loaded.
+    """
+    objects = list(objects)
+    for content_type, by_id in _group_by_content_type(objects).items():
+        notizen = defaultdict(list)
+        counts = {}
+        for object_ids in _batches(by_id):
+            queryset = Notiz.objects.filter(content_type=content_type, object_id__in=object_ids)
+            if counts_only:
+                counts.update(
+                    queryset.order_by().values('object_id').annotate(count=Count('pk')).values_list('object_id', 'count')
+                )
+            else:
+                for notiz in queryset.select_related('erstellt_von').order_by('-geaendert_am'):
+                    notizen[notiz.object_id].append(notiz)
+
+        for object_id, instances in by_id.items():
+            for obj in instances:
+                if counts_only:
+                    setattr(obj, COUNT_ATTR, counts.get(object_id, 0))
+                else:
+                    setattr(obj, NOTIZEN_ATTR, notizen[object_id])
+                    setattr(obj, COUNT_ATTR, len(notizen[object_id]))
+    return objects
@@ -0,0 +1,24 @@
+import threading
+
+import markdown
+
+MARKDOWN_EXTENSIONS = ['markdown.extensions.fenced_code']
+
+_local = threading.local()
+
+
+def _markdown():
+    """Return the Markdown converter of the current thread.
+
+    Building a ``Markdown`` instance loads all extensions, so one instance
+    is kept per thread and reset between conversions.
+    """
+    converter = getattr(_local, 'converter', None)
+    if converter is None:
+        converter = _local.converter = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS)
+    return converter
+
+
+def render_markdown(text):
+    """Convert note content to HTML."""
+    return _markdown().reset().convert(text or '')
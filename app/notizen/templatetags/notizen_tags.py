@@ -1,7 +1,7 @@
 from django import template
 from django.contrib.contenttypes.models import ContentType
 from notizen.models import Notiz
-import markdown
+from notizen.prefetch import COUNT_ATTR, NOTIZEN_ATTR, prefetch_notizen as load_notizen
 
 register = template.Library()
 
@@ -13,19 +13,18 @@ def show_object_notizen(context, obj):
     Usage: {% show_object_notizen object %}
     """
     content_type = ContentType.objects.get_for_model(obj)
-    notizen = Notiz.objects.filter(
-        content_type=content_type,
-        object_id=obj.pk
-    ).order_by('-geaendert_am')
+    notizen = getattr(obj, NOTIZEN_ATTR, None)
+    if notizen is None:
+        notizen = Notiz.objects.filter(
+            content_type=content_type,
+            object_id=obj.pk
+        ).select_related('erstellt_von').order_by('-geaendert_am')
     
-    # Convert markdown to HTML for each note
-    notizen_with_html = []
-    for notiz in notizen:
-        html_content = markdown.markdown(notiz.inhalt, extensions=['markdown.extensions.fenced_code'])
-        notizen_with_html.append({
-            'notiz': notiz,
-            'html_content': html_content
-        })
+    # Rendered HTML is stored on the note when it is saved
+    notizen_with_html = [
+        {'notiz': notiz, 'html_content': notiz.html_content}
+        for notiz in notizen
+    ]
     
     return {
         'notizen_with_html': notizen_with_html,
@@ -35,6 +34,16 @@ def show_object_notizen(context, obj):
     }
 
 
+@register.simple_tag
+def prefetch_notizen(objects, counts_only=False):
+    """
+    Template tag to load the notes of a list of objects up front.
+    Usage: {% prefetch_notizen birds %} or {% prefetch_notizen birds counts_only=True %}
+    """
+    load_notizen(objects, counts_only=counts_only)
+    return ''
+
+
 @register.filter
 def content_type_id(obj):
     """
@@ -64,6 +73,9 @@ def notiz_count_for_object(obj):
     Template tag to get the count of notes for an object.
     Usage: {% notiz_count_for_object object %}
     """
+    count = getattr(obj, COUNT_ATTR, None)
+    if count is not None:
+        return count
     content_type = ContentType.objects.get_for_model(obj)
     return Notiz.objects.filter(
         content_type=content_type,
@@ -93,16 +105,13 @@ def show_page_notizen(context, page_identifier):
     notizen = Notiz.objects.filter(
         content_type=content_type,
         object_id=page.pk
-    ).order_by('-geaendert_am')
+    ).select_related('erstellt_von').order_by('-geaendert_am')
     
-    # Convert markdown to HTML for each note
-    notizen_with_html = []
-    for notiz in notizen:
-        html_content = markdown.markdown(notiz.inhalt, extensions=['markdown.extensions.fenced_code'])
-        notizen_with_html.append({
-            'notiz': notiz,
-            'html_content': html_content
-        })
+    # Rendered HTML is stored on the note when it is saved
+    notizen_with_html = [
+        {'notiz': notiz, 'html_content': notiz.html_content}
+        for notiz in notizen
+    ]
     
     return {
         'notizen_with_html': notizen_with_html,
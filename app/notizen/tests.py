@@ -1,8 +1,13 @@
+from unittest.mock import patch
+
 from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.template import Context, Template
 from django.test import TestCase
 from django.urls import reverse
 
-from notizen.models import Notiz
+from notizen.models import Notiz, Page
+from notizen.prefetch import prefetch_notizen
 
 
 class PublicNotizTests(TestCase):
@@ -60,3 +65,67 @@ class PublicNotizTests(TestCase):
         url = reverse("notizen:public_edit", kwargs={"token": self.notiz.public_token})
         response = self.client.get(url)
         self.assertEqual(response.status_code, 404)
+
+
+class NotizRenderingTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="renderer", password="secret-pass")
+        self.client.force_login(self.user)
+
+    def test_html_is_stored_on_save(self):
+        notiz = Notiz.objects.create(name="Markdown", inhalt="# Titel", erstellt_von=self.user)
+        self.assertEqual(notiz.inhalt_html, "<h1>Titel</h1>")
+
+        notiz.inhalt = "**fett**"
+        notiz.save(update_fields=["inhalt"])
+        notiz.refresh_from_db()
+        self.assertEqual(notiz.inhalt_html, "<p><strong>fett</strong></p>")
+
+    def test_detail_view_does_not_render_again(self):
+        notiz = Notiz.objects.create(name="Markdown", inhalt="```\ncode\n```", erstellt_von=self.user)
+        with patch("notizen.models.render_markdown") as render:
+            response = self.client.get(reverse("notizen:detail", args=[notiz.pk]))
+        render.assert_not_called()
+        self.assertContains(response, "<pre><code>code")
+
+    def test_missing_html_is_rendered_lazily(self):
+        notiz = Notiz.objects.create(name="Markdown", inhalt="Text", erstellt_von=self.user)
+        Notiz.objects.filter(pk=notiz.pk).update(inhalt_html="")
+        notiz.refresh_from_db()
+        self.assertEqual(notiz.html_content, "<p>Text</p>")
+
+
+class NotizPrefetchTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="prefetcher", password="secret-pass")
+        self.pages = [Page.objects.create(identifier=f"page_{i}", name=f"Seite {i}") for i in range(3)]
+        page_type = ContentType.objects.get_for_model(Page)
+        for page, count in zip(self.pages, (2, 0, 1)):
+            for i in range(count):
+                Notiz.objects.create(
+                    name=f"Notiz {i}",
+                    inhalt="Text",
+                    erstellt_von=self.user,
+                    content_type=page_type,
+                    object_id=str(page.pk),
+                )
+
+    def test_counts_are_loaded_with_one_query(self):
+        template = Template(
+            "{% load notizen_tags %}{% prefetch_notizen pages counts_only=True %}"
+            "{% for page in pages %}{% notiz_count_for_object page %},{% endfor %}"
+        )
+        ContentType.objects.get_for_model(Page)
+        with self.assertNumQueries(1):
+            rendered = template.render(Context({"pages": self.pages}))
+        self.assertEqual(rendered, "2,0,1,")
+
+    def test_show_object_notizen_uses_prefetched_notes(self):
+        prefetch_notizen(self.pages)
+        template = Template(
+            "{% load notizen_tags %}{% for page in pages %}{% show_object_notizen page %}{% endfor %}"
+        )
+        with self.assertNumQueries(0):
+            rendered = template.render(Context({"pages": self.pages, "user": self.user}))
+        self.assertEqual(rendered.count('class="card mb-3"'), 3)
+        self.assertEqual(self.pages[0]._prefetched_notizen_count, 2)
@@ -7,7 +7,6 @@ from django.contrib.contenttypes.models import ContentType
 from django.core.paginator import Paginator
 from .models import Notiz
 from .forms import NotizForm, NotizAttachForm
-import markdown
 
 
 @login_required
@@ -32,12 +31,9 @@ def notiz_detail(request, pk):
     """Display a single note."""
     notiz = get_object_or_404(Notiz, pk=pk, erstellt_von=request.user)
     
-    # Convert markdown to HTML
-    html_content = markdown.markdown(notiz.inhalt, extensions=['markdown.extensions.fenced_code'])
-    
     context = {
         'notiz': notiz,
-        'html_content': html_content,
+        'html_content': notiz.html_content,
     }
     return render(request, 'notizen/detail.html', context)
 
@@ -149,14 +145,11 @@ def object_notizen(request, content_type_id, object_id):
         object_id=object_id
     )
     
-    # Convert markdown to HTML for each note
-    notizen_with_html = []
-    for notiz in notizen:
-        html_content = markdown.markdown(notiz.inhalt, extensions=['markdown.extensions.fenced_code'])
-        notizen_with_html.append({
-            'notiz': notiz,
-            'html_content': html_content
-        })
+    # Rendered HTML is stored on the note when it is saved
+    notizen_with_html = [
+        {'notiz': notiz, 'html_content': notiz.html_content}
+        for notiz in notizen
+    ]
     
     context = {
         'content_object': content_object,
@@ -2,9 +2,10 @@ from django.db import models
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 from sendemail.models import Emailadress
+from tenants.models import TenantScoped
 
 
-class AutomaticReport(models.Model):
+class AutomaticReport(TenantScoped):
     """Model for automatic report configuration."""
     name = models.CharField(
         max_length=255, 
@@ -140,9 +141,10 @@ class AutomaticReport(models.Model):
         verbose_name = _("Automatischer Report")
         verbose_name_plural = _("Automatische Reports")
         ordering = ['-created_at']
+        indexes = [models.Index(fields=['organisation', 'is_active'], name='report_org_active_idx')]
 
 
-class ReportLog(models.Model):
+class ReportLog(TenantScoped):
     """Log for generated reports."""
     
     # Link to automatic report if applicable
@@ -203,3 +205,4 @@ class ReportLog(models.Model):
         verbose_name = _("Report-Log")
         verbose_name_plural = _("Report-Logs")
         ordering = ['-created_at']
+        indexes = [models.Index(fields=['organisation', '-created_at'], name='reportlog_org_created_idx')]
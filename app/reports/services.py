@@ -10,6 +10,7 @@ import csv
 from datetime import date
 from io import StringIO
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.core.files.base import ContentFile
 from django.core.mail import EmailMessage
@@ -216,18 +217,14 @@ class ReportGenerator:
         
         return summary
     
-    def send_email_report(self, email_addresses, automatic_report=None):
-        """Render and dispatch the report via e-mail.
+    def build_email_report(self, email_addresses, automatic_report=None):
+        """Render the report e-mail including the CSV attachment.
 
         :param email_addresses: Iterable of recipient addresses.
         :param automatic_report: Optional ``AutomaticReport`` instance that
             triggered the send.
-        :returns: Tuple ``(ReportLog|None, success, error_message)`` where
-            ``success`` is a boolean flag and ``error_message`` contains the
-            caught exception message when sending fails.
+        :returns: Tuple ``(EmailMessage, csv_content, bird_count)``.
         """
-        from .models import ReportLog
-        
         csv_content, bird_count = self.generate_csv()
         filename = self.get_filename()
         
@@ -256,29 +253,71 @@ class ReportGenerator:
         
         # Attach CSV file
         email.attach(filename, csv_content, 'text/csv')
+        return email, csv_content, bird_count
+    
+    def log_email_report(self, email_addresses, csv_content, bird_count, automatic_report=None):
+        """Persist a ``ReportLog`` for a sent report including the CSV file.
+
+        :returns: The newly created ``ReportLog`` instance.
+        """
+        from .models import ReportLog
+        
+        report_log = ReportLog.objects.create(
+            automatic_report=automatic_report,
+            date_from=self.date_from,
+            date_to=self.date_to,
+            patient_count=bird_count,
+            include_naturschutzbehörde=self.include_naturschutzbehoerde,
+            include_jagdbehörde=self.include_jagdbehoerde,
+            email_sent_to=email_addresses,
+        )
+        
+        # Save CSV file to the log
+        report_log.csv_file.save(
+            self.get_filename(),
+            ContentFile(csv_content.encode('utf-8')),
+            save=True
+        )
+        return report_log
+    
+    def send_email_report(self, email_addresses, automatic_report=None):
+        """Render and dispatch the report via e-mail.
+
+        :param email_addresses: Iterable of recipient addresses.
+        :param automatic_report: Optional ``AutomaticReport`` instance that
+            triggered the send.
+        :returns: Tuple ``(ReportLog|None, success, error_message)`` where
+            ``success`` is a boolean flag and ``error_message`` contains the
+            caught exception message when sending fails.
+        """
+        email, csv_content, bird_count = self.build_email_report(email_addresses, automatic_report)
         
         try:
-            # Send email
             email.send()
+            report_log = self.log_email_report(email_addresses, csv_content, bird_count, automatic_report)
+            return report_log, True, None
             
-            # Create log entry
-            report_log = ReportLog.objects.create(
-                automatic_report=automatic_report,
-                date_from=self.date_from,
-                date_to=self.date_to,
-                patient_count=bird_count,
-                include_naturschutzbehörde=self.include_naturschutzbehoerde,
-                include_jagdbehörde=self.include_jagdbehoerde,
-                email_sent_to=email_addresses,
-            )
-            
-            # Save CSV file to the log
-            report_log.csv_file.save(
-                filename,
-                ContentFile(csv_content.encode('utf-8')),
-                save=True
+        except Exception as e:
+            return None, False, str(e)
+    
+    async def asend_email_report(self, email_addresses, automatic_report=None):
+        """Async variant of :meth:`send_email_report`.
+
+        Database work runs in the request thread via ``sync_to_async``; the
+        SMTP conversation runs in a separate worker thread so the event loop
+        is not blocked while the mail server responds.
+
+        :returns: Same tuple as :meth:`send_email_report`.
+        """
+        email, csv_content, bird_count = await sync_to_async(self.build_email_report)(
+            email_addresses, automatic_report
+        )
+        
+        try:
+            await sync_to_async(email.send, thread_sensitive=False)()
+            report_log = await sync_to_async(self.log_email_report)(
+                email_addresses, csv_content, bird_count, automatic_report
             )
-            
             return report_log, True, None
             
         except Exception as e:
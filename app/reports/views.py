@@ -1,6 +1,8 @@
 import csv
 from datetime import date, timedelta
+from asgiref.sync import sync_to_async
 from django.shortcuts import render, redirect, get_object_or_404
+from django.template.response import TemplateResponse
 from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib import messages
 from django.http import HttpResponse
@@ -26,11 +28,15 @@ def reports_dashboard(request):
 
 
 @staff_member_required
-def manual_report(request):
-    """Create and send/download manual reports."""
+async def manual_report(request):
+    """Create and send/download manual reports.
+
+    Runs asynchronously so that waiting for the mail server does not block
+    a worker when the project is served via ASGI.
+    """
     if request.method == 'POST':
         form = ManualReportForm(request.POST)
-        if form.is_valid():
+        if await sync_to_async(form.is_valid)():
             # Handle form submission based on action
             action = request.POST.get('action')
             
@@ -39,15 +45,15 @@ def manual_report(request):
                 generator = ReportGenerator(
                     date_from=form.cleaned_data['date_from'],
                     date_to=form.cleaned_data['date_to'],
-                    include_naturschutzbehoerde=form.cleaned_data['include_naturschutzbehörde'],
-                    include_jagdbehoerde=form.cleaned_data['include_jagdbehörde']
+                    include_naturschutzbehoerde=form.cleaned_data['include_naturschutzbehoerde'],
+                    include_jagdbehoerde=form.cleaned_data['include_jagdbehoerde']
                 )
                 
-                csv_content, bird_count = generator.generate_csv()
+                csv_content, bird_count = await sync_to_async(generator.generate_csv)()
                 filename = generator.get_filename()
                 
                 # Create download log
-                generator.create_download_log()
+                await sync_to_async(generator.create_download_log)()
                 
                 response = HttpResponse(csv_content, content_type='text/csv')
                 response['Content-Disposition'] = f'attachment; filename="{filename}"'
@@ -58,7 +64,7 @@ def manual_report(request):
             elif action == 'email':
                 # Send via email
                 email_addresses = form.cleaned_data['email_addresses']
-                email_list = [email.email for email in email_addresses]
+                email_list = [email.email_address async for email in email_addresses]
                 
                 # Add custom email if provided
                 if form.cleaned_data.get('custom_email'):
@@ -66,16 +72,16 @@ def manual_report(request):
                 
                 if not email_list:
                     messages.error(request, 'Bitte wählen Sie mindestens eine E-Mail-Adresse aus.')
-                    return render(request, 'admin/reports/manual_report.html', {'form': form, 'title': 'Manuellen Report erstellen'})
+                    return TemplateResponse(request, 'admin/reports/manual_report.html', {'form': form, 'title': 'Manuellen Report erstellen'})
                 
                 generator = ReportGenerator(
                     date_from=form.cleaned_data['date_from'],
                     date_to=form.cleaned_data['date_to'],
-                    include_naturschutzbehoerde=form.cleaned_data['include_naturschutzbehörde'],
-                    include_jagdbehoerde=form.cleaned_data['include_jagdbehörde']
+                    include_naturschutzbehoerde=form.cleaned_data['include_naturschutzbehoerde'],
+                    include_jagdbehoerde=form.cleaned_data['include_jagdbehoerde']
                 )
                 
-                report_log, success, error = generator.send_email_report(email_list)
+                report_log, success, error = await generator.asend_email_report(email_list)
                 
                 if success:
                     messages.success(
@@ -92,7 +98,9 @@ def manual_report(request):
         'form': form,
         'title': 'Manuellen Report erstellen',
     }
-    return render(request, 'admin/reports/manual_report.html', context)
+    # TemplateResponse is rendered by the handler outside the event loop,
+    # where context processors may query the database.
+    return TemplateResponse(request, 'admin/reports/manual_report.html', context)
 
 
 @staff_member_required
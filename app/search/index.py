@@ -0,0 +1,172 @@
+"""Searchable models and the maintenance of their search vectors.
+
+Each source lists the weighted fields of its ``search_vector`` column. On
+PostgreSQL the column is refreshed with a single ``UPDATE`` after every save,
+so the database computes the vector with the German configuration from the
+stored values. Other databases keep the column empty and are searched with
+``icontains`` instead.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import reduce
+from operator import add
+from typing import Any, Callable, Optional
+
+from django.contrib.postgres.search import SearchVector
+from django.db import connections
+from django.db.models import Q
+from django.db.models.signals import post_save
+from django.urls import reverse
+from django.utils.translation import gettext_lazy as _
+
+from bird.models import Bird, FallenBird
+from contact.models import Contact
+from notizen.models import Notiz, Page
+
+CONFIG = "german"
+
+
+@dataclass(frozen=True, slots=True)
+class SearchHit:
+    title: str
+    detail: str
+    url: str
+
+
+@dataclass(frozen=True, slots=True)
+class Source:
+    label: str
+    model: type
+    fields: tuple[tuple[str, str], ...]
+    # Short fields compared by trigram similarity when nothing matches.
+    trigram_fields: tuple[str, ...]
+    hit: Callable[..., SearchHit]
+    select_related: tuple[str, ...] = ()
+    prefetch_related: tuple[str, ...] = ()
+    # Restricts the records a user may find beyond the tenant scope.
+    visible: Optional[Callable[[Any], Q]] = None
+
+    @property
+    def field_names(self) -> frozenset[str]:
+        return frozenset(name for name, _weight in self.fields)
+
+    def vector(self) -> SearchVector:
+        return reduce(add, (SearchVector(name, weight=weight, config=CONFIG) for name, weight in self.fields))
+
+
+def _join(*parts) -> str:
+    return " · ".join(str(part) for part in parts if part)
+
+
+# Where notes attached to an overview page or a record are shown.
+NOTE_PAGE_URLS = {
+    "patient_overview": "bird_all",
+    "aviary_overview": "aviary_all",
+    "costs_overview": "costs_all",
+    "contact_overview": "contact_all",
+}
+NOTE_OBJECT_URLS = {
+    "bird.fallenbird": "bird_single",
+    "aviary.aviary": "aviary_single",
+    "costs.costs": "costs_edit",
+}
+
+
+def _note_url(note: Notiz) -> str:
+    if note.content_type_id is None:
+        return note.get_absolute_url()
+    target = note.content_object
+    if isinstance(target, Page):
+        name = NOTE_PAGE_URLS.get(target.identifier)
+        return reverse(name) if name else ""
+    name = NOTE_OBJECT_URLS.get(target._meta.label_lower) if target is not None else None
+    return reverse(name, args=[target.pk]) if name else ""
+
+
+def _note_hit(note: Notiz) -> SearchHit:
+    attached = note.content_object if note.content_type_id else None
+    return SearchHit(note.name, _join(attached, note.geaendert_am.strftime("%d.%m.%Y")), _note_url(note))
+
+
+SOURCES = (
+    Source(
+        label=_("Patienten"),
+        model=FallenBird,
+        fields=(("bird_identifier", "A"), ("place", "B"), ("diagnostic_finding", "B")),
+        trigram_fields=("bird_identifier", "place"),
+        select_related=("bird",),
+        hit=lambda patient: SearchHit(
+            patient.bird_identifier,
+            _join(patient.bird, patient.place, patient.diagnostic_finding),
+            reverse("bird_single", args=[patient.pk]),
+        ),
+    ),
+    Source(
+        label=_("Vogelarten"),
+        model=Bird,
+        fields=(("name", "A"), ("species", "A"), ("description", "C")),
+        trigram_fields=("name", "species"),
+        hit=lambda bird: SearchHit(bird.name, bird.species or "", reverse("bird_help_single", args=[bird.pk])),
+    ),
+    Source(
+        label=_("Kontakte"),
+        model=Contact,
+        fields=(
+            ("name", "A"),
+            ("first_name", "A"),
+            ("last_name", "A"),
+            ("city", "B"),
+            ("email", "B"),
+            ("notes", "C"),
+        ),
+        trigram_fields=("name", "last_name"),
+        hit=lambda contact: SearchHit(
+            contact.name or contact.full_name,
+            _join(contact.city, contact.phone, contact.email),
+            reverse("contact_all"),
+        ),
+    ),
+    Source(
+        label=_("Notizen"),
+        model=Notiz,
+        fields=(("name", "A"), ("inhalt", "B")),
+        trigram_fields=("name",),
+        hit=_note_hit,
+        prefetch_related=("content_object",),
+        # Standalone notes are private to their author; attached notes are
+        # shown to everyone who sees the page or record.
+        visible=lambda user: Q(erstellt_von=user) | Q(content_type__isnull=False),
+    ),
+)
+
+_BY_MODEL = {source.model: source for source in SOURCES}
+
+
+def supports_full_text(using: str = "default") -> bool:
+    return connections[using].vendor == "postgresql"
+
+
+def refresh_vector(sender, instance, raw=False, using="default", update_fields=None, **kwargs) -> None:
+    source = _BY_MODEL[sender]
+    if raw or not supports_full_text(using):
+        return
+    if update_fields is not None and not source.field_names & set(update_fields):
+        return
+    # ``update()`` sends no signals, so the audit trail does not see it.
+    sender._base_manager.using(using).filter(pk=instance.pk).update(search_vector=source.vector())
+
+
+def rebuild(source: Source, missing_only: bool = False, using: str = "default") -> int:
+    """Recompute the vectors of ``source``; returns the number of rows."""
+
+    queryset = source.model._base_manager.using(using)
+    if missing_only:
+        queryset = queryset.filter(search_vector__isnull=True)
+    return queryset.update(search_vector=source.vector())
+
+
+def connect() -> None:
+    for source in SOURCES:
+        post_save.connect(refresh_vector, sender=source.model, dispatch_uid=f"search:{source.model._meta.label}")
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from search.index import SOURCES, rebuild, supports_full_text
+
+
+class Command(BaseCommand):
+    help = "Suchindex (search_vector) für Patienten, Vogelarten, Kontakte und Notizen neu berechnen."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--missing",
+            action="store_true",
+            help="Nur Einträge ohne Suchindex berechnen, z. B. nach dem ersten Deployment.",
+        )
+
+    def handle(self, *args, **options):
+        if not supports_full_text():
+            self.stdout.write("Volltextsuche benötigt PostgreSQL; nichts zu tun.")
+            return
+        for source in SOURCES:
+            count = rebuild(source, missing_only=options["missing"])
+            self.stdout.write(f"{source.label}: {count} Einträge indiziert")
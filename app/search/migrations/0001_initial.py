@@ -0,0 +1,72 @@
+from functools import reduce
+from operator import add
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+# Trigram indexes need the gin_trgm_ops operator class, which only exists on
+# PostgreSQL, so they are created here instead of in the models' Meta.
+TRIGRAM_INDEXES = [
+    ("patient_alias_trgm_idx", "bird_fallenbird", "bird_identifier"),
+    ("patient_place_trgm_idx", "bird_fallenbird", "place"),
+    ("bird_name_trgm_idx", "bird_bird", "name"),
+    ("bird_species_trgm_idx", "bird_bird", "species"),
+    ("contact_name_trgm_idx", "contact_contact", "name"),
+    ("contact_last_name_trgm_idx", "contact_contact", "last_name"),
+    ("notiz_name_trgm_idx", "notizen_notiz", "name"),
+]
+
+# Weighted fields of each search_vector column at the time of this migration;
+# later changes to search.index recompute the vectors in their own migration.
+VECTOR_FIELDS = [
+    ("bird", "FallenBird", (("bird_identifier", "A"), ("place", "B"), ("diagnostic_finding", "B"))),
+    ("bird", "Bird", (("name", "A"), ("species", "A"), ("description", "C"))),
+    (
+        "contact",
+        "Contact",
+        (("name", "A"), ("first_name", "A"), ("last_name", "A"), ("city", "B"), ("email", "B"), ("notes", "C")),
+    ),
+    ("notizen", "Notiz", (("name", "A"), ("inhalt", "B"))),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" USING gin ("{column}" gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, _table, _column in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{name}"')
+
+
+def build_vectors(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    alias = schema_editor.connection.alias
+    for app_label, model_name, fields in VECTOR_FIELDS:
+        model = apps.get_model(app_label, model_name)
+        vector = reduce(add, (SearchVector(name, weight=weight, config="german") for name, weight in fields))
+        model._base_manager.using(alias).filter(search_vector__isnull=True).update(search_vector=vector)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bird", "0013_bird_search_vector_fallenbird_search_vector_and_more"),
+        ("contact", "0006_contact_search_vector_contact_contact_search_idx"),
+        ("notizen", "0007_notiz_search_vector_notiz_notiz_search_idx"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+        migrations.RunPython(build_vectors, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,114 @@
+"""Global search across patients, species, contacts and notes.
+
+On PostgreSQL every source is queried through its GIN indexed
+``search_vector`` and ranked with ``SearchRank``. Sources without a match
+are searched again by trigram word similarity on a few short fields, which
+finds misspelt names. Each source costs one query; results follow the
+tenant scope of the default managers, and standalone notes are only found
+by their author.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import reduce
+from operator import or_
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramWordSimilarity
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.db.models.functions import Greatest
+
+from .index import CONFIG, SOURCES, SearchHit, Source, supports_full_text
+
+MIN_QUERY_LENGTH = 2
+RESULTS_PER_SOURCE = 10
+# pg_trgm's default of 0.6 misses most single typos in short words.
+WORD_SIMILARITY_THRESHOLD = 0.4
+
+
+@dataclass(slots=True)
+class SearchSection:
+    label: str
+    hits: list[SearchHit] = field(default_factory=list)
+    fuzzy: bool = False
+
+
+def _visible(source: Source, user):
+    queryset = source.model.objects.all()
+    if source.visible is not None:
+        queryset = queryset.filter(source.visible(user))
+    return queryset
+
+
+def _ranked(source: Source, query: str, user):
+    search_query = SearchQuery(query, config=CONFIG, search_type="websearch")
+    return (
+        _visible(source, user)
+        .filter(search_vector=search_query)
+        .annotate(rank=SearchRank(F("search_vector"), search_query))
+        .order_by("-rank")
+    )
+
+
+def _similar(source: Source, query: str, user):
+    condition = reduce(or_, (Q(**{f"{name}__trigram_word_similar": query}) for name in source.trigram_fields))
+    similarity = [TrigramWordSimilarity(query, name) for name in source.trigram_fields]
+    return (
+        _visible(source, user)
+        .filter(condition)
+        .annotate(similarity=Greatest(*similarity) if len(similarity) > 1 else similarity[0])
+        .order_by("-similarity")
+    )
+
+
+def _contains(source: Source, query: str, user):
+    condition = reduce(or_, (Q(**{f"{name}__icontains": query}) for name, _weight in source.fields))
+    return _visible(source, user).filter(condition)
+
+
+def _fetch(source: Source, queryset) -> list[SearchHit]:
+    if source.select_related:
+        queryset = queryset.select_related(*source.select_related)
+    if source.prefetch_related:
+        queryset = queryset.prefetch_related(*source.prefetch_related)
+    return [source.hit(obj) for obj in queryset.defer("search_vector")[:RESULTS_PER_SOURCE]]
+
+
+def search(query: str, user) -> list[SearchSection]:
+    """Return one section per source with at least one hit.
+
+    :param query: User input; quotes, ``or`` and ``-`` follow the
+        ``websearch_to_tsquery`` syntax.
+    :param user: User searching; private records of others are left out.
+    :returns: Sections in source order, each with at most
+        ``RESULTS_PER_SOURCE`` hits, best match first.
+    """
+
+    query = query.strip()
+    if len(query) < MIN_QUERY_LENGTH:
+        return []
+
+    sections = []
+    if not supports_full_text():
+        for source in SOURCES:
+            sections.append(SearchSection(str(source.label), _fetch(source, _contains(source, query, user))))
+        return [section for section in sections if section.hits]
+
+    with transaction.atomic():
+        threshold_set = False
+        for source in SOURCES:
+            section = SearchSection(str(source.label), _fetch(source, _ranked(source, query, user)))
+            if not section.hits and source.trigram_fields:
+                if not threshold_set:
+                    # Lets the %> operator, and with it the trigram indexes, use our threshold.
+                    with connection.cursor() as cursor:
+                        cursor.execute(
+                            "SELECT set_config('pg_trgm.word_similarity_threshold', %s, true)",
+                            [str(WORD_SIMILARITY_THRESHOLD)],
+                        )
+                    threshold_set = True
+                section.hits = _fetch(source, _similar(source, query, user))
+                section.fuzzy = True
+            sections.append(section)
+    return [section for section in sections if section.hits]
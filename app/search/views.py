@@ -0,0 +1,17 @@
+from django.contrib.auth.decorators import login_required
+from django.shortcuts import render
+
+from .services import MIN_QUERY_LENGTH, search
+
+
+@login_required(login_url="account_login")
+def search_view(request):
+    """Show the hits of all searchable models for ``?q=``."""
+
+    query = request.GET.get("q", "").strip()
+    context = {
+        "query": query,
+        "sections": search(query, request.user),
+        "too_short": 0 < len(query) < MIN_QUERY_LENGTH,
+    }
+    return render(request, "search/results.html", context)
@@ -8,3 +8,12 @@ class StationsConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "stations"
+
+    def ready(self) -> None:
+        """! @brief Invalidate the cached map data when stations change."""
+
+        from core.cache import invalidate_on_change
+
+        from .models import StationMapSettings, WildbirdHelpStation
+
+        invalidate_on_change("stations", WildbirdHelpStation, StationMapSettings)
@@ -8,6 +8,7 @@ from decimal import Decimal
 from typing import Any
 
 import requests
+from asgiref.sync import sync_to_async
 from django.conf import settings
 
 logger = logging.getLogger(__name__)
@@ -118,6 +119,16 @@ def geocode_address(
     return GeocodingResult(latitude=lat, longitude=lon, raw=raw)
 
 
+async def ageocode_address(**kwargs: Any) -> GeocodingResult | None:
+    """! @brief Async variant of ``geocode_address``.
+
+    The HTTP request runs in a worker thread so the event loop stays free
+    while Nominatim answers.
+    """
+
+    return await sync_to_async(geocode_address, thread_sensitive=False)(**kwargs)
+
+
 def geocode_station(station) -> GeocodingResult | None:
     """! @brief Convenience wrapper for a ``WildbirdHelpStation`` instance."""
 
@@ -133,3 +144,9 @@ def geocode_station(station) -> GeocodingResult | None:
         country=getattr(station, "country", None),
         fallback_query=fallback,
     )
+
+
+async def ageocode_station(station) -> GeocodingResult | None:
+    """! @brief Async variant of ``geocode_station``."""
+
+    return await sync_to_async(geocode_station, thread_sensitive=False)(station)
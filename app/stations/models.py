@@ -6,7 +6,7 @@ from decimal import Decimal
 from typing import Any
 
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 from django.utils.translation import gettext_lazy as _
 
 
@@ -89,6 +89,12 @@ class WildbirdHelpStation(models.Model):
         ordering = ("name",)
         unique_together = (("name", "city", "country"),)
 
+    def save(self, *args, **kwargs) -> None:
+        """! @brief Save together with the rows written by signal receivers (webhook outbox)."""
+
+        with transaction.atomic(using=kwargs.get("using")):
+            super().save(*args, **kwargs)
+
     def __str__(self) -> str:
         """! @brief Provide a readable representation for admin drop-downs."""
 
@@ -9,6 +9,7 @@ from decimal import Decimal, InvalidOperation
 from io import StringIO
 from typing import Any, BinaryIO
 
+from asgiref.sync import sync_to_async
 from django.conf import settings as django_settings
 from django.core.mail import send_mail
 from django.db import transaction
@@ -16,7 +17,7 @@ from django.urls import reverse
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
-from .geocoding import geocode_station
+from .geocoding import ageocode_station, geocode_station
 from .models import (
     StationReport,
     StationReportSettings,
@@ -232,12 +233,14 @@ def get_map_settings() -> StationMapSettings:
     return obj
 
 
-def notify_new_station_report(report: StationReport) -> None:
-    """! @brief Send an optional notification for a freshly filed report."""
+def _report_notification(report: StationReport, settings_obj: StationReportSettings) -> dict[str, Any] | None:
+    """! @brief Build the ``send_mail`` arguments for a report notification.
+
+    :returns: Keyword arguments for ``send_mail`` or ``None`` without recipient.
+    """
 
-    settings_obj = get_report_settings()
     if not settings_obj.notification_email:
-        return
+        return None
 
     subject = _("Neuer Wildvogelhilfe-Vorschlag: %(name)s") % {"name": report.name}
     admin_path = reverse("admin:stations_stationreport_change", args=[report.pk])
@@ -253,7 +256,8 @@ def notify_new_station_report(report: StationReport) -> None:
     reporter_block = "\n".join(reporter_lines) if reporter_lines else _("Keine Kontaktdaten angegeben.")
 
     message = "\n".join(
-        [
+        str(line)
+        for line in [
             _("Es wurde ein neuer Vorschlag für die Wildvogelhilfen-Karte eingereicht."),
             "",
             f"Station: {report.name}",
@@ -268,14 +272,34 @@ def notify_new_station_report(report: StationReport) -> None:
         ]
     )
 
-    from_email = getattr(django_settings, "DEFAULT_FROM_EMAIL", "noreply@example.com")
-    send_mail(
-        subject,
-        message,
-        from_email,
-        [settings_obj.notification_email],
-        fail_silently=True,
-    )
+    return {
+        "subject": subject,
+        "message": message,
+        "from_email": getattr(django_settings, "DEFAULT_FROM_EMAIL", "noreply@example.com"),
+        "recipient_list": [settings_obj.notification_email],
+        "fail_silently": True,
+    }
+
+
+def notify_new_station_report(report: StationReport) -> None:
+    """! @brief Send an optional notification for a freshly filed report."""
+
+    notification = _report_notification(report, get_report_settings())
+    if notification:
+        send_mail(**notification)
+
+
+async def anotify_new_station_report(report: StationReport) -> None:
+    """! @brief Async variant of ``notify_new_station_report``.
+
+    The SMTP conversation runs in a worker thread, so an ASGI worker keeps
+    serving other requests while the mail server responds.
+    """
+
+    settings_obj = await sync_to_async(get_report_settings)()
+    notification = _report_notification(report, settings_obj)
+    if notification:
+        await sync_to_async(send_mail, thread_sensitive=False)(**notification)
 
 
 def mark_reports(
@@ -323,6 +347,24 @@ def update_station_coordinates(
     return True, None
 
 
+async def aupdate_station_coordinates(
+    station: WildbirdHelpStation,
+) -> tuple[bool, str | None]:
+    """! @brief Async variant of ``update_station_coordinates``."""
+
+    if not station.postal_code and not station.address and not station.city:
+        return False, _("Keine ausreichend genaue Adresse vorhanden.")
+
+    result = await ageocode_station(station)
+    if not result:
+        return False, _("Geocoding war nicht erfolgreich.")
+
+    station.latitude = result.latitude
+    station.longitude = result.longitude
+    await station.asave(update_fields=["latitude", "longitude", "updated_at"])
+    return True, None
+
+
 def batch_update_coordinates(
     queryset: list[WildbirdHelpStation],
 ) -> tuple[int, list[str]]:
@@ -0,0 +1,57 @@
+"""Tests für die asynchronen Views und Services der Stationskarte."""
+
+from __future__ import annotations
+
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.core import mail
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from stations.geocoding import ageocode_address
+from stations.models import StationReport, StationReportSettings
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class StationReportViewAsyncTests(TestCase):
+    def test_report_is_stored_and_notification_sent(self):
+        StationReportSettings.objects.create(pk=1, notification_email="alerts@example.org")
+        url = reverse("stations:report")
+
+        self.assertEqual(self.client.get(url).status_code, 200)
+
+        response = self.client.post(
+            url,
+            data={
+                "name": "Igel- und Vogelhilfe",
+                "postal_code": "07743",
+                "city": "Jena",
+                "country": "Deutschland",
+                "reporter_email": "melder@example.org",
+                "privacy_confirmed": "on",
+            },
+        )
+
+        self.assertRedirects(response, url)
+        self.assertTrue(StationReport.objects.filter(name="Igel- und Vogelhilfe").exists())
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["alerts@example.org"])
+
+    def test_invalid_report_renders_form_again(self):
+        response = self.client.post(reverse("stations:report"), data={"name": ""})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(StationReport.objects.exists())
+        self.assertEqual(len(mail.outbox), 0)
+
+
+class AsyncGeocodingTests(TestCase):
+    def test_ageocode_address_runs_sync_lookup(self):
+        with mock.patch("stations.geocoding._request", return_value={"lat": "50.9", "lon": "11.6"}) as request:
+            result = async_to_sync(ageocode_address)(
+                street=None, postal_code="07743", city="Jena", state=None, country="Deutschland"
+            )
+
+        self.assertEqual(str(result.latitude), "50.9")
+        self.assertEqual(request.call_args.args[0]["countrycodes"], "de")
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from asgiref.sync import sync_to_async
 from django.contrib import messages
 from django.http import (
     HttpRequest,
@@ -15,13 +16,16 @@ from django.utils.http import http_date
 import hashlib
 from django.db.models import Max
 from django.urls import reverse, reverse_lazy
+from django.utils.decorators import method_decorator
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import TemplateView, View
 from django.views.generic.edit import CreateView
 
+from core.cache import cache_policy, get_or_build
+
 from .forms import StationReportForm
 from .models import WildbirdHelpStation
-from .services import notify_new_station_report, get_map_settings
+from .services import anotify_new_station_report, get_map_settings
 
 
 class StationMapView(TemplateView):
@@ -29,6 +33,12 @@ class StationMapView(TemplateView):
 
     template_name = "stations/map.html"
 
+    @method_decorator(cache_policy("stations"))
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        """! @brief Render the map, answering revalidations with ``304``."""
+
+        return super().get(request, *args, **kwargs)
+
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         """! @brief Provide template context including station metrics.
 
@@ -36,14 +46,17 @@ class StationMapView(TemplateView):
         """
 
         context = super().get_context_data(**kwargs)
-        queryset = WildbirdHelpStation.objects.filter(approved_for_publication=True)
         context.update(
-            {
-                "station_count": queryset.count(),
-                "data_url": reverse("stations:data"),
-                "map_settings": get_map_settings(),
-            }
+            get_or_build(
+                "stations",
+                ("map",),
+                lambda: {
+                    "station_count": WildbirdHelpStation.objects.filter(approved_for_publication=True).count(),
+                    "map_settings": get_map_settings(),
+                },
+            )
         )
+        context["data_url"] = reverse("stations:data")
         return context
 
 
@@ -54,17 +67,18 @@ class StationDataView(View):
     - ETag basiert auf (max(updated_at), Anzahl) für schnelle Ungleichheitsprüfung.
     - Cache-Control erlaubt Revalidation (kein Blind-Caching alter Daten).
     - 304 Responses enthalten konsistente Header.
+    - Asynchron, damit ASGI-Worker während der Datenbankabfragen frei bleiben.
     """
 
-    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+    async def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
         qs = (
             WildbirdHelpStation.objects.filter(approved_for_publication=True)
             .order_by("country", "state", "name")
         )
 
-        agg = qs.aggregate(last=Max("updated_at"))
+        agg = await qs.aaggregate(last=Max("updated_at"))
         last_modified = agg.get("last")
-        etag_source = f"{last_modified.isoformat() if last_modified else 'no-ts'}:{qs.count()}".encode("utf-8")
+        etag_source = f"{last_modified.isoformat() if last_modified else 'no-ts'}:{await qs.acount()}".encode("utf-8")
         try:
             etag = hashlib.md5(etag_source, usedforsecurity=False).hexdigest()  # type: ignore[arg-type]
         except TypeError:
@@ -79,7 +93,7 @@ class StationDataView(View):
                 resp_304["Last-Modified"] = http_date(last_modified.timestamp())
             return resp_304
 
-        payload = [obj.to_map_payload() for obj in qs]
+        payload = [obj.to_map_payload() async for obj in qs]
         resp = JsonResponse(payload, safe=False)
         resp["Cache-Control"] = "public, max-age=0, must-revalidate"
         resp["ETag"] = f'"{etag}"'
@@ -89,23 +103,41 @@ class StationDataView(View):
 
 
 class StationReportView(CreateView):
-    """! @brief Public form endpoint for proposing new stations."""
+    """! @brief Public form endpoint for proposing new stations.
+
+    Die Handler sind asynchron: Das Versenden der Benachrichtigung blockiert
+    unter ASGI keinen Worker. Formular und Datenbank laufen synchron im
+    Thread-Pool.
+    """
 
     template_name = "stations/report_form.html"
     form_class = StationReportForm
     success_url = reverse_lazy("stations:report")
 
-    def form_valid(self, form: StationReportForm) -> HttpResponseRedirect:
-        """! @brief Persist the suggestion and send optional notifications."""
+    async def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        """! @brief Render the empty form; the response is rendered by the handler."""
+
+        return super().get(request, *args, **kwargs)
+
+    async def post(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        """! @brief Validate and store the suggestion, then notify asynchronously."""
 
-        self.object = form.save()
-        notify_new_station_report(self.object)
+        self.object = None
+        form = self.get_form()
+        if not await sync_to_async(form.is_valid)():
+            return self.form_invalid(form)
+
+        self.object = await sync_to_async(form.save)()
+        await anotify_new_station_report(self.object)
         messages.success(
-            self.request,
+            request,
             _("Vielen Dank! Wir prüfen den Vorschlag zeitnah."),
         )
         return HttpResponseRedirect(self.get_success_url())
 
+    async def put(self, *args: Any, **kwargs: Any) -> HttpResponse:
+        return await self.post(*args, **kwargs)
+
     def get_initial(self) -> dict[str, Any]:
         """! @brief Provide sensible defaults for the form."""
 
@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models import Count
 from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 from .models import StatisticIndividual, StatisticYearGroup, StatisticTotalGroup, StatisticConfiguration
@@ -41,11 +42,16 @@ class StatisticIndividualAdmin(admin.ModelAdmin):
         )
     color_display.short_description = _("Farbe")
     
+    def get_queryset(self, request):
+        # Names for __str__ come from the prefetched status list.
+        queryset = super().get_queryset(request).prefetch_related('status_list')
+        return queryset.annotate(status_total=Count('status_list'))
+
     def status_count(self, obj):
         """Zeigt die Anzahl der zugeordneten Status an."""
-        count = obj.status_list.count()
-        return f"{count} Status"
+        return f"{obj.status_total} Status"
     status_count.short_description = _("Anzahl Status")
+    status_count.admin_order_field = 'status_total'
     
     def get_form(self, request, obj=None, **kwargs):
         """Bereite das Form für erweiterte Farbauswahl vor."""
@@ -107,11 +113,16 @@ class StatisticYearGroupAdmin(admin.ModelAdmin):
         )
     color_display.short_description = _("Farbe")
     
+    def get_queryset(self, request):
+        # Names for __str__ come from the prefetched status list.
+        queryset = super().get_queryset(request).prefetch_related('status_list')
+        return queryset.annotate(status_total=Count('status_list'))
+
     def status_count(self, obj):
         """Zeigt die Anzahl der zugeordneten Status an."""
-        count = obj.status_list.count()
-        return f"{count} Status"
+        return f"{obj.status_total} Status"
     status_count.short_description = _("Anzahl Status")
+    status_count.admin_order_field = 'status_total'
     
     def get_form(self, request, obj=None, **kwargs):
         """Bereite das Form für erweiterte Farbauswahl vor."""
@@ -173,11 +184,16 @@ class StatisticTotalGroupAdmin(admin.ModelAdmin):
         )
     color_display.short_description = _("Farbe")
     
+    def get_queryset(self, request):
+        # Names for __str__ come from the prefetched status list.
+        queryset = super().get_queryset(request).prefetch_related('status_list')
+        return queryset.annotate(status_total=Count('status_list'))
+
     def status_count(self, obj):
         """Zeigt die Anzahl der zugeordneten Status an."""
-        count = obj.status_list.count()
-        return f"{count} Status"
+        return f"{obj.status_total} Status"
     status_count.short_description = _("Anzahl Status")
+    status_count.admin_order_field = 'status_total'
     
     def get_form(self, request, obj=None, **kwargs):
         """Bereite das Form für erweiterte Farbauswahl vor."""
@@ -5,3 +5,26 @@ class StatisticConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'statistic'
     verbose_name = 'Statistik'
+
+    def ready(self):
+        from core.cache import invalidate_on_change
+        from bird.models import Bird, BirdStatus, Circumstance, FallenBird
+
+        from .models import (
+            StatisticConfiguration,
+            StatisticIndividual,
+            StatisticTotalGroup,
+            StatisticYearGroup,
+        )
+
+        invalidate_on_change(
+            'statistic',
+            FallenBird,
+            Bird,
+            BirdStatus,
+            Circumstance,
+            StatisticConfiguration,
+            StatisticIndividual,
+            StatisticTotalGroup,
+            StatisticYearGroup,
+        )
@@ -52,7 +52,7 @@ class StatisticIndividual(models.Model):
     
     def get_status_names(self):
         """Gibt eine kommaseparierte Liste der Status-Namen zurück."""
-        return ", ".join(self.status_list.values_list('description', flat=True))
+        return ", ".join(status.description for status in self.status_list.all())
     
     def get_css_color(self):
         """Gibt die CSS-Farbe für die Anzeige zurück."""
@@ -107,7 +107,7 @@ class StatisticYearGroup(models.Model):
     
     def get_status_names(self):
         """Gibt eine kommaseparierte Liste der Status-Namen zurück."""
-        return ", ".join(self.status_list.values_list('description', flat=True))
+        return ", ".join(status.description for status in self.status_list.all())
 
 
 class StatisticTotalGroup(models.Model):
@@ -158,7 +158,7 @@ class StatisticTotalGroup(models.Model):
     
     def get_status_names(self):
         """Gibt eine kommaseparierte Liste der Status-Namen zurück."""
-        return ", ".join(self.status_list.values_list('description', flat=True))
+        return ", ".join(status.description for status in self.status_list.all())
 
 
 class StatisticConfiguration(models.Model):
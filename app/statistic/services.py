@@ -15,6 +15,7 @@ from django.db.models import Count, Min
 from django.utils import timezone
 
 from bird.models import Bird, FallenBird
+from core.cache import latest_update
 
 from .models import (
     StatisticConfiguration,
@@ -57,6 +58,18 @@ class YearContext:
         return self.selected_year + 1 if self.can_go_next else None
 
 
+API_SECTIONS = ("year", "total", "species", "circumstances")
+
+
+def _api_groups(items: Iterable[dict]) -> list[dict]:
+    """Strip presentation details such as colours and bar widths."""
+
+    return [
+        {"name": item["name"], "count": item["count"], "percentage": item["percentage"]}
+        for item in items
+    ]
+
+
 class StatisticsBuilder:
     """Aggregate statistics for the dashboard in a reusable fashion."""
 
@@ -114,6 +127,7 @@ class StatisticsBuilder:
             "year_summary": [],
             "total_summary": [],
             "statistic_individuals": self.individual_groups,
+            "legend_updated": latest_update(self.individual_groups),
         }
 
         if self.config.show_year_total_patients:
@@ -138,6 +152,50 @@ class StatisticsBuilder:
 
         return context
 
+    def build_api_payload(self, section: str) -> dict | None:
+        """Return the aggregates of one section for the JSON API.
+
+        :param section: One of :data:`API_SECTIONS`.
+        :returns: JSON-serialisable dictionary or ``None`` when the active
+            configuration hides the section.
+        """
+
+        if section == "year":
+            if not self.config.show_year_total_patients:
+                return None
+            patients, summary = self._build_year_statistics()
+            return {
+                "year": self.year_context.selected_year,
+                "earliest_year": self.year_context.earliest_year,
+                "patients": patients,
+                "groups": _api_groups(summary),
+            }
+        if section == "total":
+            if not self.config.show_total_patients:
+                return None
+            patients, summary = self._build_total_statistics()
+            return {"patients": patients, "groups": _api_groups(summary)}
+        if section == "species":
+            return {
+                "species": [
+                    {
+                        "name": entry["name"],
+                        "species": entry["species"],
+                        "total": entry["total"],
+                        "groups": _api_groups(entry["groups"]),
+                    }
+                    for entry in self._build_bird_statistics()
+                ]
+            }
+        if section == "circumstances":
+            year_items, year_total, all_items, all_total = self._build_circumstances()
+            return {
+                "year": self.year_context.selected_year,
+                "this_year": {"total": year_total, "circumstances": _api_groups(year_items)},
+                "all_time": {"total": all_total, "circumstances": _api_groups(all_items)},
+            }
+        raise ValueError(f"Unknown statistics section: {section}")
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
@@ -15,8 +15,8 @@ from .models import (
 )
 
 
-class StatisticViewTests(TestCase):
-    """Integration tests for the statistics overview view."""
+class StatisticDataMixin:
+    """Statuses, groups and patients shared by the view and API tests."""
 
     def setUp(self):
         self.user = User.objects.create_user(
@@ -122,6 +122,10 @@ class StatisticViewTests(TestCase):
             find_circumstances=self.circumstance_cat,
         )
 
+
+class StatisticViewTests(StatisticDataMixin, TestCase):
+    """Integration tests for the statistics overview view."""
+
     def test_overview_context_contains_expected_data(self):
         response = self.client.get(reverse("statistic:overview"))
         self.assertEqual(response.status_code, 200)
@@ -162,3 +166,64 @@ class StatisticViewTests(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.context["selected_year"], timezone.now().year)
         self.assertFalse(response.context["can_go_next"])
+
+
+class StatisticApiTests(StatisticDataMixin, TestCase):
+    """The public JSON API for partners."""
+
+    def setUp(self):
+        super().setUp()
+        self.client.logout()
+
+    def test_year_payload(self):
+        response = self.client.get(reverse("statistic:api_year"))
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["year"], timezone.now().year)
+        self.assertEqual(data["patients"], 2)
+        self.assertIn({"name": "Ausgewildert", "count": 1, "percentage": 50.0}, data["groups"])
+        self.assertEqual(response["Cache-Control"], "public, max-age=0, must-revalidate")
+
+    def test_species_and_circumstances(self):
+        species = self.client.get(reverse("statistic:api_species")).json()["species"]
+        self.assertEqual([entry["name"] for entry in species], ["Mauersegler", "Waldkauz"])
+
+        previous_year = timezone.now().year - 1
+        circumstances = self.client.get(
+            reverse("statistic:api_circumstances") + f"?year={previous_year}"
+        ).json()
+        self.assertEqual(circumstances["year"], previous_year)
+        self.assertEqual(circumstances["this_year"]["total"], 1)
+        self.assertEqual(circumstances["all_time"]["total"], 3)
+
+    def test_revalidation_needs_no_queries(self):
+        first = self.client.get(reverse("statistic:api_total"))
+
+        with self.assertNumQueries(0):
+            by_etag = self.client.get(reverse("statistic:api_total"), HTTP_IF_NONE_MATCH=first["ETag"])
+            by_date = self.client.get(
+                reverse("statistic:api_total"), HTTP_IF_MODIFIED_SINCE=first["Last-Modified"]
+            )
+
+        self.assertEqual(by_etag.status_code, 304)
+        self.assertEqual(by_date.status_code, 304)
+        self.assertEqual(by_etag["ETag"], first["ETag"])
+
+    def test_changes_produce_a_new_version(self):
+        first = self.client.get(reverse("statistic:api_total"))
+        FallenBird.objects.create(bird=self.bird_owl, status=self.status_dead)
+
+        response = self.client.get(reverse("statistic:api_total"), HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], first["ETag"])
+        self.assertEqual(response.json()["patients"], 4)
+
+    def test_hidden_sections_are_not_served(self):
+        self.config.show_total_patients = False
+        self.config.save()
+
+        response = self.client.get(reverse("statistic:api_total"))
+
+        self.assertEqual(response.status_code, 404)
@@ -5,4 +5,12 @@ app_name = 'statistic'
 
 urlpatterns = [
     path('', views.StatisticView.as_view(), name='overview'),
+    path('api/year/', views.StatisticApiView.as_view(section='year', yearly=True), name='api_year'),
+    path('api/total/', views.StatisticApiView.as_view(section='total'), name='api_total'),
+    path('api/species/', views.StatisticApiView.as_view(section='species'), name='api_species'),
+    path(
+        'api/circumstances/',
+        views.StatisticApiView.as_view(section='circumstances', yearly=True),
+        name='api_circumstances',
+    ),
 ]
@@ -4,8 +4,17 @@ The view logic delegates heavy lifting to ``StatisticsBuilder`` to keep the
 class small and easy to reason about while also improving performance.
 """
 
+import hashlib
+
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.views.generic import TemplateView
+from django.http import Http404, JsonResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.decorators import method_decorator
+from django.utils.http import http_date
+from django.views.generic import TemplateView, View
+
+from core.cache import cache_policy, get_or_build, scoped_version, tenant_namespace
 
 from .services import StatisticsBuilder
 
@@ -15,6 +24,10 @@ class StatisticView(LoginRequiredMixin, TemplateView):
 
     template_name = "statistic/overview.html"
 
+    @method_decorator(cache_policy("statistic", per_tenant=True))
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
     def get_context_data(self, **kwargs):
         """Return the template context with aggregated statistics.
 
@@ -23,6 +36,61 @@ class StatisticView(LoginRequiredMixin, TemplateView):
         """
 
         context = super().get_context_data(**kwargs)
-        builder = StatisticsBuilder(self.request.GET.get("year"))
-        context.update(builder.build_context())
+        year = self.request.GET.get("year")
+        context.update(
+            get_or_build(
+                tenant_namespace("statistic"),
+                ("overview", year, timezone.localdate().isoformat()),
+                lambda: StatisticsBuilder(year).build_context(),
+            )
+        )
         return context
+
+
+class StatisticApiView(View):
+    """Serve one section of the aggregated statistics as public JSON.
+
+    The payload is cached per version of the ``statistic`` namespace and
+    carries an ETag derived from that version plus the time it was built as
+    ``Last-Modified``. Revalidating clients get a ``304`` from the cache
+    alone, so partners can poll often without touching the database.
+    """
+
+    section = ""
+    yearly = False
+
+    def get(self, request, *args, **kwargs):
+        current_year = timezone.localdate().year
+        year = self._requested_year(current_year) if self.yearly else None
+        parts = ("api", self.section, year, current_year)
+        namespace = tenant_namespace("statistic")
+
+        def build():
+            payload = StatisticsBuilder(str(year) if year else None).build_api_payload(self.section)
+            source = ":".join(str(part) for part in (scoped_version(namespace), *parts))
+            return {
+                "payload": payload,
+                "etag": f'"{hashlib.md5(source.encode("utf-8"), usedforsecurity=False).hexdigest()}"',
+                "modified": int(timezone.now().timestamp()),
+            }
+
+        entry = get_or_build(namespace, parts, build)
+        if entry["payload"] is None:
+            raise Http404("Dieser Statistikbereich ist nicht freigegeben.")
+
+        response = get_conditional_response(request, etag=entry["etag"], last_modified=entry["modified"])
+        if response is None:
+            response = JsonResponse(entry["payload"])
+        response["ETag"] = entry["etag"]
+        response["Last-Modified"] = http_date(entry["modified"])
+        response["Cache-Control"] = "public, max-age=0, must-revalidate"
+        return response
+
+    def _requested_year(self, current_year: int) -> int | None:
+        # Unknown values fall back to the current year, which also keeps
+        # arbitrary query strings from filling the cache.
+        try:
+            year = int(self.request.GET.get("year", ""))
+        except ValueError:
+            return None
+        return year if 1900 <= year <= current_year else None
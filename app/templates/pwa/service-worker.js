@@ -2,6 +2,113 @@
 const CACHE_NAME = '{{ cache_name }}';
 const OFFLINE_URL = '{{ offline_url }}';
 const PRECACHE_URLS = {{ precache_urls|safe }};
+const SYNC_URL = '{{ sync_url }}';
+const SYNC_DB = 'fbf-sync';
+const SYNC_STORES = ['patients', 'aviaries', 'species'];
+const SYNC_INTERVAL = 60 * 1000;
+
+let lastSync = 0;
+let runningSync = null;
+
+// Offline-Kopie der aktiven Patienten, Volieren und Vogelarten in IndexedDB.
+// Der Server liefert nur die seit dem letzten Token geänderten Zeilen sowie
+// die noch vorhandenen IDs; alles andere wird lokal entfernt.
+function openSyncDb() {
+  return new Promise((resolve, reject) => {
+    const request = indexedDB.open(SYNC_DB, 1);
+    request.onupgradeneeded = () => {
+      const db = request.result;
+      SYNC_STORES.forEach((name) => db.createObjectStore(name, { keyPath: 'id' }));
+      db.createObjectStore('statuses', { keyPath: 'id' });
+      db.createObjectStore('meta');
+    };
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+  });
+}
+
+function completeTransaction(tx) {
+  return new Promise((resolve, reject) => {
+    tx.oncomplete = () => resolve();
+    tx.onerror = () => reject(tx.error);
+    tx.onabort = () => reject(tx.error);
+  });
+}
+
+function readSyncToken(db) {
+  return new Promise((resolve) => {
+    const request = db.transaction('meta').objectStore('meta').get('token');
+    request.onsuccess = () => resolve(request.result || '');
+    request.onerror = () => resolve('');
+  });
+}
+
+function clearSyncData(db) {
+  const tx = db.transaction([...SYNC_STORES, 'statuses', 'meta'], 'readwrite');
+  [...SYNC_STORES, 'statuses', 'meta'].forEach((name) => tx.objectStore(name).clear());
+  return completeTransaction(tx);
+}
+
+function applySync(db, payload) {
+  const tx = db.transaction([...SYNC_STORES, 'statuses', 'meta'], 'readwrite');
+  SYNC_STORES.forEach((name) => {
+    const store = tx.objectStore(name);
+    const data = payload[name];
+    if (payload.full) {
+      store.clear();
+    } else {
+      const keep = new Set(data.ids.map(String));
+      store.getAllKeys().onsuccess = (event) => {
+        event.target.result
+          .filter((key) => !keep.has(String(key)))
+          .forEach((key) => store.delete(key));
+      };
+    }
+    data.changed.forEach((row) => store.put(row));
+  });
+  const statuses = tx.objectStore('statuses');
+  statuses.clear();
+  payload.statuses.forEach((row) => statuses.put(row));
+  const meta = tx.objectStore('meta');
+  meta.put(payload.token, 'token');
+  meta.put(new Date().toISOString(), 'synced_at');
+  return completeTransaction(tx);
+}
+
+function syncPatientData(force) {
+  if (runningSync) {
+    return runningSync;
+  }
+  if (!force && Date.now() - lastSync < SYNC_INTERVAL) {
+    return Promise.resolve();
+  }
+  runningSync = openSyncDb()
+    .then((db) => readSyncToken(db)
+      .then((token) => {
+        const url = token ? `${SYNC_URL}?since=${encodeURIComponent(token)}` : SYNC_URL;
+        return fetch(url, { credentials: 'same-origin', cache: 'no-store' });
+      })
+      .then((response) => {
+        const type = response.headers.get('Content-Type') || '';
+        if (response.redirected || response.status === 401 || response.status === 403) {
+          // Abgemeldet: keine Patientendaten auf dem Gerät zurücklassen.
+          return clearSyncData(db);
+        }
+        if (!response.ok || !type.includes('application/json')) {
+          return null;
+        }
+        return response.json().then((payload) => applySync(db, payload));
+      })
+      .finally(() => db.close()))
+    .then(() => {
+      lastSync = Date.now();
+    })
+    .catch(() => {})
+    .finally(() => {
+      runningSync = null;
+    });
+  return runningSync;
+}
 
 self.addEventListener('install', (event) => {
   event.waitUntil(
@@ -20,16 +127,33 @@ self.addEventListener('activate', (event) => {
           .filter((cacheName) => cacheName !== CACHE_NAME)
           .map((cacheName) => caches.delete(cacheName))
       );
-    })
+    }).then(() => syncPatientData(true))
   );
   self.clients.claim();
 });
 
+self.addEventListener('message', (event) => {
+  if (event.data && event.data.type === 'sync') {
+    event.waitUntil(syncPatientData(true));
+  }
+});
+
+self.addEventListener('sync', (event) => {
+  if (event.tag === 'fbf-sync') {
+    event.waitUntil(syncPatientData(true));
+  }
+});
+
 self.addEventListener('fetch', (event) => {
   if (event.request.method !== 'GET') {
     return;
   }
 
+  // Synchronisationsdaten nie aus dem Cache beantworten
+  if (new URL(event.request.url).pathname === SYNC_URL) {
+    return;
+  }
+
   // Network-first Strategie für Stationsdaten um veraltete 3-Datensatz-Version zu vermeiden
   if (event.request.url.includes('/stationen/daten/')) {
     event.respondWith(
@@ -53,6 +177,7 @@ self.addEventListener('fetch', (event) => {
           if (response && response.status === 200) {
             const copy = response.clone();
             caches.open(CACHE_NAME).then((cache) => cache.put(event.request, copy));
+            event.waitUntil(syncPatientData(false));
           }
           return response;
         })
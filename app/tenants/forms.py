@@ -0,0 +1,18 @@
+from .models import TenantManager
+
+
+class TenantScopedFormMixin:
+    """Offer and accept only records of the active organisation.
+
+    Model choice fields take their queryset from the default manager when the
+    form class is built at import time, where no organisation is active. The
+    querysets of scoped models are therefore narrowed again for every form
+    instance; other filters of the field are kept.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        for field in self.fields.values():
+            queryset = getattr(field, "queryset", None)
+            if queryset is not None and isinstance(queryset.model._default_manager, TenantManager):
+                field.queryset = queryset & queryset.model._default_manager.all()
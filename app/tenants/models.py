@@ -0,0 +1,96 @@
+from django.conf import settings
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from .scope import ALL, current
+
+
+class Organisation(models.Model):
+    """Regional group whose patients and records are kept apart from the others."""
+
+    name = models.CharField(max_length=200, unique=True, verbose_name=_("Name"))
+    slug = models.SlugField(max_length=50, unique=True, verbose_name=_("Kurzname"))
+    created = models.DateTimeField(auto_now_add=True, verbose_name=_("Erstellt am"))
+
+    class Meta:
+        verbose_name = _("Organisation")
+        verbose_name_plural = _("Organisationen")
+        ordering = ["name"]
+
+    def __str__(self):
+        return self.name
+
+
+class Membership(models.Model):
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="membership",
+        verbose_name=_("Benutzer"),
+    )
+    organisation = models.ForeignKey(
+        Organisation,
+        on_delete=models.CASCADE,
+        related_name="memberships",
+        verbose_name=_("Organisation"),
+    )
+
+    class Meta:
+        verbose_name = _("Mitgliedschaft")
+        verbose_name_plural = _("Mitgliedschaften")
+
+    def __str__(self):
+        return f"{self.user} ({self.organisation})"
+
+
+class TenantQuerySet(models.QuerySet):
+    def for_organisation(self, organisation):
+        """Restrict the queryset to one organisation, ``None`` meaning records without one."""
+
+        return self.filter(organisation=organisation)
+
+
+class TenantManager(models.Manager.from_queryset(TenantQuerySet)):
+    """Default manager that only returns records of the active organisation.
+
+    Related object access goes through the base manager and stays unscoped.
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        organisation_id = current()
+        if organisation_id is ALL:
+            return queryset
+        return queryset.filter(organisation_id=organisation_id)
+
+
+class TenantScoped(models.Model):
+    """Abstract base of models that belong to an organisation.
+
+    New records are assigned to the active organisation. The foreign key has
+    no index of its own: every scoped model declares composite indexes that
+    start with it, so each organisation's queries only read its own range.
+    """
+
+    organisation = models.ForeignKey(
+        Organisation,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=False,
+        related_name="+",
+        verbose_name=_("Organisation"),
+    )
+
+    objects = TenantManager()
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        if self._state.adding and self.organisation_id is None:
+            organisation_id = current()
+            if organisation_id is not ALL:
+                self.organisation_id = organisation_id
+        super().save(*args, **kwargs)
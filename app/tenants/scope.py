@@ -0,0 +1,110 @@
+"""The organisation whose records the current code may see.
+
+Requests are scoped to the organisation of the logged in user. Users without
+membership see records without organisation, which is how single
+organisation deployments keep working unchanged. Superusers without
+membership, anonymous requests and management commands are unscoped; use
+:func:`scope` to act on behalf of one organisation there.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable
+
+from django.http import FileResponse
+
+
+class _All:
+    def __repr__(self):
+        return "ALL"
+
+    def __str__(self):
+        return "all"
+
+
+ALL = _All()
+
+# Holds a callable so the membership is only looked up when a scoped model
+# is queried; asgiref compares context values when it switches threads.
+_scope: ContextVar[Callable[[], Any]] = ContextVar("tenant_scope", default=lambda: ALL)
+
+
+def current():
+    """Return the active organisation id, ``None`` or :data:`ALL`."""
+
+    return _scope.get()()
+
+
+@contextmanager
+def scope(organisation):
+    """Scope the block to ``organisation`` (instance, id, ``None`` or :data:`ALL`)."""
+
+    organisation_id = getattr(organisation, "pk", organisation)
+    token = _scope.set(lambda: organisation_id)
+    try:
+        yield organisation_id
+    finally:
+        _scope.reset(token)
+
+
+def organisation_for(user):
+    """Return the scope of ``user``."""
+
+    from .models import Membership
+
+    if user is None or not user.is_authenticated:
+        return ALL
+    organisation_id = Membership.objects.filter(user=user).values_list("organisation_id", flat=True).first()
+    if organisation_id is None and user.is_superuser:
+        return ALL
+    return organisation_id
+
+
+def _scoped_iterator(resolve, content):
+    token = _scope.set(resolve)
+    try:
+        yield from content
+    finally:
+        _scope.reset(token)
+
+
+async def _scoped_async_iterator(resolve, content):
+    token = _scope.set(resolve)
+    try:
+        async for chunk in content:
+            yield chunk
+    finally:
+        _scope.reset(token)
+
+
+class TenantMiddleware:
+    """Scope the request, including streamed content, to the user's organisation."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        resolved = []
+
+        def resolve():
+            if not resolved:
+                resolved.append(organisation_for(getattr(request, "user", None)))
+            return resolved[0]
+
+        token = _scope.set(resolve)
+        try:
+            response = self.get_response(request)
+        finally:
+            _scope.reset(token)
+
+        # Streamed exports query while the server consumes the response,
+        # after this middleware has returned. Files are left alone so the
+        # server can still send them directly.
+        if response.streaming and not isinstance(response, FileResponse):
+            if response.is_async:
+                response.streaming_content = _scoped_async_iterator(resolve, response.streaming_content)
+            else:
+                response.streaming_content = _scoped_iterator(resolve, response.streaming_content)
+        return response
@@ -0,0 +1,45 @@
+from django.contrib import admin
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from .models import Delivery, OutboxEvent, WebhookEndpoint
+
+
+@admin.register(WebhookEndpoint)
+class WebhookEndpointAdmin(admin.ModelAdmin):
+    list_display = ["name", "url", "organisation", "is_active", "batch_size", "max_concurrency"]
+    list_filter = ["is_active", "organisation"]
+    search_fields = ["name", "url"]
+
+
+@admin.register(OutboxEvent)
+class OutboxEventAdmin(admin.ModelAdmin):
+    list_display = ["created", "event_type"]
+    list_filter = ["event_type"]
+    date_hierarchy = "created"
+    readonly_fields = ["created", "event_type", "payload"]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(Delivery)
+class DeliveryAdmin(admin.ModelAdmin):
+    list_display = ["event", "endpoint", "status", "attempts", "next_attempt", "last_error"]
+    list_filter = ["status", "endpoint"]
+    list_select_related = ["event", "endpoint"]
+    readonly_fields = ["event", "endpoint", "status", "attempts", "next_attempt", "delivered_at", "last_error"]
+    actions = ["retry"]
+
+    def has_add_permission(self, request):
+        return False
+
+    @admin.action(description=_("Erneut zustellen"))
+    def retry(self, request, queryset):
+        count = queryset.exclude(status=Delivery.DELIVERED).update(
+            status=Delivery.PENDING, attempts=0, next_attempt=timezone.now(), last_error=""
+        )
+        self.message_user(request, _("%(count)d Zustellungen werden erneut versucht.") % {"count": count})
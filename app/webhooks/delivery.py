@@ -0,0 +1,155 @@
+"""Delivery of outbox events to webhook endpoints.
+
+Every pass claims the due deliveries of each endpoint, sends them as JSON
+batches signed with HMAC-SHA256 and records the outcome. The requests run
+in a thread pool with at most ``max_concurrency`` batches in flight per
+endpoint; database work stays on the calling thread. Failed deliveries are
+retried with exponential backoff until ``MAX_ATTEMPTS`` is reached.
+
+Receivers verify a request by computing
+``hmac_sha256(secret, f"{X-FBF-Timestamp}.{body}")`` and comparing it with
+the ``X-FBF-Signature`` header (``sha256=<hex>``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Optional
+
+import requests
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Delivery, WebhookEndpoint
+
+MAX_ATTEMPTS = 8
+RETRY_DELAY = 30
+MAX_RETRY_DELAY = 6 * 3600
+# Claimed deliveries are hidden from other workers for this long.
+LEASE_SECONDS = 300
+# Batches each lane sends one after another in a single pass.
+BATCHES_PER_LANE = 5
+USER_AGENT = "FBF-Webhooks/1.0"
+
+
+@dataclass(slots=True)
+class DeliveryResult:
+    delivered: int = 0
+    retried: int = 0
+    failed: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.delivered + self.retried + self.failed
+
+    def as_message(self) -> str:
+        return f"{self.delivered} zugestellt, {self.retried} erneut geplant, {self.failed} fehlgeschlagen"
+
+
+def sign(secret: str, timestamp: str, body: bytes) -> str:
+    return hmac.new(secret.encode("utf-8"), timestamp.encode("ascii") + b"." + body, hashlib.sha256).hexdigest()
+
+
+def retry_delay(attempts: int) -> timedelta:
+    return timedelta(seconds=min(RETRY_DELAY * 2 ** (attempts - 1), MAX_RETRY_DELAY))
+
+
+def _claim(endpoint: WebhookEndpoint, now) -> list[Delivery]:
+    limit = endpoint.batch_size * max(1, endpoint.max_concurrency) * BATCHES_PER_LANE
+    with transaction.atomic():
+        due = list(
+            Delivery.objects.select_for_update(skip_locked=True, of=("self",))
+            .filter(endpoint=endpoint, status=Delivery.PENDING, next_attempt__lte=now)
+            .select_related("event")
+            .order_by("next_attempt", "id")[:limit]
+        )
+        if due:
+            Delivery.objects.filter(pk__in=[delivery.pk for delivery in due]).update(
+                next_attempt=now + timedelta(seconds=LEASE_SECONDS)
+            )
+    return due
+
+
+def post_batch(endpoint: WebhookEndpoint, deliveries: list[Delivery], timeout: float) -> Optional[str]:
+    """Send one batch; returns an error description or ``None`` on success."""
+
+    body = json.dumps(
+        {"events": [delivery.event.as_message() for delivery in deliveries]},
+        cls=DjangoJSONEncoder,
+    ).encode("utf-8")
+    timestamp = str(int(time.time()))
+    headers = {
+        "Content-Type": "application/json",
+        "User-Agent": USER_AGENT,
+        "X-FBF-Timestamp": timestamp,
+        "X-FBF-Signature": f"sha256={sign(endpoint.secret, timestamp, body)}",
+    }
+    try:
+        response = requests.post(endpoint.url, data=body, headers=headers, timeout=timeout)
+    except requests.RequestException as exc:
+        return str(exc) or exc.__class__.__name__
+    if response.status_code >= 300:
+        return f"HTTP {response.status_code}"
+    return None
+
+
+def _send_lane(endpoint: WebhookEndpoint, batches: list[list[Delivery]], timeout: float):
+    return [(batch, post_batch(endpoint, batch, timeout)) for batch in batches]
+
+
+def _record(batch: list[Delivery], error: Optional[str], result: DeliveryResult) -> None:
+    now = timezone.now()
+    for delivery in batch:
+        delivery.attempts += 1
+        if error is None:
+            delivery.status = Delivery.DELIVERED
+            delivery.delivered_at = now
+            delivery.last_error = ""
+            result.delivered += 1
+        elif delivery.attempts >= MAX_ATTEMPTS:
+            delivery.status = Delivery.FAILED
+            delivery.last_error = error
+            result.failed += 1
+        else:
+            delivery.next_attempt = now + retry_delay(delivery.attempts)
+            delivery.last_error = error
+            result.retried += 1
+    Delivery.objects.bulk_update(batch, ["status", "attempts", "next_attempt", "delivered_at", "last_error"])
+
+
+def deliver_pending(timeout: float = 10, workers: int = 8) -> DeliveryResult:
+    """Send all due deliveries once.
+
+    :param timeout: Seconds to wait for each receiver.
+    :param workers: Size of the thread pool shared by all endpoints.
+    :returns: Counts of delivered, rescheduled and failed deliveries.
+    """
+
+    now = timezone.now()
+    lanes = []
+    for endpoint in WebhookEndpoint.objects.filter(is_active=True):
+        due = _claim(endpoint, now)
+        batches = [due[start:start + endpoint.batch_size] for start in range(0, len(due), endpoint.batch_size)]
+        # Each lane sends its batches one after another, so an endpoint
+        # never sees more than ``max_concurrency`` requests at once.
+        lane_count = max(1, endpoint.max_concurrency)
+        for lane in range(lane_count):
+            if batches[lane::lane_count]:
+                lanes.append((endpoint, batches[lane::lane_count]))
+
+    result = DeliveryResult()
+    if not lanes:
+        return result
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = [executor.submit(_send_lane, endpoint, batches, timeout) for endpoint, batches in lanes]
+        for future in futures:
+            for batch, error in future.result():
+                _record(batch, error, result)
+    return result
@@ -0,0 +1,108 @@
+"""Outbox events for integrations.
+
+Events are written by signal receivers while the triggering save runs, so
+they share its transaction: a rolled back save leaves no event and a
+committed save always has one. Together with the event one delivery per
+interested endpoint is stored; the ``deliver_webhooks`` command sends them,
+so slow receivers never delay a request. Patient events only go to the
+endpoints of the patient's organisation.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+
+from bird.models import FallenBird
+from stations.models import WildbirdHelpStation
+from tenants.scope import ALL
+
+from .models import (
+    PATIENT_CREATED,
+    PATIENT_STATUS_CHANGED,
+    STATION_PUBLISHED,
+    Delivery,
+    OutboxEvent,
+    WebhookEndpoint,
+)
+
+PREVIOUS_ATTR = "_webhook_previous"
+
+
+def record_event(event_type: str, payload: dict[str, Any], organisation=ALL) -> Optional[OutboxEvent]:
+    """Store an event and its deliveries; returns ``None`` without subscribers.
+
+    :param organisation: Id of the organisation the event belongs to, ``None``
+        for records without one; :data:`~tenants.scope.ALL` sends public
+        events to every endpoint.
+    """
+
+    candidates = WebhookEndpoint.objects.filter(is_active=True)
+    if organisation is not ALL:
+        candidates = candidates.filter(organisation_id=organisation)
+    endpoints = [endpoint for endpoint in candidates if endpoint.wants(event_type)]
+    if not endpoints:
+        return None
+    event = OutboxEvent.objects.create(event_type=event_type, payload=payload)
+    Delivery.objects.bulk_create(
+        [Delivery(endpoint=endpoint, event=event, next_attempt=event.created) for endpoint in endpoints]
+    )
+    return event
+
+
+def patient_payload(patient: FallenBird) -> dict[str, Any]:
+    return {
+        "id": patient.pk,
+        "organisation": patient.organisation_id,
+        "alias": patient.bird_identifier,
+        "species": patient.bird.name if patient.bird_id else None,
+        "date_found": patient.date_found,
+        "place": patient.place,
+        "status": {
+            "id": patient.status_id,
+            "description": patient.status.description if patient.status_id else None,
+        },
+    }
+
+
+def _remember(instance, field: str) -> None:
+    previous = None
+    if not instance._state.adding and instance.pk is not None:
+        previous = type(instance)._base_manager.filter(pk=instance.pk).values_list(field, flat=True).first()
+    setattr(instance, PREVIOUS_ATTR, previous)
+
+
+@receiver(pre_save, sender=FallenBird, dispatch_uid="webhooks:patient:pre_save")
+def remember_patient_status(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _remember(instance, "status_id")
+
+
+@receiver(post_save, sender=FallenBird, dispatch_uid="webhooks:patient:post_save")
+def patient_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    previous = instance.__dict__.pop(PREVIOUS_ATTR, None)
+    if created:
+        record_event(PATIENT_CREATED, patient_payload(instance), instance.organisation_id)
+    elif previous != instance.status_id:
+        payload = patient_payload(instance)
+        payload["previous_status"] = previous
+        record_event(PATIENT_STATUS_CHANGED, payload, instance.organisation_id)
+
+
+@receiver(pre_save, sender=WildbirdHelpStation, dispatch_uid="webhooks:station:pre_save")
+def remember_station_publication(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _remember(instance, "approved_for_publication")
+
+
+@receiver(post_save, sender=WildbirdHelpStation, dispatch_uid="webhooks:station:post_save")
+def station_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    was_published = instance.__dict__.pop(PREVIOUS_ATTR, None)
+    if instance.approved_for_publication and (created or not was_published):
+        record_event(STATION_PUBLISHED, instance.to_map_payload())
@@ -0,0 +1,33 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from webhooks.delivery import deliver_pending
+
+
+class Command(BaseCommand):
+    help = "Ausstehende Webhook-Ereignisse an die Empfänger zustellen."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Nur einen Durchlauf ausführen und dann beenden.")
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5,
+            help="Wartezeit in Sekunden zwischen zwei Durchläufen ohne Zustellungen (Standard: 5).",
+        )
+        parser.add_argument("--timeout", type=float, default=10, help="Timeout je Anfrage in Sekunden (Standard: 10).")
+        parser.add_argument("--workers", type=int, default=8, help="Anzahl paralleler Anfragen insgesamt (Standard: 8).")
+
+    def handle(self, *args, **options):
+        while True:
+            result = deliver_pending(timeout=options["timeout"], workers=options["workers"])
+            if result.total:
+                self.stdout.write(result.as_message())
+            if options["once"]:
+                return
+            if not result.total:
+                try:
+                    time.sleep(options["interval"])
+                except KeyboardInterrupt:
+                    return
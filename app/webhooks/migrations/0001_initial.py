@@ -0,0 +1,70 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:54
+
+import django.core.serializers.json
+import django.db.models.deletion
+import django.utils.timezone
+import webhooks.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Zeitpunkt')),
+                ('event_type', models.CharField(choices=[('patient.created', 'Patient angelegt'), ('patient.status_changed', 'Patientenstatus geändert'), ('station.published', 'Station veröffentlicht')], max_length=50, verbose_name='Ereignis')),
+                ('payload', models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder, verbose_name='Daten')),
+            ],
+            options={
+                'verbose_name': 'Ereignis',
+                'verbose_name_plural': 'Ereignisse',
+                'ordering': ['-created', '-id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='WebhookEndpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=150, unique=True, verbose_name='Name')),
+                ('url', models.URLField(max_length=500, verbose_name='URL')),
+                ('secret', models.CharField(default=webhooks.models.generate_secret, help_text='Schlüssel für die HMAC-SHA256-Signatur im Header X-FBF-Signature.', max_length=128, verbose_name='Geheimnis')),
+                ('events', models.JSONField(blank=True, default=list, help_text='Liste der Ereignistypen, z. B. ["patient.created"]. Leer bedeutet alle Ereignisse.', verbose_name='Ereignisse')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Aktiv')),
+                ('batch_size', models.PositiveSmallIntegerField(default=50, verbose_name='Ereignisse je Anfrage')),
+                ('max_concurrency', models.PositiveSmallIntegerField(default=2, help_text='Höchstzahl paralleler Zustellungen an diesen Empfänger.', verbose_name='Gleichzeitige Anfragen')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Erstellt am')),
+            ],
+            options={
+                'verbose_name': 'Webhook-Empfänger',
+                'verbose_name_plural': 'Webhook-Empfänger',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Delivery',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', 'Ausstehend'), ('delivered', 'Zugestellt'), ('failed', 'Fehlgeschlagen')], default='pending', max_length=10, verbose_name='Status')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='Versuche')),
+                ('next_attempt', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Nächster Versuch')),
+                ('delivered_at', models.DateTimeField(blank=True, null=True, verbose_name='Zugestellt am')),
+                ('last_error', models.TextField(blank=True, verbose_name='Letzter Fehler')),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='deliveries', to='webhooks.outboxevent', verbose_name='Ereignis')),
+                ('endpoint', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='deliveries', to='webhooks.webhookendpoint', verbose_name='Empfänger')),
+            ],
+            options={
+                'verbose_name': 'Zustellung',
+                'verbose_name_plural': 'Zustellungen',
+                'ordering': ['-next_attempt'],
+                'indexes': [models.Index(fields=['status', 'endpoint', 'next_attempt'], name='webhook_due_idx')],
+            },
+        ),
+    ]
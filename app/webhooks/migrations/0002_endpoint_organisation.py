@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-19 20:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenants', '0001_initial'),
+        ('webhooks', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='webhookendpoint',
+            name='organisation',
+            field=models.ForeignKey(blank=True, help_text='Patientenereignisse werden nur für Patienten dieser Organisation gesendet. Ohne Organisation nur für Patienten ohne Organisation.', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='webhook_endpoints', to='tenants.organisation', verbose_name='Organisation'),
+        ),
+    ]
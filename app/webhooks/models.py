@@ -0,0 +1,123 @@
+import secrets
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+PATIENT_CREATED = "patient.created"
+PATIENT_STATUS_CHANGED = "patient.status_changed"
+STATION_PUBLISHED = "station.published"
+
+EVENT_CHOICES = [
+    (PATIENT_CREATED, _("Patient angelegt")),
+    (PATIENT_STATUS_CHANGED, _("Patientenstatus geändert")),
+    (STATION_PUBLISHED, _("Station veröffentlicht")),
+]
+
+
+def generate_secret():
+    return secrets.token_hex(32)
+
+
+class WebhookEndpoint(models.Model):
+    name = models.CharField(max_length=150, unique=True, verbose_name=_("Name"))
+    url = models.URLField(max_length=500, verbose_name=_("URL"))
+    organisation = models.ForeignKey(
+        "tenants.Organisation",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="webhook_endpoints",
+        verbose_name=_("Organisation"),
+        help_text=_(
+            "Patientenereignisse werden nur für Patienten dieser Organisation gesendet. "
+            "Ohne Organisation nur für Patienten ohne Organisation."
+        ),
+    )
+    secret = models.CharField(
+        max_length=128,
+        default=generate_secret,
+        verbose_name=_("Geheimnis"),
+        help_text=_("Schlüssel für die HMAC-SHA256-Signatur im Header X-FBF-Signature."),
+    )
+    events = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name=_("Ereignisse"),
+        help_text=_("Liste der Ereignistypen, z. B. [\"patient.created\"]. Leer bedeutet alle Ereignisse."),
+    )
+    is_active = models.BooleanField(default=True, verbose_name=_("Aktiv"))
+    batch_size = models.PositiveSmallIntegerField(
+        default=50,
+        verbose_name=_("Ereignisse je Anfrage"),
+    )
+    max_concurrency = models.PositiveSmallIntegerField(
+        default=2,
+        verbose_name=_("Gleichzeitige Anfragen"),
+        help_text=_("Höchstzahl paralleler Zustellungen an diesen Empfänger."),
+    )
+    created = models.DateTimeField(auto_now_add=True, verbose_name=_("Erstellt am"))
+
+    class Meta:
+        verbose_name = _("Webhook-Empfänger")
+        verbose_name_plural = _("Webhook-Empfänger")
+        ordering = ["name"]
+
+    def __str__(self):
+        return self.name
+
+    def wants(self, event_type: str) -> bool:
+        return not self.events or event_type in self.events
+
+
+class OutboxEvent(models.Model):
+    """Event written in the transaction of the change it describes."""
+
+    created = models.DateTimeField(default=timezone.now, verbose_name=_("Zeitpunkt"))
+    event_type = models.CharField(max_length=50, choices=EVENT_CHOICES, verbose_name=_("Ereignis"))
+    payload = models.JSONField(encoder=DjangoJSONEncoder, verbose_name=_("Daten"))
+
+    class Meta:
+        verbose_name = _("Ereignis")
+        verbose_name_plural = _("Ereignisse")
+        ordering = ["-created", "-id"]
+
+    def __str__(self):
+        return f"{self.get_event_type_display()} ({self.created:%d.%m.%Y %H:%M})"
+
+    def as_message(self) -> dict:
+        return {"id": self.pk, "type": self.event_type, "created": self.created, "data": self.payload}
+
+
+class Delivery(models.Model):
+    PENDING = "pending"
+    DELIVERED = "delivered"
+    FAILED = "failed"
+
+    STATUS_CHOICES = [
+        (PENDING, _("Ausstehend")),
+        (DELIVERED, _("Zugestellt")),
+        (FAILED, _("Fehlgeschlagen")),
+    ]
+
+    endpoint = models.ForeignKey(
+        WebhookEndpoint, on_delete=models.CASCADE, related_name="deliveries", verbose_name=_("Empfänger")
+    )
+    event = models.ForeignKey(
+        OutboxEvent, on_delete=models.CASCADE, related_name="deliveries", verbose_name=_("Ereignis")
+    )
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING, verbose_name=_("Status"))
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name=_("Versuche"))
+    next_attempt = models.DateTimeField(default=timezone.now, verbose_name=_("Nächster Versuch"))
+    delivered_at = models.DateTimeField(blank=True, null=True, verbose_name=_("Zugestellt am"))
+    last_error = models.TextField(blank=True, verbose_name=_("Letzter Fehler"))
+
+    class Meta:
+        verbose_name = _("Zustellung")
+        verbose_name_plural = _("Zustellungen")
+        ordering = ["-next_attempt"]
+        indexes = [models.Index(fields=["status", "endpoint", "next_attempt"], name="webhook_due_idx")]
+
+    def __str__(self):
+        return f"{self.event} → {self.endpoint}"
@@ -0,0 +1,284 @@
+"""
+Local WebDAV and SFTP stand-ins for backup transfer tests.
+Both serve a temporary directory and can inject failures.
+"""
+import os
+import posixpath
+import re
+import shutil
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import quote, unquote, urlsplit
+
+import paramiko
+
+
+class _WebDAVHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def _local(self, url=None):
+        path = unquote(urlsplit(url or self.path).path)
+        return os.path.join(self.server.root, path.lstrip('/'))
+
+    def _reply(self, status, body=b'', headers=None):
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def _body(self):
+        return self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+    def do_HEAD(self):
+        local = self._local()
+        if not os.path.isfile(local):
+            return self._reply(404)
+        self.send_response(200)
+        self.send_header('Content-Length', str(os.path.getsize(local)))
+        self.end_headers()
+
+    def do_GET(self):
+        local = self._local()
+        if not os.path.isfile(local):
+            return self._reply(404)
+        with open(local, 'rb') as stream:
+            data = stream.read()
+        match = re.match(r'bytes=(\d+)-(\d+)', self.headers.get('Range', ''))
+        if match:
+            start, end = int(match.group(1)), int(match.group(2))
+            return self._reply(206, data[start:end + 1])
+        return self._reply(200, data)
+
+    def do_PUT(self):
+        data = self._body()
+        with self.server.lock:
+            self.server.put_requests += 1
+            if self.server.drop_puts > 0:
+                self.server.drop_puts -= 1
+                self.close_connection = True
+                self.connection.shutdown(socket.SHUT_RDWR)
+                return
+        local = self._local()
+        content_range = self.headers.get('Content-Range')
+        if content_range:
+            if not self.server.partial_uploads:
+                return self._reply(501)
+            offset = int(re.match(r'bytes (\d+)-', content_range).group(1))
+            with self.server.lock:
+                mode = 'r+b' if os.path.exists(local) else 'wb'
+                with open(local, mode) as stream:
+                    stream.seek(offset)
+                    stream.write(data)
+            return self._reply(204)
+        with open(local, 'wb') as stream:
+            stream.write(data)
+        return self._reply(201)
+
+    def do_PROPFIND(self):
+        local = self._local()
+        if not os.path.isdir(local):
+            return self._reply(404)
+        collection = urlsplit(self.path).path.rstrip('/') + '/'
+        hrefs = [collection] + [
+            quote(collection + name) + ('/' if os.path.isdir(os.path.join(local, name)) else '')
+            for name in sorted(os.listdir(local))
+        ]
+        body = '<?xml version="1.0"?><d:multistatus xmlns:d="DAV:">{}</d:multistatus>'.format(
+            ''.join(f'<d:response><d:href>{href}</d:href></d:response>' for href in hrefs)
+        )
+        return self._reply(207, body.encode(), {'Content-Type': 'application/xml'})
+
+    def do_MKCOL(self):
+        local = self._local()
+        if os.path.exists(local):
+            return self._reply(405)
+        os.mkdir(local)
+        return self._reply(201)
+
+    def do_MOVE(self):
+        os.replace(self._local(), self._local(self.headers['Destination']))
+        return self._reply(201)
+
+    def do_DELETE(self):
+        local = self._local()
+        if not os.path.exists(local):
+            return self._reply(404)
+        os.remove(local)
+        return self._reply(204)
+
+
+class WebDAVStandIn:
+    """Threaded WebDAV server supporting ranged PUT/GET, PROPFIND, MKCOL and MOVE."""
+
+    def __init__(self, root, partial_uploads=True):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _WebDAVHandler)
+        self.server.daemon_threads = True
+        self.server.root = str(root)
+        self.server.partial_uploads = partial_uploads
+        self.server.drop_puts = 0
+        self.server.put_requests = 0
+        self.server.lock = threading.Lock()
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        return f'http://127.0.0.1:{self.server.server_address[1]}/'
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class _SSHServer(paramiko.ServerInterface):
+    def check_auth_password(self, username, password):
+        return paramiko.AUTH_SUCCESSFUL
+
+    def get_allowed_auths(self, username):
+        return 'password'
+
+    def check_channel_request(self, kind, chanid):
+        return paramiko.OPEN_SUCCEEDED
+
+
+class _SFTPHandle(paramiko.SFTPHandle):
+    def stat(self):
+        return paramiko.SFTPAttributes.from_stat(os.fstat(self.readfile.fileno()))
+
+    def write(self, offset, data):
+        standin = self.standin
+        with standin.lock:
+            if standin.fail_writes > 0:
+                standin.fail_writes -= 1
+                return paramiko.SFTP_FAILURE
+            standin.writes += 1
+        return super().write(offset, data)
+
+
+class _SFTPServer(paramiko.SFTPServerInterface):
+    def __init__(self, server, *args, standin=None, **kwargs):
+        super().__init__(server, *args, **kwargs)
+        self.standin = standin
+
+    def _local(self, path):
+        return os.path.join(self.standin.root, self.canonicalize(path).lstrip('/'))
+
+    def canonicalize(self, path):
+        return posixpath.normpath(posixpath.join('/', path))
+
+    def _errors(func):
+        def wrapper(self, *args, **kwargs):
+            try:
+                return func(self, *args, **kwargs)
+            except OSError as exc:
+                return paramiko.SFTPServer.convert_errno(exc.errno)
+        return wrapper
+
+    @_errors
+    def open(self, path, flags, attr):
+        local = self._local(path)
+        fd = os.open(local, flags, 0o644)
+        if flags & os.O_WRONLY:
+            mode = 'ab' if flags & os.O_APPEND else 'wb'
+        elif flags & os.O_RDWR:
+            mode = 'a+b' if flags & os.O_APPEND else 'r+b'
+        else:
+            mode = 'rb'
+        handle = _SFTPHandle(flags)
+        handle.standin = self.standin
+        handle.filename = local
+        handle.readfile = handle.writefile = os.fdopen(fd, mode)
+        return handle
+
+    @_errors
+    def stat(self, path):
+        return paramiko.SFTPAttributes.from_stat(os.stat(self._local(path)))
+
+    lstat = stat
+
+    @_errors
+    def list_folder(self, path):
+        local = self._local(path)
+        return [
+            paramiko.SFTPAttributes.from_stat(os.stat(os.path.join(local, name)), name)
+            for name in os.listdir(local)
+        ]
+
+    @_errors
+    def remove(self, path):
+        os.remove(self._local(path))
+        return paramiko.SFTP_OK
+
+    @_errors
+    def rename(self, oldpath, newpath):
+        if os.path.exists(self._local(newpath)):
+            return paramiko.SFTP_FAILURE
+        os.rename(self._local(oldpath), self._local(newpath))
+        return paramiko.SFTP_OK
+
+    @_errors
+    def posix_rename(self, oldpath, newpath):
+        os.replace(self._local(oldpath), self._local(newpath))
+        return paramiko.SFTP_OK
+
+    @_errors
+    def mkdir(self, path, attr):
+        os.mkdir(self._local(path))
+        return paramiko.SFTP_OK
+
+    @_errors
+    def rmdir(self, path):
+        shutil.rmtree(self._local(path))
+        return paramiko.SFTP_OK
+
+
+class SFTPStandIn:
+    """Paramiko based SFTP server serving ``root`` on a random local port."""
+
+    host_key = None
+
+    def __init__(self, root):
+        self.root = str(root)
+        self.lock = threading.Lock()
+        self.fail_writes = 0
+        self.writes = 0
+        self.transports = []
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.socket.bind(('127.0.0.1', 0))
+        self.socket.listen(8)
+        self.port = self.socket.getsockname()[1]
+        self.thread = threading.Thread(target=self._serve, daemon=True)
+        if SFTPStandIn.host_key is None:
+            SFTPStandIn.host_key = paramiko.RSAKey.generate(1024)
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _addr = self.socket.accept()
+            except OSError:
+                return
+            transport = paramiko.Transport(conn)
+            transport.add_server_key(self.host_key)
+            transport.set_subsystem_handler('sftp', paramiko.SFTPServer, _SFTPServer, standin=self)
+            transport.start_server(server=_SSHServer())
+            self.transports.append(transport)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.socket.close()
+        for transport in self.transports:
+            transport.close()
@@ -4,6 +4,7 @@ Test configuration for Django FBF project.
 import os
 import sys
 import django
+import pytest
 from django.conf import settings
 from django.test.utils import get_runner
 
@@ -18,3 +19,27 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'test_settings')
 
 # Setup Django
 django.setup()
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    """Keep cached view data from leaking between tests."""
+    from django.core.cache import cache
+
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def query_budget():
+    """Assert that a view's query count does not grow with the data size."""
+    from query_budget import Growth, assert_constant_queries
+
+    def check(client, url, factory, sizes=None, budget=None):
+        kwargs = {'budget': budget}
+        if sizes is not None:
+            kwargs['sizes'] = sizes
+        return assert_constant_queries(client, url, Growth(factory), **kwargs)
+
+    return check
@@ -0,0 +1,62 @@
+"""
+Query budget checks for list and report views.
+A view passes when the number of SQL queries stays the same while the
+amount of rendered data grows.
+"""
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+DEFAULT_SIZES = (1, 3, 8)
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def count_queries(client, url):
+    """Request ``url`` with an empty cache and return ``(response, queries)``."""
+    cache.clear()
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url)
+    assert response.status_code == 200, f'{url} antwortete mit {response.status_code}'
+    if getattr(response, 'streaming', False):
+        b''.join(response.streaming_content)
+    return response, context.captured_queries
+
+
+def assert_constant_queries(client, url, grow, sizes=DEFAULT_SIZES, budget=None):
+    """
+    Call ``grow(n)`` so that ``n`` rows exist, request ``url`` and compare the
+    query counts for all ``sizes``. Fails if the count grows with ``n`` or
+    exceeds ``budget``.
+    """
+    counts = {}
+    largest = []
+    # Warm per-process caches (content types, site) before measuring.
+    grow(sizes[0])
+    count_queries(client, url)
+    for size in sizes:
+        grow(size)
+        _response, queries = count_queries(client, url)
+        counts[size] = len(queries)
+        largest = queries
+    if len(set(counts.values())) > 1 or (budget is not None and counts[sizes[-1]] > budget):
+        statements = '\n'.join(query['sql'] for query in largest)
+        raise QueryBudgetExceeded(
+            f'{url}: Abfragen je Datenmenge {counts} (Budget {budget})\n{statements}'
+        )
+    return counts[sizes[-1]]
+
+
+class Growth:
+    """Factory helper creating rows until ``n`` exist."""
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.created = 0
+
+    def __call__(self, size):
+        while self.created < size:
+            self.factory(self.created)
+            self.created += 1
@@ -29,6 +29,7 @@ DJANGO_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 ]
 
 # Third party apps
@@ -54,6 +55,11 @@ LOCAL_APPS = [
     'notizen',
     'administration',
     'sendemail',
+    'stations',
+    'audit',
+    'webhooks',
+    'tenants',
+    'search',
 ]
 
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
@@ -61,11 +67,15 @@ INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 # Middleware
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'core.instrumentation.QueryInstrumentationMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
+    'core.ratelimit.RateLimitMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'tenants.scope.TenantMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
+    'audit.recorder.AuditMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'allauth.account.middleware.AccountMiddleware',
 ]
@@ -83,6 +93,7 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'core.permissions.user_groups',
             ],
         },
     },
@@ -144,6 +155,7 @@ MEDIA_URL = '/media/'
 # Static files for tests
 STATIC_ROOT = tempfile.mkdtemp()
 STATIC_URL = '/static/'
+STATICFILES_DIRS = [os.path.join(os.path.dirname(__file__), '..', 'app', 'static')]
 
 # Auth settings
 LOGIN_URL = '/accounts/login/'
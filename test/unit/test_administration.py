@@ -1,13 +1,19 @@
+import io
+import os
+import tarfile
 from unittest import mock
 
 import pytest
 from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
 from django.test import Client, TestCase
 from django.urls import reverse
 from django.core.files.uploadedfile import SimpleUploadedFile
 
 from administration.forms import BackupRestoreForm, BackupRunForm
 from administration.models import BackupDestination, BackupLog, SMTPConfiguration
+from administration.services import log_backup_event, restore_database_from_file, run_backup, start_backup_log
+from administration.snapshots import fetch_snapshot, iter_chunks, run_snapshot_backup
 
 
 class BackupFormsTests(TestCase):
@@ -49,9 +55,11 @@ def test_backup_dashboard_run(monkeypatch):
         {"destination": destination.pk, "run_backup": "1"},
         follow=True,
     )
-    mocked_run.assert_called_once_with(destination)
+    mocked_run.assert_called_once_with(destination, log=mock.ANY)
     assert response.status_code == 200
-    assert BackupLog.objects.filter(action=BackupLog.ACTION_BACKUP).exists()
+    log = BackupLog.objects.get(action=BackupLog.ACTION_BACKUP)
+    assert mocked_run.call_args.kwargs["log"] == log
+    assert log.status == BackupLog.STATUS_SUCCESS
 
 
 @pytest.mark.django_db
@@ -129,3 +137,269 @@ def test_smtp_admin_dropdown_activation():
     active.refresh_from_db()
     assert new.is_active
     assert not active.is_active
+
+
+@pytest.mark.django_db
+def test_run_backup_directory_format_dumps_in_parallel(monkeypatch):
+    destination = BackupDestination.objects.create(
+        name="Parallel",
+        destination_type=BackupDestination.SFTP,
+        endpoint="example.org",
+        dump_format=BackupDestination.FORMAT_DIRECTORY,
+        jobs=4,
+    )
+    commands = []
+
+    def fake_run(command, **kwargs):
+        commands.append(command)
+        dump_dir = next(arg.split("=", 1)[1] for arg in command if arg.startswith("--file="))
+        os.makedirs(dump_dir)
+        with open(os.path.join(dump_dir, "toc.dat"), "wb") as toc:
+            toc.write(b"PGDMP")
+        return mock.Mock(returncode=0)
+
+    uploaded = []
+    monkeypatch.setattr("administration.services.subprocess.run", fake_run)
+    monkeypatch.setattr("administration.services.open_store", lambda dest: InMemoryStore({}))
+    monkeypatch.setattr(
+        "administration.services.upload_file",
+        lambda store, path, name, progress=None: uploaded.append(tarfile.is_tarfile(path)),
+    )
+
+    file_name = run_backup(destination)
+
+    assert file_name.endswith(".tar")
+    assert "--format=directory" in commands[0]
+    assert "--jobs=4" in commands[0]
+    assert uploaded == [True]
+
+
+@pytest.mark.django_db
+def test_restore_custom_dump_uses_parallel_pg_restore(monkeypatch):
+    commands = []
+    monkeypatch.setattr(
+        "administration.services.subprocess.run",
+        lambda command, **kwargs: commands.append(command) or mock.Mock(returncode=0),
+    )
+
+    restore_database_from_file(SimpleUploadedFile("restore.dump", b"PGDMP\x01\x0e"), jobs=3)
+
+    assert commands[0][0] == "pg_restore"
+    assert "--jobs=3" in commands[0]
+
+
+@pytest.mark.django_db
+def test_restore_plain_sql_uses_psql(monkeypatch):
+    commands = []
+    monkeypatch.setattr(
+        "administration.services.subprocess.run",
+        lambda command, **kwargs: commands.append(command) or mock.Mock(returncode=0),
+    )
+
+    restore_database_from_file(SimpleUploadedFile("restore.sql", b"-- test --"))
+
+    assert commands[0][0] == "psql"
+
+
+class InMemoryStore:
+    def __init__(self, files, can_list=True):
+        self.files = files
+        self.can_list = can_list
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def ensure_dir(self, name):
+        pass
+
+    def exists(self, name):
+        return name in self.files
+
+    def list_dir(self, name):
+        if not self.can_list:
+            return None
+        return {path.rpartition("/")[2] for path in self.files if path.rpartition("/")[0] == name}
+
+    def put(self, name, data):
+        self.files[name] = data
+
+    def get(self, name):
+        return self.files[name]
+
+
+def _fake_dump(content):
+    def popen(command, stdout=None, stderr=None, env=None):
+        return mock.Mock(stdout=io.BytesIO(content), wait=mock.Mock(return_value=0))
+    return popen
+
+
+def _sql_dump(rows):
+    return b"".join(f"{index}\tAmsel\tJena\t2024-05-{index % 28 + 1:02d}\n".encode() for index in range(rows))
+
+
+def test_iter_chunks_resynchronises_after_change():
+    original = _sql_dump(20000)
+    changed = original.replace(b"100\tAmsel", b"100\tDrossel", 1)
+
+    before = list(iter_chunks(io.BytesIO(original), min_size=4096, max_size=65536, boundary_mask=0x3F))
+    after = list(iter_chunks(io.BytesIO(changed), min_size=4096, max_size=65536, boundary_mask=0x3F))
+
+    assert b"".join(after) == changed
+    assert len(before) > 10
+    assert len(set(before) - set(after)) == 1
+
+
+def test_snapshots_require_plain_dumps():
+    destination = BackupDestination(
+        name="Snapshots",
+        destination_type=BackupDestination.SFTP,
+        endpoint="example.org",
+        dump_format=BackupDestination.FORMAT_CUSTOM,
+        incremental=True,
+    )
+
+    with pytest.raises(ValidationError) as excinfo:
+        destination.clean()
+    assert "dump_format" in excinfo.value.message_dict
+
+
+@pytest.mark.django_db
+def test_snapshot_backup_uploads_only_new_chunks(monkeypatch):
+    destination = BackupDestination.objects.create(
+        name="Snapshots",
+        destination_type=BackupDestination.SFTP,
+        endpoint="example.org",
+        incremental=True,
+    )
+    files = {}
+    dump = _sql_dump(50000)
+    monkeypatch.setattr("administration.snapshots.open_store", lambda dest: InMemoryStore(files))
+    monkeypatch.setattr("administration.snapshots.subprocess.Popen", _fake_dump(dump))
+
+    first = run_snapshot_backup(destination)
+    log = log_backup_event(destination, BackupLog.ACTION_BACKUP, BackupLog.STATUS_SUCCESS, first.as_message(), first.file_name, manifest=first.manifest)
+    assert first.uploaded_chunks == len({digest for digest, _size in first.manifest["chunks"]})
+    assert (log.snapshot_chunks, log.snapshot_size) == (len(first.manifest["chunks"]), len(dump))
+
+    changed = dump + b"50000\tMeise\tJena\t2024-06-01\n"
+    monkeypatch.setattr("administration.snapshots.subprocess.Popen", _fake_dump(changed))
+    second = run_snapshot_backup(destination)
+    assert second.uploaded_chunks == 1
+
+    restored = io.BytesIO()
+    fetch_snapshot(destination, second.file_name, restored)
+    assert restored.getvalue() == changed
+
+
+@pytest.mark.django_db
+def test_snapshot_progress_counts_processed_bytes(monkeypatch):
+    destination = BackupDestination.objects.create(
+        name="Snapshots",
+        destination_type=BackupDestination.SFTP,
+        endpoint="example.org",
+        incremental=True,
+    )
+    files = {}
+    dump = _sql_dump(50000)
+    monkeypatch.setattr("administration.snapshots.open_store", lambda dest: InMemoryStore(files))
+    monkeypatch.setattr("administration.snapshots.subprocess.Popen", _fake_dump(dump))
+    monkeypatch.setattr("administration.services.BackupProgress.interval", 0)
+    first = run_snapshot_backup(destination)
+    log_backup_event(destination, BackupLog.ACTION_BACKUP, BackupLog.STATUS_SUCCESS, first.as_message(), first.file_name, manifest=first.manifest)
+
+    percentages = []
+    monkeypatch.setattr(
+        "administration.services.BackupProgress.__call__",
+        lambda self, stats: percentages.append(round(stats.completed_bytes * 100 / stats.total_bytes)),
+    )
+    log = start_backup_log(destination)
+    run_snapshot_backup(destination, log=log)
+
+    # Unchanged chunks are not sent but still move the progress forward.
+    assert len(percentages) == len(first.manifest["chunks"]) + 1
+    assert percentages == sorted(percentages)
+    assert percentages[0] > 0 and percentages[-1] == 100
+
+    monkeypatch.undo()
+    monkeypatch.setattr("administration.snapshots.open_store", lambda dest: InMemoryStore(files))
+    monkeypatch.setattr("administration.snapshots.subprocess.Popen", _fake_dump(dump))
+    log = start_backup_log(destination)
+    run_snapshot_backup(destination, log=log)
+    log.refresh_from_db()
+    assert log.bytes_transferred == log.bytes_total == len(dump)
+    assert 0 < log.bytes_uploaded < 1024  # only the manifest
+    assert log.progress_percent == 100
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("can_list", [True, False])
+def test_snapshot_backup_restores_chunks_missing_on_the_destination(monkeypatch, can_list):
+    destination = BackupDestination.objects.create(
+        name="Snapshots",
+        destination_type=BackupDestination.SFTP,
+        endpoint="example.org",
+        incremental=True,
+    )
+    files = {}
+    dump = _sql_dump(50000)
+    monkeypatch.setattr("administration.snapshots.open_store", lambda dest: InMemoryStore(files, can_list))
+    monkeypatch.setattr("administration.snapshots.subprocess.Popen", _fake_dump(dump))
+    first = run_snapshot_backup(destination)
+    log_backup_event(destination, BackupLog.ACTION_BACKUP, BackupLog.STATUS_SUCCESS, first.as_message(), first.file_name, manifest=first.manifest)
+
+    # The remote directory was pruned or replaced; the backup log still lists the chunks.
+    pruned = [name for name in files if name.startswith("chunks/")][:2]
+    for name in pruned:
+        del files[name]
+    second = run_snapshot_backup(destination)
+
+    assert second.uploaded_chunks == 2
+    assert all(name in files for name in pruned)
+    restored = io.BytesIO()
+    fetch_snapshot(destination, second.file_name, restored)
+    assert restored.getvalue() == dump
+
+
+def test_connection_stats_report_pool_usage(monkeypatch):
+    from administration import database
+
+    stats = database.connection_stats()
+    assert stats[0].alias == "default"
+    assert not stats[0].pooled
+    assert "persistente Verbindungen" in stats[0].as_message()
+
+    pool = mock.Mock()
+    pool.get_stats.return_value = {"pool_size": 3, "pool_max": 10, "pool_available": 2, "requests_num": 42}
+    monkeypatch.setattr(type(database.connections["default"]), "pool", pool, raising=False)
+    stats = database.connection_stats()
+    assert stats[0].pooled
+    assert stats[0].as_message().startswith("default (sqlite): Pool 3/10 Verbindungen, 2 frei")
+
+
+def test_static_reference_check_flags_unhashed_assets(tmp_path):
+    from administration.staticfiles import find_unhashed_references
+
+    (tmp_path / "page.html").write_text(
+        "{% load static %}\n"
+        "<link rel=\"stylesheet\" href=\"{% static 'css/style.css' %}\">\n"
+        "<img src=\"/static/img/logo/wvh.svg\">\n"
+        "<script src=\"{{ STATIC_URL }}js/bird.js\"></script>\n"
+        "<link rel=\"stylesheet\" href=\"{% static 'css/missing.css' %}\">\n"
+    )
+    findings = find_unhashed_references([tmp_path])
+    assert [(finding.line, finding.reason) for finding in findings] == [
+        (3, "fest eingetragener Pfad"),
+        (4, "fest eingetragener Pfad"),
+        (5, "Datei nicht gefunden"),
+    ]
+
+
+def test_project_templates_reference_only_hashed_assets():
+    from django.core.management import call_command
+
+    out = io.StringIO()
+    call_command("check_static_references", stdout=out)
+    assert "gehashte Dateinamen" in out.getvalue()
@@ -0,0 +1,103 @@
+"""Audit trail of tracked models."""
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from audit.models import AuditEntry
+from audit.recorder import collect, history
+from bird.models import Bird, BirdStatus, FallenBird
+from costs.models import Costs
+
+# Entries are written on commit, so the tests run without a wrapping transaction.
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+@pytest.fixture
+def user(db):
+    return User.objects.create_superuser(username="auditor", password="secret", email="auditor@example.com")
+
+
+@pytest.fixture
+def bird(db):
+    return Bird.objects.create(name="Turmfalke", species="Falco tinnunculus")
+
+
+def test_updates_store_field_level_diffs(bird):
+    bird.name = "Wanderfalke"
+    bird.save()
+    bird.save()  # unchanged, no entry
+
+    created, updated = history(bird).order_by("created", "id")
+    assert created.action == AuditEntry.CREATE
+    assert created.changes["name"] == [None, "Turmfalke"]
+    assert updated.action == AuditEntry.UPDATE
+    assert updated.changes == {"name": ["Turmfalke", "Wanderfalke"]}
+    assert updated.month == timezone.localdate().replace(day=1)
+
+
+def test_deletes_keep_the_last_values(user, bird):
+    BirdStatus.objects.create(id=1, description="In Behandlung")
+    patient = FallenBird.objects.create(bird=bird, bird_identifier="TF-1", user=user)
+    costs = Costs.objects.create(id_bird=patient, amount=Decimal("3.20"), user=user)
+    costs_id = str(costs.pk)
+
+    costs.delete()
+
+    entry = AuditEntry.objects.get(object_id=costs_id, action=AuditEntry.DELETE)
+    assert entry.changes["amount"] == ["3.20", None]
+
+
+def test_rolled_back_changes_are_not_recorded(bird):
+    with pytest.raises(RuntimeError), transaction.atomic():
+        bird.name = "Baumfalke"
+        bird.save()
+        raise RuntimeError
+
+    assert not history(bird).filter(action=AuditEntry.UPDATE).exists()
+
+
+def test_collect_writes_all_entries_with_one_insert(user):
+    with CaptureQueriesContext(connection) as context, collect(user=user):
+        for number in range(5):
+            Bird.objects.create(name=f"Art {number}")
+
+    inserts = [query for query in context.captured_queries if query["sql"].startswith('INSERT INTO "audit_auditentry"')]
+    assert len(inserts) == 1
+    assert AuditEntry.objects.filter(user=user, action=AuditEntry.CREATE).count() == 5
+
+
+def test_requests_attribute_changes_to_the_user(user, bird):
+    client = Client()
+    client.force_login(user)
+
+    client.post(
+        reverse("admin:bird_bird_change", args=[bird.pk]),
+        {"name": "Rotmilan", "species": "Milvus milvus"},
+    )
+
+    entry = history(bird).get(action=AuditEntry.UPDATE)
+    assert entry.user == user
+    assert entry.changes["name"] == ["Turmfalke", "Rotmilan"]
+
+
+def test_history_skips_older_months(bird):
+    entry = history(bird).get()
+
+    assert list(history(bird, since=entry.created - timedelta(days=1))) == [entry]
+    assert not history(bird, since=entry.created + timedelta(days=40)).exists()
+
+
+def test_entries_are_append_only(bird):
+    entry = history(bird).get()
+
+    with pytest.raises(TypeError):
+        entry.save()
+    with pytest.raises(TypeError):
+        entry.delete()
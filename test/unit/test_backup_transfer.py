@@ -0,0 +1,194 @@
+"""Chunked backup transfers against local WebDAV and SFTP stand-ins."""
+import os
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from django.utils import timezone
+
+from administration.exceptions import BackupError
+from administration.models import BackupDestination, BackupLog
+from administration.services import log_backup_event, run_backup, start_backup_log
+from administration.transfer import RemoteStore, SFTPStore, WebDAVStore, download_file, upload_file
+from backup_servers import SFTPStandIn, WebDAVStandIn
+
+CHUNK = 64 * 1024
+
+
+@pytest.fixture
+def payload(tmp_path):
+    path = tmp_path / "fbf_backup.dump"
+    path.write_bytes(os.urandom(5 * CHUNK + 123))
+    return path
+
+
+def _webdav_destination(standin):
+    return BackupDestination(name="dav", destination_type=BackupDestination.WEB_DAV, endpoint=standin.url)
+
+
+def _sftp_destination(standin):
+    return BackupDestination(
+        name="sftp",
+        destination_type=BackupDestination.SFTP,
+        endpoint="127.0.0.1",
+        port=standin.port,
+        username="backup",
+        password="secret",
+    )
+
+
+def test_incomplete_stores_cannot_be_created():
+    class ReadOnlyStore(RemoteStore):
+        def get(self, name):
+            return b""
+
+    with pytest.raises(TypeError, match="abstract"):
+        ReadOnlyStore(BackupDestination(name="readonly"))
+
+
+def test_webdav_chunked_upload_and_download(tmp_path, payload):
+    remote = tmp_path / "remote"
+    remote.mkdir()
+    with WebDAVStandIn(remote) as standin, WebDAVStore(_webdav_destination(standin)) as store:
+        stats = upload_file(store, payload, "backup.dump", chunk_size=CHUNK, workers=3, backoff=0)
+        assert (remote / "backup.dump").read_bytes() == payload.read_bytes()
+        assert sorted(os.listdir(remote)) == ["backup.dump"]
+        assert stats.chunks == 6
+        assert stats.throughput > 0
+
+        target = tmp_path / "download.dump"
+        reports = []
+        download_file(store, "backup.dump", target, chunk_size=CHUNK, workers=3, backoff=0, progress=reports.append)
+        assert target.read_bytes() == payload.read_bytes()
+        assert reports[-1].finished is not None
+        assert reports[-1].completed_bytes == payload.stat().st_size
+
+
+@pytest.mark.parametrize("server", ["webdav", "sftp"])
+def test_stores_list_directories(tmp_path, server):
+    remote = tmp_path / "remote"
+    (remote / "chunks" / "nested").mkdir(parents=True)
+    (remote / "chunks" / "abc").write_bytes(b"1")
+    (remote / "chunks" / "def").write_bytes(b"2")
+    if server == "webdav":
+        standin = WebDAVStandIn(remote)
+        open_store = lambda: WebDAVStore(_webdav_destination(standin))
+    else:
+        standin = SFTPStandIn(remote)
+        open_store = lambda: SFTPStore(_sftp_destination(standin))
+    with standin, open_store() as store:
+        assert store.list_dir("chunks") == {"abc", "def"}
+        assert store.list_dir("missing") == set()
+
+
+def test_webdav_retries_dropped_connections(tmp_path, payload):
+    remote = tmp_path / "remote"
+    remote.mkdir()
+    with WebDAVStandIn(remote) as standin, WebDAVStore(_webdav_destination(standin)) as store:
+        standin.server.drop_puts = 2
+        stats = upload_file(store, payload, "backup.dump", chunk_size=CHUNK, workers=2, backoff=0)
+        assert stats.retries == 2
+        assert (remote / "backup.dump").read_bytes() == payload.read_bytes()
+
+
+def test_webdav_falls_back_without_partial_upload_support(tmp_path, payload):
+    remote = tmp_path / "remote"
+    remote.mkdir()
+    with WebDAVStandIn(remote, partial_uploads=False) as standin, WebDAVStore(_webdav_destination(standin)) as store:
+        upload_file(store, payload, "backup.dump", chunk_size=CHUNK, workers=2, backoff=0)
+        assert (remote / "backup.dump").read_bytes() == payload.read_bytes()
+        assert sorted(os.listdir(remote)) == ["backup.dump"]
+
+
+def test_sftp_chunked_upload_retries_failed_chunk(tmp_path, payload):
+    remote = tmp_path / "remote"
+    remote.mkdir()
+    with SFTPStandIn(remote) as standin, SFTPStore(_sftp_destination(standin)) as store:
+        standin.fail_writes = 1
+        stats = upload_file(store, payload, "backup.dump", chunk_size=CHUNK, workers=3, backoff=0)
+        assert stats.retries == 1
+        assert (remote / "backup.dump").read_bytes() == payload.read_bytes()
+
+        target = tmp_path / "download.dump"
+        download_file(store, "backup.dump", target, chunk_size=CHUNK, workers=3, backoff=0)
+        assert target.read_bytes() == payload.read_bytes()
+
+
+def test_sftp_upload_resumes_at_recorded_offsets(tmp_path, payload):
+    remote = tmp_path / "remote"
+    remote.mkdir()
+    with SFTPStandIn(remote) as standin, SFTPStore(_sftp_destination(standin)) as store:
+        def interrupt(stats):
+            if stats.chunks == 2:
+                raise BackupError("Verbindung verloren")
+
+        with pytest.raises(BackupError):
+            upload_file(store, payload, "backup.dump", chunk_size=CHUNK, workers=1, backoff=0, progress=interrupt)
+        assert not (remote / "backup.dump").exists()
+
+        with mock.patch.object(store, "write_range", wraps=store.write_range) as write_range:
+            stats = upload_file(store, payload, "backup.dump", chunk_size=CHUNK, workers=2, backoff=0)
+        assert write_range.call_count == 4
+        assert stats.resumed_bytes == 2 * CHUNK
+        assert (remote / "backup.dump").read_bytes() == payload.read_bytes()
+
+
+def test_upload_state_is_written_every_few_chunks(tmp_path, payload, monkeypatch):
+    monkeypatch.setattr("administration.transfer.STATE_EVERY_CHUNKS", 2)
+    remote = tmp_path / "remote"
+    remote.mkdir()
+    with SFTPStandIn(remote) as standin, SFTPStore(_sftp_destination(standin)) as store:
+        with mock.patch.object(store, "put", wraps=store.put) as put:
+            upload_file(store, payload, "backup.dump", chunk_size=CHUNK, workers=1, backoff=0)
+    assert [call.args[0] for call in put.call_args_list] == ["backup.dump.part.json"] * 3
+
+
+@pytest.mark.django_db
+def test_stale_running_backups_are_failed_by_the_next_run():
+    destination = BackupDestination.objects.create(name="dav", endpoint="https://dav.example.com/")
+    stale = start_backup_log(destination, "fbf_backup_stale.sql")
+    BackupLog.objects.filter(pk=stale.pk).update(updated_at=timezone.now() - timedelta(hours=2))
+    concurrent = start_backup_log(destination, "fbf_backup_concurrent.sql")
+
+    start_backup_log(destination)
+
+    stale.refresh_from_db()
+    concurrent.refresh_from_db()
+    assert stale.status == BackupLog.STATUS_FAILURE
+    assert concurrent.status == BackupLog.STATUS_RUNNING
+
+
+@pytest.mark.django_db
+def test_run_backup_records_transfer_progress(tmp_path, monkeypatch):
+    remote = tmp_path / "remote"
+    remote.mkdir()
+
+    def fake_pg_dump(command, stdout=None, **kwargs):
+        stdout.write(b"-- dump --\n" * 2000)
+        return mock.Mock(returncode=0)
+
+    monkeypatch.setattr("administration.services.subprocess.run", fake_pg_dump)
+    with WebDAVStandIn(remote) as standin:
+        destination = BackupDestination.objects.create(
+            name="dav",
+            destination_type=BackupDestination.WEB_DAV,
+            endpoint=standin.url,
+            remote_path="nightly",
+        )
+        stale = start_backup_log(destination, "fbf_backup_stale.sql")
+        log = start_backup_log(destination)
+        file_name = run_backup(destination, log=log)
+
+    log.refresh_from_db()
+    assert log.status == BackupLog.STATUS_RUNNING
+    assert log.file_name == file_name
+    assert log.bytes_total == log.bytes_transferred == (remote / "nightly" / file_name).stat().st_size
+    assert log.duration is not None
+
+    # A later running entry, e.g. a concurrent run, is left alone.
+    concurrent = start_backup_log(destination, "fbf_backup_concurrent.sql")
+    log_backup_event(destination, BackupLog.ACTION_BACKUP, BackupLog.STATUS_SUCCESS, "ok", file_name, log=log)
+    log.refresh_from_db()
+    assert log.status == BackupLog.STATUS_SUCCESS
+    assert log.bytes_transferred > 0
+    assert BackupLog.objects.filter(pk__in=[stale.pk, concurrent.pk], status=BackupLog.STATUS_RUNNING).count() == 2
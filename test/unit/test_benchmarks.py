@@ -0,0 +1,56 @@
+"""Tests for the benchmark data generator and runner."""
+import io
+import json
+
+import pytest
+from django.core.management import call_command
+
+from administration.benchmarks import BENCHMARK_PREFIX, clear_benchmark_data
+from bird.models import FallenBird
+from costs.models import Costs
+from notizen.models import Notiz
+from stations.models import WildbirdHelpStation
+
+
+def _seed(**options):
+    defaults = {"patients": 120, "years": 3, "costs": 40, "notes": 30, "stations": 5, "batch_size": 50}
+    defaults.update(options)
+    call_command("seed_benchmark_data", stdout=io.StringIO(), **defaults)
+
+
+@pytest.mark.django_db
+def test_seed_creates_reproducible_data_spread_over_years():
+    _seed()
+    assert FallenBird.objects.filter(bird_identifier__startswith=BENCHMARK_PREFIX).count() == 120
+    assert Costs.objects.count() == 40
+    assert Notiz.objects.exclude(inhalt_html="").count() == 30
+    assert WildbirdHelpStation.objects.count() == 5
+    years = set(FallenBird.objects.values_list("date_found__year", flat=True))
+    assert len(years) == 3
+    places = list(FallenBird.objects.order_by("bird_identifier").values_list("place", flat=True))
+
+    clear_benchmark_data()
+    assert not FallenBird.objects.exists() and not Costs.objects.exists() and not Notiz.objects.exists()
+
+    _seed()
+    assert list(FallenBird.objects.order_by("bird_identifier").values_list("place", flat=True)) == places
+
+
+@pytest.mark.django_db
+def test_runner_emits_comparable_json(tmp_path):
+    _seed(patients=60, costs=10, notes=10)
+    output = tmp_path / "result.json"
+    call_command("run_benchmarks", repeat=1, output=str(output), stdout=io.StringIO())
+
+    report = json.loads(output.read_text())
+    assert report["counts"]["patients"] == 60
+    assert set(report["results"]) == {
+        "statistics_build", "report_csv", "export_birds_all", "bird_all", "bird_inactive", "station_feed",
+    }
+    for name in ("export_birds_all", "bird_all", "bird_inactive", "station_feed"):
+        assert report["results"][name]["status"] == 200
+        assert report["results"][name]["size_bytes"] > 0
+
+    err = io.StringIO()
+    call_command("run_benchmarks", repeat=1, only=["station_feed"], compare=str(output), stdout=io.StringIO(), stderr=err)
+    assert err.getvalue().startswith("station_feed: ")
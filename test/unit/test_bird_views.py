@@ -7,11 +7,14 @@ from django.contrib.auth.models import User
 from django.contrib.messages import get_messages
 from django.core import mail
 from django.core.mail import BadHeaderError
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from aviary.models import Aviary
 from bird.models import Bird, BirdStatus, Circumstance, FallenBird
+from costs.models import Costs
 from sendemail.models import Emailadress
 
 
@@ -227,6 +230,30 @@ def test_list_and_delete_views_authenticated(client, bird_test_data):
     assert not FallenBird.objects.filter(id=target_id).exists()
 
 
+@pytest.mark.django_db
+def test_patient_table_is_cached_until_a_shown_record_changes(client, bird_test_data):
+    user = bird_test_data["user"]
+    client.force_login(user)
+    patient = FallenBird.objects.filter(status=bird_test_data["status_active"]).first()
+    client.get(reverse("bird_all"))
+
+    with CaptureQueriesContext(connection) as queries:
+        client.get(reverse("bird_all"))
+    assert not any("bird_fallenbird" in query["sql"] for query in queries.captured_queries)
+
+    Costs.objects.create(id_bird=patient, costs=17, user=user)
+    assert "17 &euro;" in client.get(reverse("bird_all")).content.decode()
+
+    patient.aviary = bird_test_data["aviary"]
+    patient.save()
+    assert "Innenvoliere Ost" in client.get(reverse("bird_all")).content.decode()
+
+    bird_test_data["aviary"].description = "Außenvoliere"
+    bird_test_data["aviary"].name = "Außenvoliere"
+    bird_test_data["aviary"].save()
+    assert "Außenvoliere" in client.get(reverse("bird_all")).content.decode()
+
+
 @pytest.mark.django_db
 def test_help_views_render_species_listing(client, bird_test_data):
     """Ensure the help pages render with the expected context."""
@@ -0,0 +1,123 @@
+"""Tests for the namespaced cache helpers and the view cache policy."""
+from datetime import date
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from bird.models import Bird, BirdStatus, Circumstance, FallenBird
+from core.cache import get_or_build, invalidate, make_key, namespace_version
+
+
+@pytest.fixture
+def logged_in_client(client, db):
+    user = User.objects.create_user(username="cache-user", password="secret")
+    client.force_login(user)
+    return client
+
+
+def test_invalidate_moves_namespace_to_new_version():
+    calls = []
+
+    def build():
+        calls.append(1)
+        return len(calls)
+
+    assert get_or_build("demo", ("key",), build) == 1
+    assert get_or_build("demo", ("key",), build) == 1
+    old_key = make_key("demo", "key")
+
+    invalidate("demo")
+    assert make_key("demo", "key") != old_key
+    assert get_or_build("demo", ("key",), build) == 2
+
+
+@pytest.mark.django_db
+def test_saving_a_species_invalidates_bird_namespace():
+    version = namespace_version("bird")
+    bird = Bird.objects.create(name="Amsel", species="Turdus merula")
+    assert namespace_version("bird") != version
+
+    version = namespace_version("bird")
+    bird.delete()
+    assert namespace_version("bird") != version
+
+
+@pytest.mark.django_db
+def test_bird_help_answers_revalidation_with_304(logged_in_client):
+    bird = Bird.objects.create(name="Amsel", species="Turdus merula")
+    url = reverse("bird_help")
+
+    response = logged_in_client.get(url)
+    assert response.status_code == 200
+    assert "private" in response["Cache-Control"]
+    etag = response["ETag"]
+
+    with CaptureQueriesContext(connection) as queries:
+        response = logged_in_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    assert not [q for q in queries if "bird_bird" in q["sql"]]
+
+    bird.name = "Schwarzdrossel"
+    bird.save()
+    response = logged_in_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert "Schwarzdrossel" in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_species_list_served_from_cache(logged_in_client):
+    Bird.objects.create(name="Amsel", species="Turdus merula")
+    url = reverse("bird_species_list")
+    logged_in_client.get(url)
+
+    with CaptureQueriesContext(connection) as queries:
+        response = logged_in_client.get(url)
+    assert "Amsel" in response.content.decode()
+    assert not [q for q in queries if 'FROM "bird_bird"' in q["sql"]]
+
+
+@pytest.mark.django_db
+def test_statistics_context_cached_until_patient_changes(logged_in_client):
+    status = BirdStatus.objects.create(description="In Behandlung")
+    circumstance = Circumstance.objects.create(name="Fenster", description="Fensteranflug")
+    bird = Bird.objects.create(name="Amsel", species="Turdus merula")
+    FallenBird.objects.create(bird=bird, status=status, date_found=date.today(), place="Jena", find_circumstances=circumstance)
+    url = reverse("statistic:overview")
+    logged_in_client.get(url)  # creates the default configuration
+
+    first = logged_in_client.get(url)
+    with CaptureQueriesContext(connection) as queries:
+        second = logged_in_client.get(url)
+    assert second.context["patients_this_year"] == first.context["patients_this_year"] == 1
+    assert not [q for q in queries if "bird_fallenbird" in q["sql"]]
+
+    FallenBird.objects.create(bird=bird, status=status, date_found=date.today(), place="Jena", find_circumstances=circumstance)
+    assert logged_in_client.get(url).context["patients_this_year"] == 2
+
+
+@pytest.mark.django_db
+def test_help_description_fragment_follows_updated_timestamp(logged_in_client):
+    bird = Bird.objects.create(name="Amsel", species="Turdus merula", description="<p>Alt</p>")
+    url = reverse("bird_help_single", args=[bird.id])
+    assert "Alt" in logged_in_client.get(url).content.decode()
+
+    bird.description = "<p>Neu</p>"
+    bird.save()
+    assert "Neu" in logged_in_client.get(url).content.decode()
+
+
+@pytest.mark.django_db
+def test_patient_rows_rerender_when_lookup_tables_change(logged_in_client):
+    status = BirdStatus.objects.create(id=1, description="In Behandlung")
+    circumstance = Circumstance.objects.create(name="Fenster", description="Fensteranflug")
+    bird = Bird.objects.create(name="Amsel", species="Turdus merula")
+    FallenBird.objects.create(bird=bird, status=status, date_found=date.today(), place="Jena", find_circumstances=circumstance)
+    url = reverse("bird_all")
+    assert "In Behandlung" in logged_in_client.get(url).content.decode()
+
+    status.description = "Auswilderung"
+    status.save()
+    assert "Auswilderung" in logged_in_client.get(url).content.decode()
@@ -0,0 +1,54 @@
+"""Parquet and Arrow patient exports."""
+import io
+from datetime import date
+
+import pytest
+from django.contrib.auth.models import User
+from django.test import Client
+from django.urls import reverse
+
+from bird.models import Bird, BirdStatus, FallenBird
+from export.columnar import columnar_chunks
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+@pytest.fixture
+def client(db):
+    user = User.objects.create_user(username="analyst", password="secret")
+    status = BirdStatus.objects.create(id=1, description="In Behandlung")
+    bird = Bird.objects.create(name="Mauersegler", species="Apus apus")
+    for number in range(3):
+        FallenBird.objects.create(
+            bird=bird, bird_identifier=f"MS-{number}", date_found=date(2024, 6, number + 1),
+            sex="Weiblich", status=status, user=user,
+        )
+    client = Client()
+    client.force_login(user)
+    return client
+
+
+def test_parquet_export_has_typed_and_dictionary_columns(client):
+    response = client.get(reverse("export_birds_all"), {"format": "parquet"})
+
+    assert response["Content-Type"] == "application/vnd.apache.parquet"
+    table = pq.read_table(io.BytesIO(b"".join(response.streaming_content)))
+    assert table.num_rows == 3
+    assert table.schema.field("Gefunden am").type == pa.date32()
+    assert pa.types.is_dictionary(table.schema.field("Vogel").type)
+    assert pa.types.is_dictionary(table.schema.field("Status").type)
+    assert table.column("Gefunden am").to_pylist() == [date(2024, 6, 1), date(2024, 6, 2), date(2024, 6, 3)]
+    assert table.column("Akte geschlossen am").null_count == 0
+
+
+def test_arrow_stream_allows_new_dictionaries_per_batch(client):
+    data = b"".join(columnar_chunks("arrow", batch_size=2))
+
+    table = pa.ipc.open_stream(data).read_all()
+    assert table.num_rows == 3
+    assert table.column("Vogel").to_pylist() == ["Mauersegler"] * 3
+
+
+def test_unknown_format_is_not_found(client):
+    assert client.get(reverse("export_birds_all"), {"format": "xlsx"}).status_code == 404
@@ -0,0 +1,97 @@
+"""Streaming patient exports."""
+import asyncio
+import csv
+import io
+import zipfile
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth.models import User
+from django.test import AsyncRequestFactory, Client
+from django.urls import reverse
+from django.utils import timezone
+
+from bird.models import Bird, BirdStatus, FallenBird
+from costs.models import Costs
+from export.streaming import _async_chunks, csv_chunks, patient_table, streaming_response
+from notizen.models import Notiz
+
+
+@pytest.fixture
+def user(db):
+    return User.objects.create_user(username="export", password="secret")
+
+
+@pytest.fixture
+def client(user):
+    client = Client()
+    client.force_login(user)
+    return client
+
+
+@pytest.fixture
+def patient(user):
+    BirdStatus.objects.create(id=1, description="In Behandlung")
+    bird = Bird.objects.create(name="Mauersegler", species="Apus apus")
+    return FallenBird.objects.create(
+        bird=bird, bird_identifier="MS-1", date_found=date(2024, 6, 1), place="Jena", user=user
+    )
+
+
+def _rows(data):
+    return list(csv.reader(io.StringIO(data.decode("utf-8-sig")), delimiter=";"))
+
+
+def test_csv_export_streams_all_patients(client, patient):
+    response = client.get(reverse("export_birds_all"))
+
+    assert response.streaming
+    assert response["Content-Disposition"] == (
+        f'attachment; filename="fbf_all_birds_{timezone.localdate().isoformat()}.csv"'
+    )
+    rows = _rows(b"".join(response.streaming_content))
+    assert rows[0][0] == "Patienten Alias"
+    assert rows[1][:2] == ["MS-1", "Mauersegler"]
+
+
+def test_csv_chunks_are_bounded_by_chunk_size(patient, user):
+    for number in range(4):
+        FallenBird.objects.create(bird=patient.bird, bird_identifier=f"MS-{number + 2}", user=user)
+
+    chunks = list(csv_chunks(patient_table(), rows_per_chunk=2))
+
+    # Header, then three chunks for five patients.
+    assert len(chunks) == 4
+    assert len(_rows(b"".join(chunks))) == 6
+
+
+def test_archive_contains_patients_costs_and_notes(client, patient, user):
+    Costs.objects.create(id_bird=patient, amount=Decimal("12.50"), description="Futter", user=user)
+    Notiz.objects.create(name="Visite", inhalt="Frisst gut", content_object=patient, erstellt_von=user)
+
+    response = client.get(reverse("export_archive"))
+
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(response.streaming_content)))
+    assert archive.namelist() == ["patienten.csv", "kosten.csv", "notizen.csv"]
+    patients = _rows(archive.read("patienten.csv"))
+    assert patients[1][:2] == [str(patient.id), "MS-1"]
+    costs = _rows(archive.read("kosten.csv"))
+    assert costs[1][:3] == [str(patient.id), "MS-1", "12.50"]
+    notes = _rows(archive.read("notizen.csv"))
+    assert notes[1][:4] == [str(patient.id), "MS-1", "Visite", "Frisst gut"]
+
+
+def test_async_chunks_yield_every_chunk():
+    async def collect():
+        return [chunk async for chunk in _async_chunks(iter([b"a", b"b"]))]
+
+    assert asyncio.run(collect()) == [b"a", b"b"]
+
+
+def test_asgi_requests_get_an_asynchronous_stream():
+    request = AsyncRequestFactory().get("/export/birds/all/")
+
+    response = streaming_response(request, iter([b"a"]), "export.csv", "text/csv")
+
+    assert response.is_async
@@ -0,0 +1,73 @@
+"""Tests for the opt-in query and latency instrumentation."""
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from bird.models import Bird
+from core.instrumentation import RequestMetrics, normalize_sql, route_summaries
+
+
+@pytest.fixture
+def staff_client(db):
+    user = User.objects.create_user(username="perf-admin", password="secret", is_staff=True)
+    client = Client()
+    client.force_login(user)
+    return client
+
+
+def test_execute_wrapper_counts_and_flags_duplicates(db):
+    metrics = RequestMetrics()
+    with connection.execute_wrapper(metrics):
+        list(Bird.objects.filter(name="Amsel"))
+        list(Bird.objects.filter(name="Amsel"))
+        list(Bird.objects.filter(name="Meise"))
+    assert metrics.queries == 3
+    assert metrics.db_time > 0
+    # The same statement with other parameters is what N+1 patterns look like.
+    assert len(metrics.duplicates) == 1
+    assert metrics.duplicates[0][1] == 3
+    assert metrics.identical_repeats == 1
+    assert "2 doppelt (1 identisch)" in metrics.server_timing(0.01)
+
+
+def test_similar_statements_share_a_normalised_form():
+    assert normalize_sql('SELECT * FROM "bird" WHERE "id" IN (%s, %s) LIMIT 21') == normalize_sql(
+        'SELECT * FROM "bird" WHERE "id" IN (%s, %s, %s)\n LIMIT 1'
+    )
+    assert normalize_sql("SELECT 'Amsel', 3.5") == "SELECT ?, ?"
+    assert normalize_sql('SELECT "t0"."name" FROM "bird" "t0"') == 'SELECT "t0"."name" FROM "bird" "t0"'
+
+
+def test_disabled_instrumentation_adds_no_header(staff_client):
+    response = staff_client.get(reverse("bird_species_list"))
+    assert "Server-Timing" not in response
+
+
+@override_settings(REQUEST_INSTRUMENTATION=True)
+def test_requests_get_server_timing_and_route_summary(staff_client):
+    Bird.objects.create(name="Amsel", species="Turdus merula")
+    response = staff_client.get(reverse("bird_species_list"))
+
+    timing = response["Server-Timing"]
+    assert timing.startswith("db;dur=")
+    assert "tpl;dur=" in timing and "total;dur=" in timing
+
+    routes = {summary.route: summary for summary in route_summaries()}
+    summary = routes["GET /bird/species/"]
+    assert summary.requests == 1
+    assert summary.max_queries > 0
+    assert summary.avg_template_ms > 0
+
+
+@override_settings(REQUEST_INSTRUMENTATION=True)
+def test_performance_dashboard_lists_routes(staff_client):
+    staff_client.get(reverse("bird_species_list"))
+    response = staff_client.get(reverse("administration:performance_dashboard"))
+    assert response.status_code == 200
+    assert "GET /bird/species/" in response.content.decode()
+
+    staff_client.post(reverse("administration:performance_dashboard"), {"reset": "1"})
+    # Only the reset request itself has been recorded since.
+    assert [s.route for s in route_summaries()] == ["POST /admin/administration/performance/"]
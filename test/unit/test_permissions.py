@@ -0,0 +1,50 @@
+"""Request-scoped group memberships used by the navigation."""
+import pytest
+from django.contrib.auth.models import Group, User
+from django.db import connection
+from django.template import Context, Template
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from core.permissions import group_names
+
+
+@pytest.fixture
+def user(db):
+    return User.objects.create_user(username="exporter", password="secret")
+
+
+def test_group_names_are_loaded_once_per_user(user):
+    user.groups.add(Group.objects.create(name="data-export"))
+    user = User.objects.get(pk=user.pk)
+
+    with CaptureQueriesContext(connection) as context:
+        assert group_names(user) == {"data-export"}
+        assert group_names(user) == {"data-export"}
+        template = Template('{% load group_check %}{{ user|group_check:"data-export" }}')
+        assert template.render(Context({"user": user})) == "True"
+
+    assert len(context.captured_queries) == 1
+
+
+def test_changing_groups_drops_cached_names(user):
+    assert group_names(user) == frozenset()
+    user.groups.add(Group.objects.create(name="data-export"))
+    assert group_names(user) == {"data-export"}
+
+
+def test_navigation_shows_export_only_for_group_members(user):
+    client = Client()
+    client.force_login(user)
+    export_url = reverse("site_exports")
+
+    assert export_url not in client.get(reverse("bird_all")).content.decode()
+
+    user.groups.add(Group.objects.create(name="data-export"))
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(reverse("bird_all"))
+
+    assert export_url in response.content.decode()
+    assert response.context["user_groups"] == {"data-export"}
+    assert sum('"auth_group"' in query["sql"] for query in context.captured_queries) == 1
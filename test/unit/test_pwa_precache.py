@@ -0,0 +1,52 @@
+"""Tests for the service worker precache list and cache version."""
+import json
+
+import pytest
+from django.test import override_settings
+from django.urls import reverse
+
+from core.pwa import CACHE_PREFIX, precache_manifest
+
+MANIFEST_STORAGE = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.ManifestStaticFilesStorage"},
+}
+
+
+def _write_manifest(root, paths):
+    (root / "staticfiles.json").write_text(json.dumps({"version": "1.1", "paths": paths}))
+
+
+def test_precache_without_manifest_lists_app_shell():
+    manifest = precache_manifest()
+    assert "/static/vendor/bootswatch/5/cosmo/bootstrap.min.css" in manifest.urls
+    assert "/static/css/style.css" in manifest.urls
+    assert not [url for url in manifest.urls if url.startswith("/static/admin/")]
+    assert manifest.cache_name.startswith(f"{CACHE_PREFIX}-")
+
+
+def test_precache_uses_hashed_names_from_manifest(tmp_path):
+    _write_manifest(tmp_path, {
+        "css/style.css": "css/style.aaa.css",
+        "admin/css/base.css": "admin/css/base.bbb.css",
+    })
+    with override_settings(STORAGES=MANIFEST_STORAGE, STATIC_ROOT=str(tmp_path)):
+        manifest = precache_manifest()
+    assert manifest.urls == ["/static/css/style.aaa.css"]
+
+
+def test_cache_version_changes_with_deployed_assets(tmp_path):
+    _write_manifest(tmp_path, {"css/style.css": "css/style.aaa.css"})
+    with override_settings(STORAGES=MANIFEST_STORAGE, STATIC_ROOT=str(tmp_path)):
+        first = precache_manifest().cache_name
+
+    _write_manifest(tmp_path, {"css/style.css": "css/style.ccc.css"})
+    with override_settings(STORAGES=MANIFEST_STORAGE, STATIC_ROOT=str(tmp_path)):
+        assert precache_manifest().cache_name != first
+
+
+@pytest.mark.django_db
+def test_service_worker_uses_versioned_cache(client):
+    content = client.get(reverse("pwa_service_worker")).content.decode()
+    assert f"const CACHE_NAME = '{precache_manifest().cache_name}';" in content
+    assert "bootswatch.com" not in content
@@ -0,0 +1,141 @@
+"""Tests for the delta sync API used by the offline PWA."""
+from datetime import date, timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from aviary.models import Aviary
+from bird.models import Bird, BirdStatus, Circumstance, FallenBird
+from tenants.models import Membership, Organisation
+
+
+@pytest.fixture
+def logged_in_client(client, db):
+    user = User.objects.create_user(username="sync-user", password="secret")
+    client.force_login(user)
+    return client
+
+
+@pytest.fixture
+def patients(db):
+    active = BirdStatus.objects.create(id=1, description="In Behandlung")
+    BirdStatus.objects.create(id=2, description="In Auswilderung")
+    released = BirdStatus.objects.create(id=3, description="Ausgewildert")
+    circumstance = Circumstance.objects.create(name="Fenster", description="Fensteranflug")
+    bird = Bird.objects.create(name="Amsel", species="Turdus merula")
+    aviary = Aviary.objects.create(name="Voliere 1")
+
+    def create(status=active, **kwargs):
+        return FallenBird.objects.create(
+            bird=bird,
+            status=status,
+            aviary=aviary,
+            date_found=date.today(),
+            place="Jena",
+            find_circumstances=circumstance,
+            **kwargs,
+        )
+
+    create.released = released
+    return create
+
+
+def _backdate_everything():
+    past = timezone.now() - timedelta(days=1)
+    FallenBird.objects.update(updated=past)
+    Bird.objects.update(updated=past)
+    Aviary.objects.update(updated=past)
+
+
+def test_sync_requires_login(client, db):
+    response = client.get(reverse("pwa_sync"))
+    assert response.status_code == 302
+
+
+def test_full_sync_contains_only_active_patients(logged_in_client, patients):
+    active = patients(bird_identifier="A1")
+    patients(status=patients.released, bird_identifier="R1")
+
+    response = logged_in_client.get(reverse("pwa_sync"))
+    payload = response.json()
+
+    assert response["Cache-Control"] == "no-store"
+    assert payload["full"] is True
+    assert [row["id"] for row in payload["patients"]["changed"]] == [str(active.id)]
+    assert payload["patients"]["ids"] == [str(active.id)]
+    assert [row["name"] for row in payload["species"]["changed"]] == ["Amsel"]
+    assert [row["name"] for row in payload["aviaries"]["changed"]] == ["Voliere 1"]
+    assert {row["description"] for row in payload["statuses"]} >= {"In Behandlung"}
+
+
+def test_delta_sync_sends_only_changed_rows(logged_in_client, patients):
+    unchanged = patients(bird_identifier="A1")
+    changed = patients(bird_identifier="A2")
+    _backdate_everything()
+    # Rows at the cursor time are sent again, keep the untouched one older.
+    FallenBird.objects.filter(pk=unchanged.pk).update(updated=timezone.now() - timedelta(days=2))
+    token = logged_in_client.get(reverse("pwa_sync")).json()["token"]
+
+    changed.refresh_from_db()
+    changed.place = "Weimar"
+    changed.save()
+
+    payload = logged_in_client.get(reverse("pwa_sync"), {"since": token}).json()
+    assert payload["full"] is False
+    changed_ids = [row["id"] for row in payload["patients"]["changed"]]
+    assert str(changed.id) in changed_ids
+    assert str(unchanged.id) not in changed_ids
+    assert set(payload["patients"]["ids"]) == {str(unchanged.id), str(changed.id)}
+    assert [row["name"] for row in payload["species"]["changed"]] == ["Amsel"]
+
+
+def test_delta_sync_drops_closed_and_deleted_patients(logged_in_client, patients):
+    closed = patients(bird_identifier="A1")
+    deleted = patients(bird_identifier="A2")
+    kept = patients(bird_identifier="A3")
+    token = logged_in_client.get(reverse("pwa_sync")).json()["token"]
+
+    closed.status = patients.released
+    closed.save()
+    deleted.delete()
+
+    payload = logged_in_client.get(reverse("pwa_sync"), {"since": token}).json()
+    assert payload["patients"]["ids"] == [str(kept.id)]
+
+
+def test_tampered_token_falls_back_to_full_sync(logged_in_client, patients):
+    patients()
+    token = logged_in_client.get(reverse("pwa_sync")).json()["token"]
+
+    payload = logged_in_client.get(reverse("pwa_sync"), {"since": token + "x"}).json()
+    assert payload["full"] is True
+    assert len(payload["patients"]["changed"]) == 1
+
+
+def test_token_of_another_user_falls_back_to_full_sync(logged_in_client, patients):
+    patients()
+    token = logged_in_client.get(reverse("pwa_sync")).json()["token"]
+    other = Client()
+    other.force_login(User.objects.create_user(username="other-user", password="secret"))
+
+    payload = other.get(reverse("pwa_sync"), {"since": token}).json()
+    assert payload["full"] is True
+    assert len(payload["patients"]["changed"]) == 1
+
+
+def test_token_of_another_organisation_falls_back_to_full_sync(logged_in_client, patients):
+    patients()
+    token = logged_in_client.get(reverse("pwa_sync")).json()["token"]
+    organisation = Organisation.objects.create(name="Wildvogelhilfe Jena", slug="jena")
+    Membership.objects.create(user=User.objects.get(username="sync-user"), organisation=organisation)
+
+    payload = logged_in_client.get(reverse("pwa_sync"), {"since": token}).json()
+    assert payload["full"] is True
+
+
+def test_service_worker_knows_sync_url(client, db):
+    response = client.get(reverse("pwa_service_worker"))
+    assert f"const SYNC_URL = '{reverse('pwa_sync')}';" in response.content.decode()
@@ -0,0 +1,195 @@
+"""Query budgets: list and report views must not issue queries per row."""
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.test import Client
+from django.urls import reverse
+
+from audit.models import AuditEntry
+from aviary.models import Aviary
+from bird.models import Bird, BirdStatus, Circumstance, FallenBird
+from contact.models import Contact, ContactTag
+from costs.models import Costs
+from notizen.models import Notiz
+from statistic.models import StatisticIndividual, StatisticTotalGroup, StatisticYearGroup
+from stations.models import StationReport, WildbirdHelpStation
+
+
+@pytest.fixture
+def user(db):
+    return User.objects.create_superuser(username="budget", password="secret", email="budget@example.com")
+
+
+@pytest.fixture
+def staff_client(user):
+    client = Client()
+    client.force_login(user)
+    return client
+
+
+@pytest.fixture
+def lookups(db):
+    statuses = {
+        pk: BirdStatus.objects.create(id=pk, description=name)
+        for pk, name in [(1, "In Behandlung"), (2, "In Auswilderung"), (3, "Ausgewildert"), (5, "Verstorben")]
+    }
+    circumstances = [
+        Circumstance.objects.create(name=name, description=name) for name in ("Fensteranflug", "Katze", "Verkehr")
+    ]
+    aviary = Aviary.objects.create(name="Voliere 1")
+    return statuses, circumstances, aviary
+
+
+@pytest.fixture
+def patient_factory(user, lookups):
+    statuses, circumstances, aviary = lookups
+
+    def create(number, status=1, with_costs=False):
+        # A new species per patient, so per-row lookups cannot hide behind a shared object.
+        bird = Bird.objects.create(name=f"Art {status}-{number}", species=f"Species {number}")
+        patient = FallenBird.objects.create(
+            bird=bird,
+            bird_identifier=f"P{status}-{number}",
+            status=statuses[status],
+            aviary=aviary,
+            date_found=date.today() - timedelta(days=number),
+            place="Jena",
+            find_circumstances=circumstances[number % len(circumstances)],
+            user=user,
+        )
+        if with_costs:
+            Costs.objects.create(id_bird=patient, bird=bird, costs=Decimal("4.50"), user=user)
+        return patient
+
+    return create
+
+
+def test_bird_all(staff_client, patient_factory, query_budget):
+    query_budget(staff_client, reverse("bird_all"), lambda n: patient_factory(n))
+
+
+def test_bird_inactive(staff_client, patient_factory, query_budget):
+    query_budget(staff_client, reverse("bird_inactive"), lambda n: patient_factory(n, status=3, with_costs=True))
+
+
+def test_aviary_single(staff_client, patient_factory, lookups, query_budget):
+    aviary = lookups[2]
+    query_budget(staff_client, reverse("aviary_single", args=[aviary.id]), lambda n: patient_factory(n))
+
+
+def test_costs_all(staff_client, patient_factory, query_budget):
+    def grow(n):
+        patient = patient_factory(n)
+        Costs.objects.create(id_bird=patient, bird=patient.bird, costs=Decimal("1.00"), user=patient.user)
+
+    query_budget(staff_client, reverse("costs_all"), grow)
+
+
+def test_contact_all(staff_client, user, query_budget):
+    def grow(n):
+        tag = ContactTag.objects.create(tag=f"Tag {n}")
+        Contact.objects.create(name=f"Kontakt {n}", first_name="Vorname", last_name="Nachname", tag_id=tag, created_by=user)
+
+    query_budget(staff_client, reverse("contact_all"), grow)
+
+
+def test_statistics_overview(staff_client, patient_factory, query_budget):
+    staff_client.get(reverse("statistic:overview"))  # creates the default configuration
+
+    def grow(n):
+        patient_factory(n, status=(1, 3, 5)[n % 3])
+
+    query_budget(staff_client, reverse("statistic:overview"), grow)
+
+
+def test_station_data(staff_client, query_budget):
+    def grow(n):
+        WildbirdHelpStation.objects.create(
+            name=f"Station {n}",
+            city="Jena",
+            latitude=Decimal("50.9"),
+            longitude=Decimal("11.5"),
+            approved_for_publication=True,
+        )
+
+    query_budget(staff_client, reverse("stations:data"), grow)
+
+
+def _admin_factories(user, patient_factory):
+    def notiz(n):
+        patient = patient_factory(n)
+        Notiz.objects.create(name=f"Notiz {n}", inhalt="Text", content_object=patient, erstellt_von=user)
+
+    def statistic_group(model):
+        def create(n):
+            group = model.objects.create(name=f"Gruppe {n}")
+            group.status_list.set(BirdStatus.objects.all())
+
+        return create
+
+    return {
+        "bird_fallenbird": patient_factory,
+        "bird_bird": lambda n: Bird.objects.create(name=f"Vogel {n}", species=f"Species {n}"),
+        "bird_birdstatus": lambda n: BirdStatus.objects.create(description=f"Status {n}"),
+        "bird_circumstance": lambda n: Circumstance.objects.create(name=f"Umstand {n}", description=f"Umstand {n}"),
+        "aviary_aviary": lambda n: Aviary.objects.create(name=f"Voliere {n + 2}", created_by=user),
+        "costs_costs": lambda n: Costs.objects.create(
+            id_bird=patient_factory(n), costs=Decimal("2.00"), user=user, created_by=user
+        ),
+        "contact_contact": lambda n: Contact.objects.create(
+            name=f"Kontakt {n}", tag_id=ContactTag.objects.create(tag=f"Tag {n}"), created_by=user
+        ),
+        "notizen_notiz": notiz,
+        "stations_wildbirdhelpstation": lambda n: WildbirdHelpStation.objects.create(name=f"Station {n}", city="Jena"),
+        "stations_stationreport": lambda n: StationReport.objects.create(name=f"Meldung {n}", city="Jena"),
+        "statistic_statisticindividual": statistic_group(StatisticIndividual),
+        "statistic_statisticyeargroup": statistic_group(StatisticYearGroup),
+        "statistic_statistictotalgroup": statistic_group(StatisticTotalGroup),
+        "audit_auditentry": lambda n: AuditEntry.objects.create(
+            content_type=ContentType.objects.get_for_model(Bird),
+            object_id=str(n),
+            object_repr=f"Vogel {n}",
+            action=AuditEntry.UPDATE,
+            changes={"name": ["alt", "neu"]},
+            user=user,
+        ),
+    }
+
+
+ADMIN_CHANGELISTS = [
+    "bird_fallenbird",
+    "bird_bird",
+    "bird_birdstatus",
+    "bird_circumstance",
+    "aviary_aviary",
+    "costs_costs",
+    "contact_contact",
+    "notizen_notiz",
+    "stations_wildbirdhelpstation",
+    "stations_stationreport",
+    "statistic_statisticindividual",
+    "statistic_statisticyeargroup",
+    "statistic_statistictotalgroup",
+    "audit_auditentry",
+]
+
+
+@pytest.mark.parametrize("changelist", ADMIN_CHANGELISTS)
+def test_admin_changelist(changelist, staff_client, user, patient_factory, query_budget):
+    factory = _admin_factories(user, patient_factory)[changelist]
+    query_budget(staff_client, reverse(f"admin:{changelist}_changelist"), factory)
+
+
+def test_status_usage_is_annotated_and_sortable(staff_client, patient_factory, lookups):
+    for number in range(3):
+        patient_factory(number, status=3)
+    patient_factory(3, status=1)
+
+    response = staff_client.get(reverse("admin:bird_birdstatus_changelist"), {"o": "-3"})
+
+    statuses = list(response.context["cl"].result_list)
+    assert [status.patient_count for status in statuses] == [3, 1, 0, 0]
+    assert "3 Patienten" in response.content.decode()
@@ -0,0 +1,77 @@
+"""Rate limiting of the public station endpoints."""
+import pytest
+from django.urls import reverse
+
+from core.ratelimit import Rule, client_address, hit, parse_rate
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def limits(settings):
+    settings.RATE_LIMITS = {
+        "stations:report": {"rate": "2/h", "methods": ["POST"]},
+        "stations:data": "3/m",
+    }
+    settings.RATE_LIMIT_PROXY_COUNT = 0
+    return settings
+
+
+def test_parse_rate():
+    assert parse_rate("5/h") == (5, 3600)
+    assert parse_rate("100/10m") == (100, 600)
+    with pytest.raises(ValueError):
+        parse_rate("5/w")
+
+
+def test_window_slides_over_the_previous_count():
+    rule = Rule(limit=10, window=60)
+
+    for _ in range(10):
+        assert hit("demo", rule, now=59) is None
+    assert hit("demo", rule, now=59) == 2
+
+    # 15 s into the next window three quarters of the old count still apply.
+    assert hit("demo", rule, now=75) is None
+    assert hit("demo", rule, now=75) is None
+    assert hit("demo", rule, now=75) is None
+    assert hit("demo", rule, now=75) == 4
+    assert hit("demo", rule, now=79) is None
+
+
+def test_station_data_is_limited_per_client(client, limits):
+    url = reverse("stations:data")
+
+    statuses = [client.get(url, REMOTE_ADDR="10.0.0.1").status_code for _ in range(4)]
+    other = client.get(url, REMOTE_ADDR="10.0.0.2")
+
+    assert statuses == [200, 200, 200, 429]
+    assert other.status_code == 200
+
+
+def test_rejections_carry_retry_after(client, limits):
+    url = reverse("stations:report")
+
+    for _ in range(2):
+        client.post(url, {"name": ""})
+    response = client.post(url, {"name": ""})
+
+    assert response.status_code == 429
+    assert 0 < int(response["Retry-After"]) <= 3600
+    # Only the configured methods are limited.
+    assert client.get(url).status_code == 200
+
+
+def test_routes_without_rule_are_not_limited(client, limits):
+    limits.RATE_LIMITS = {"stations:data": "1/m"}
+
+    assert [client.get(reverse("stations:map")).status_code for _ in range(3)] == [200, 200, 200]
+
+
+def test_forwarded_address_behind_trusted_proxy(rf, settings):
+    request = rf.get("/", HTTP_X_FORWARDED_FOR="1.2.3.4, 203.0.113.9", REMOTE_ADDR="172.18.0.2")
+
+    settings.RATE_LIMIT_PROXY_COUNT = 0
+    assert client_address(request) == "172.18.0.2"
+    settings.RATE_LIMIT_PROXY_COUNT = 1
+    assert client_address(request) == "203.0.113.9"
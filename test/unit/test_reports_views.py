@@ -0,0 +1,46 @@
+"""Tests for the asynchronous manual report view."""
+from datetime import date
+
+import pytest
+from django.contrib.auth.models import User
+from django.core import mail
+from django.test import override_settings
+from django.urls import reverse
+
+from reports.models import ReportLog
+from sendemail.models import Emailadress
+
+
+@pytest.mark.django_db
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+def test_manual_report_sends_email_asynchronously(client):
+    staff = User.objects.create_user(username="staff", password="secret", is_staff=True)
+    address = Emailadress.objects.create(email_address="behoerde@example.com", user=staff)
+    client.force_login(staff)
+
+    response = client.post(
+        reverse("reports:manual_report"),
+        data={
+            "date_from": date(date.today().year, 1, 1).isoformat(),
+            "date_to": date.today().isoformat(),
+            "include_naturschutzbehoerde": "on",
+            "email_addresses": [address.pk],
+            "action": "email",
+        },
+    )
+
+    assert response.status_code == 302
+    assert len(mail.outbox) == 1
+    assert mail.outbox[0].to == ["behoerde@example.com"]
+    assert ReportLog.objects.get().email_sent_to == ["behoerde@example.com"]
+
+
+@pytest.mark.django_db
+def test_manual_report_form_renders(client):
+    staff = User.objects.create_user(username="staff", password="secret", is_staff=True)
+    client.force_login(staff)
+
+    response = client.get(reverse("reports:manual_report"))
+
+    assert response.status_code == 200
+    assert "Manuellen Report erstellen" in response.content.decode()
@@ -0,0 +1,110 @@
+"""Global search across patients, species, contacts and notes."""
+from datetime import date
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client
+from django.urls import reverse
+
+from bird.models import Bird, BirdStatus, FallenBird
+from contact.models import Contact
+from notizen.models import Notiz, Page
+from search.services import search
+from tenants.models import Membership, Organisation
+from tenants.scope import scope
+
+pytestmark = pytest.mark.django_db
+
+postgres_only = pytest.mark.skipif(connection.vendor != "postgresql", reason="needs PostgreSQL full-text search")
+
+
+@pytest.fixture
+def user(db):
+    return User.objects.create_user(username="staff", password="secret")
+
+
+@pytest.fixture
+def records(user):
+    BirdStatus.objects.create(id=1, description="In Behandlung")
+    blackbird = Bird.objects.create(name="Amsel", species="Turdus merula")
+    Bird.objects.create(name="Mauersegler", species="Apus apus")
+    FallenBird.objects.create(
+        bird=blackbird, bird_identifier="AM-0815", place="Jena, Saalbahnhof", date_found=date(2024, 5, 1)
+    )
+    Contact.objects.create(first_name="Erika", last_name="Mustermann", city="Jena", created_by=user)
+
+
+def sections_by_label(query, user):
+    return {section.label: section for section in search(query, user)}
+
+
+def test_finds_records_of_every_kind(records, user):
+    sections = sections_by_label("Jena", user)
+
+    assert [hit.title for hit in sections["Patienten"].hits] == ["AM-0815"]
+    assert [hit.title for hit in sections["Kontakte"].hits] == ["Erika Mustermann"]
+    assert "Vogelarten" not in sections
+
+
+def test_short_queries_are_not_searched(records, user):
+    assert search(" J ", user) == []
+
+
+def test_results_follow_the_tenant_scope(records):
+    organisation = Organisation.objects.create(name="Wildvogelhilfe Erfurt", slug="erfurt")
+    with scope(organisation):
+        FallenBird.objects.create(
+            bird=Bird.objects.get(name="Amsel"), bird_identifier="AM-4711", place="Jena", date_found=date(2024, 6, 1)
+        )
+    user = User.objects.create_user(username="member", password="secret")
+    Membership.objects.create(user=user, organisation=organisation)
+    client = Client()
+    client.force_login(user)
+
+    response = client.get(reverse("search"), {"q": "Jena"})
+
+    patients = next(section for section in response.context["sections"] if section.label == "Patienten")
+    assert [hit.title for hit in patients.hits] == ["AM-4711"]
+
+
+def test_private_notes_of_other_users_are_not_found(records, user):
+    other = User.objects.create_user(username="other", password="secret")
+    Notiz.objects.create(name="Jena privat", inhalt="Jena", erstellt_von=other)
+    Notiz.objects.create(name="Jena eigene", inhalt="Jena", erstellt_von=user)
+    page = Page.objects.create(identifier="patient_overview", name="Patienten")
+    Notiz.objects.create(name="Jena Übersicht", inhalt="Jena", erstellt_von=other, content_object=page)
+
+    hits = {hit.title: hit for hit in sections_by_label("Jena", user)["Notizen"].hits}
+
+    assert set(hits) == {"Jena eigene", "Jena Übersicht"}
+    assert hits["Jena Übersicht"].url == reverse("bird_all")
+    assert hits["Jena eigene"].url == reverse("notizen:detail", args=[Notiz.objects.get(name="Jena eigene").pk])
+
+
+def test_search_requires_login(records):
+    response = Client().get(reverse("search"), {"q": "Amsel"})
+
+    assert response.status_code == 302
+
+
+@postgres_only
+def test_ranks_full_text_matches(records, user):
+    FallenBird.objects.create(
+        bird=Bird.objects.get(name="Amsel"),
+        bird_identifier="AM-0816",
+        diagnostic_finding="Flügelbruch links, gefunden am Saalbahnhof",
+        date_found=date(2024, 5, 2),
+    )
+
+    hits = sections_by_label("Flügelbrüche", user)["Patienten"].hits
+
+    assert [hit.title for hit in hits] == ["AM-0816"]
+
+
+@postgres_only
+def test_falls_back_to_similar_spellings(records, user):
+    section = sections_by_label("Mauersegla", user)["Vogelarten"]
+
+    assert section.fuzzy
+    assert [hit.title for hit in section.hits] == ["Mauersegler"]
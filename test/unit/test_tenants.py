@@ -0,0 +1,150 @@
+"""Organisation scoping of patients and related records."""
+from datetime import date
+
+import pytest
+from django.contrib.auth.models import User
+from django.test import Client
+from django.urls import reverse
+
+from aviary.models import Aviary
+from bird.forms import BirdEditForm
+from bird.models import Bird, BirdStatus, FallenBird
+from core.cache import scoped_version, tenant_namespace
+from costs.forms import CostsForm
+from costs.models import Costs
+from tenants.models import Membership, Organisation
+from tenants.scope import ALL, organisation_for, scope
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def organisations(db):
+    return (
+        Organisation.objects.create(name="Wildvogelhilfe Jena", slug="jena"),
+        Organisation.objects.create(name="Wildvogelhilfe Erfurt", slug="erfurt"),
+    )
+
+
+@pytest.fixture
+def staff(db):
+    return User.objects.create_user(username="staff", password="secret")
+
+
+@pytest.fixture
+def patients(organisations):
+    BirdStatus.objects.create(id=1, description="In Behandlung")
+    bird = Bird.objects.create(name="Amsel")
+    created = []
+    for organisation in organisations:
+        with scope(organisation):
+            created.append(
+                FallenBird.objects.create(
+                    bird=bird, bird_identifier=f"AM-{organisation.slug}", date_found=date(2024, 5, 1)
+                )
+            )
+    return created
+
+
+def member_client(organisation, username="member"):
+    user = User.objects.create_user(username=username, password="secret")
+    Membership.objects.create(user=user, organisation=organisation)
+    client = Client()
+    client.force_login(user)
+    return client
+
+
+def test_records_belong_to_the_active_organisation(organisations, patients, staff):
+    jena, erfurt = organisations
+
+    assert patients[0].organisation == jena
+    with scope(erfurt):
+        assert list(FallenBird.objects.values_list("bird_identifier", flat=True)) == ["AM-erfurt"]
+        costs = Costs.objects.create(id_bird=patients[1], costs=5, user=staff)
+    assert costs.organisation == erfurt
+    assert FallenBird.objects.count() == 2  # unscoped outside of requests
+    with scope(None):
+        assert not FallenBird.objects.exists()
+
+
+def test_related_objects_are_not_scoped(organisations, patients, staff):
+    with scope(organisations[0]):
+        costs = Costs.objects.create(id_bird=patients[0], costs=5, user=staff)
+    with scope(organisations[1]):
+        assert Costs.objects.filter(pk=costs.pk).first() is None
+        assert costs.id_bird == patients[0]
+
+
+def test_requests_only_see_their_organisation(organisations, patients):
+    client = member_client(organisations[0])
+
+    response = client.get(reverse("bird_all"))
+
+    assert [bird.bird_identifier for bird in response.context["birds"]] == ["AM-jena"]
+
+
+def test_forms_only_offer_and_accept_own_records(organisations, patients):
+    jena, erfurt = organisations
+    aviaries = []
+    for organisation in organisations:
+        with scope(organisation):
+            aviaries.append(Aviary.objects.create(name=f"Voliere {organisation.slug}"))
+
+    with scope(jena):
+        edit_form = BirdEditForm(instance=patients[0])
+        costs_form = CostsForm(data={"id_bird": patients[1].pk, "costs": 5})
+
+        assert list(edit_form.fields["aviary"].queryset) == [aviaries[0]]
+        assert list(costs_form.fields["id_bird"].queryset) == [patients[0]]
+        assert not costs_form.is_valid()
+        assert "id_bird" in costs_form.errors
+
+
+def test_admin_counts_only_patients_of_the_organisation(organisations, patients):
+    admin = User.objects.create_superuser(username="admin", password="secret", email="admin@example.com")
+    Membership.objects.create(user=admin, organisation=organisations[0])
+    client = Client()
+    client.force_login(admin)
+
+    response = client.get(reverse("admin:bird_birdstatus_changelist"))
+
+    assert [status.patient_count for status in response.context["cl"].result_list] == [1]
+
+
+def test_streamed_exports_stay_scoped(organisations, patients):
+    client = member_client(organisations[1])
+
+    response = client.get(reverse("export_birds_all"))
+    content = b"".join(response.streaming_content).decode("utf-8-sig")
+
+    assert "AM-erfurt" in content
+    assert "AM-jena" not in content
+
+
+def test_scope_of_users(organisations):
+    admin = User.objects.create_superuser(username="admin", password="secret", email="admin@example.com")
+    member = User.objects.create_user(username="member", password="secret")
+    outsider = User.objects.create_user(username="outsider", password="secret")
+    Membership.objects.create(user=member, organisation=organisations[1])
+
+    assert organisation_for(admin) is ALL
+    assert organisation_for(member) == organisations[1].pk
+    assert organisation_for(outsider) is None
+
+
+def test_statistic_caches_are_invalidated_per_organisation(organisations, patients):
+    jena, erfurt = organisations
+    with scope(jena):
+        jena_namespace = tenant_namespace("statistic")
+    with scope(erfurt):
+        erfurt_namespace = tenant_namespace("statistic")
+    versions = scoped_version(jena_namespace), scoped_version(erfurt_namespace)
+
+    patients[0].place = "Jena-Ost"
+    patients[0].save()
+
+    assert scoped_version(jena_namespace) != versions[0]
+    assert scoped_version(erfurt_namespace) == versions[1]
+
+    Bird.objects.create(name="Star")  # shared data
+    assert scoped_version(erfurt_namespace) != versions[1]
@@ -0,0 +1,205 @@
+"""Webhook outbox and delivery worker."""
+import hashlib
+import hmac
+import json
+import threading
+import time
+from unittest import mock
+
+import pytest
+import requests
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import transaction
+
+from bird.models import Bird, BirdStatus, FallenBird
+from stations.models import WildbirdHelpStation
+from tenants.models import Organisation
+from tenants.scope import scope
+from webhooks import delivery
+from webhooks.models import (
+    PATIENT_CREATED,
+    PATIENT_STATUS_CHANGED,
+    STATION_PUBLISHED,
+    Delivery,
+    OutboxEvent,
+    WebhookEndpoint,
+)
+
+
+@pytest.fixture
+def patient(db):
+    user = User.objects.create_user(username="hook", password="secret")
+    BirdStatus.objects.create(id=1, description="In Behandlung")
+    BirdStatus.objects.create(id=2, description="Ausgewildert")
+    bird = Bird.objects.create(name="Amsel")
+    return lambda identifier="AM-1": FallenBird.objects.create(bird=bird, bird_identifier=identifier, user=user)
+
+
+@pytest.fixture
+def endpoint(db):
+    return WebhookEndpoint.objects.create(name="Register", url="https://hooks.example.com/fbf", batch_size=2)
+
+
+def response(status_code=200):
+    return mock.Mock(status_code=status_code)
+
+
+def test_no_event_without_subscribers(patient):
+    patient()
+
+    assert not OutboxEvent.objects.exists()
+
+
+def test_patient_events(endpoint, patient):
+    bird = patient()
+    bird.place = "Jena"
+    bird.save()  # no status change
+    bird.status_id = 2
+    bird.save()
+
+    created, changed = OutboxEvent.objects.order_by("id")
+    assert created.event_type == PATIENT_CREATED
+    assert created.payload["alias"] == "AM-1"
+    assert changed.event_type == PATIENT_STATUS_CHANGED
+    assert changed.payload["status"]["id"] == 2
+    assert changed.payload["previous_status"] == 1
+    assert Delivery.objects.filter(endpoint=endpoint, status=Delivery.PENDING).count() == 2
+
+
+def test_endpoints_only_receive_their_event_types(endpoint):
+    endpoint.events = [PATIENT_CREATED]
+    endpoint.save()
+
+    WildbirdHelpStation.objects.create(name="Station Jena", city="Jena")
+
+    assert not Delivery.objects.exists()
+
+
+def test_station_publication(endpoint):
+    station = WildbirdHelpStation.objects.create(name="Station Jena", city="Jena", approved_for_publication=False)
+    assert not OutboxEvent.objects.exists()
+
+    station.approved_for_publication = True
+    station.save()
+    station.save()
+
+    event = OutboxEvent.objects.get()
+    assert event.event_type == STATION_PUBLISHED
+    assert event.payload["name"] == "Station Jena"
+
+
+def test_patient_events_only_reach_their_organisation(endpoint, patient):
+    jena = Organisation.objects.create(name="Wildvogelhilfe Jena", slug="jena")
+    erfurt = Organisation.objects.create(name="Wildvogelhilfe Erfurt", slug="erfurt")
+    jena_endpoint = WebhookEndpoint.objects.create(name="Jena", url="https://jena.example.com/fbf", organisation=jena)
+    WebhookEndpoint.objects.create(name="Erfurt", url="https://erfurt.example.com/fbf", organisation=erfurt)
+
+    with scope(jena):
+        patient("AM-jena")
+    patient("AM-ohne")
+    WildbirdHelpStation.objects.create(name="Station Jena", city="Jena", approved_for_publication=True)
+
+    received = {
+        name: sorted(
+            Delivery.objects.filter(endpoint__name=name).values_list("event__event_type", flat=True)
+        )
+        for name in ("Register", "Jena", "Erfurt")
+    }
+    assert received == {
+        "Register": [PATIENT_CREATED, STATION_PUBLISHED],
+        "Jena": [PATIENT_CREATED, STATION_PUBLISHED],
+        "Erfurt": [STATION_PUBLISHED],
+    }
+    jena_event = Delivery.objects.get(endpoint=jena_endpoint, event__event_type=PATIENT_CREATED).event
+    assert jena_event.payload["alias"] == "AM-jena"
+
+
+def test_events_roll_back_with_the_save(endpoint, patient):
+    with pytest.raises(RuntimeError), transaction.atomic():
+        patient()
+        raise RuntimeError
+
+    assert not OutboxEvent.objects.exists()
+
+
+def test_batches_are_signed(endpoint, patient):
+    for number in range(3):
+        patient(f"AM-{number}")
+
+    with mock.patch("webhooks.delivery.requests.post", return_value=response()) as post:
+        result = delivery.deliver_pending()
+
+    assert result.delivered == 3
+    assert post.call_count == 2
+    sizes = sorted(len(json.loads(call.kwargs["data"])["events"]) for call in post.call_args_list)
+    assert sizes == [1, 2]
+    call = post.call_args_list[0]
+    headers = call.kwargs["headers"]
+    expected = hmac.new(
+        endpoint.secret.encode(), headers["X-FBF-Timestamp"].encode() + b"." + call.kwargs["data"], hashlib.sha256
+    ).hexdigest()
+    assert headers["X-FBF-Signature"] == f"sha256={expected}"
+    assert not Delivery.objects.exclude(status=Delivery.DELIVERED).exists()
+
+
+def test_failures_back_off_until_they_give_up(endpoint, patient, monkeypatch):
+    patient()
+    monkeypatch.setattr(delivery, "MAX_ATTEMPTS", 2)
+
+    with mock.patch("webhooks.delivery.requests.post", return_value=response(503)):
+        first = delivery.deliver_pending()
+        again = delivery.deliver_pending()  # not due yet
+        Delivery.objects.update(next_attempt=Delivery.objects.get().next_attempt.replace(year=2000))
+        last = delivery.deliver_pending()
+
+    assert (first.retried, again.total, last.failed) == (1, 0, 1)
+    entry = Delivery.objects.get()
+    assert entry.status == Delivery.FAILED
+    assert entry.attempts == 2
+    assert entry.last_error == "HTTP 503"
+
+
+def test_connection_errors_are_retried(endpoint, patient):
+    patient()
+
+    with mock.patch("webhooks.delivery.requests.post", side_effect=requests.ConnectionError("refused")):
+        result = delivery.deliver_pending()
+
+    assert result.retried == 1
+    assert Delivery.objects.get().last_error == "refused"
+
+
+def test_concurrency_is_limited_per_endpoint(endpoint, patient):
+    endpoint.batch_size = 1
+    endpoint.max_concurrency = 2
+    endpoint.save()
+    for number in range(6):
+        patient(f"AM-{number}")
+    lock = threading.Lock()
+    in_flight = peak = 0
+
+    def post(*args, **kwargs):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return response()
+
+    with mock.patch("webhooks.delivery.requests.post", side_effect=post):
+        result = delivery.deliver_pending(workers=8)
+
+    assert result.delivered == 6
+    assert peak <= 2
+
+
+def test_command_runs_once(endpoint, patient, capsys):
+    patient()
+
+    with mock.patch("webhooks.delivery.requests.post", return_value=response()):
+        call_command("deliver_webhooks", "--once")
+
+    assert "1 zugestellt" in capsys.readouterr().out